@@ -0,0 +1,32 @@
+"""add approval inbox indexes
+
+Revision ID: 0a8e3f6b1c92
+Revises: f1c5d8a2b730
+Create Date: 2026-10-18 15:12:03.540716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a8e3f6b1c92'
+down_revision: Union[str, None] = 'f1c5d8a2b730'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_approval_lines_pending_approver', 'approval_lines', ['approver_id', 'status'], unique=False,
+        postgresql_where=sa.text("status = '대기'"),
+        sqlite_where=sa.text("status = '대기'"),
+    )
+    op.create_index('ix_approval_lines_approval_order', 'approval_lines', ['approval_id', 'order'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_approval_lines_approval_order', table_name='approval_lines')
+    op.drop_index('ix_approval_lines_pending_approver', table_name='approval_lines')
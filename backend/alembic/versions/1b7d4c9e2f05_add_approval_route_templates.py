@@ -0,0 +1,43 @@
+"""add approval route templates and approval amount
+
+Revision ID: 1b7d4c9e2f05
+Revises: 0a8e3f6b1c92
+Create Date: 2026-10-18 16:20:41.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7d4c9e2f05'
+down_revision: Union[str, None] = '0a8e3f6b1c92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'approval_route_templates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('min_amount', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('steps', sa.JSON(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_approval_route_templates_id'), 'approval_route_templates', ['id'], unique=False)
+    op.create_index('ix_approval_route_templates_type_amount', 'approval_route_templates', ['type', 'min_amount'], unique=False)
+    op.add_column('approvals', sa.Column('amount', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('approvals') as batch_op:
+        batch_op.drop_column('amount')
+    op.drop_index('ix_approval_route_templates_type_amount', table_name='approval_route_templates')
+    op.drop_index(op.f('ix_approval_route_templates_id'), table_name='approval_route_templates')
+    op.drop_table('approval_route_templates')
@@ -0,0 +1,51 @@
+"""reservation overlap constraint and facility range index
+
+Revision ID: 3d5f9b2a7e48
+Revises: 2c4e8a1f6d37
+Create Date: 2026-10-18 17:48:30.215064
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d5f9b2a7e48'
+down_revision: Union[str, None] = '2c4e8a1f6d37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_reservations_facility_start', 'reservations', ['facility_id', 'start_time', 'end_time'], unique=False
+    )
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # 이미 겹쳐 있는 예약은 먼저 들어온 것만 남기고 취소 처리 (제약 생성이 실패하지 않도록)
+    op.execute("""
+        UPDATE reservations AS later SET status = '취소'
+        WHERE later.status <> '취소'
+          AND EXISTS (
+            SELECT 1 FROM reservations AS earlier
+            WHERE earlier.facility_id = later.facility_id
+              AND earlier.id < later.id
+              AND earlier.status <> '취소'
+              AND earlier.start_time < later.end_time
+              AND earlier.end_time > later.start_time
+          )
+    """)
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute("""
+        ALTER TABLE reservations ADD CONSTRAINT reservations_no_overlap
+        EXCLUDE USING gist (facility_id WITH =, tsrange(start_time, end_time) WITH &&)
+        WHERE (status <> '취소')
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE reservations DROP CONSTRAINT IF EXISTS reservations_no_overlap")
+    op.drop_index('ix_reservations_facility_start', table_name='reservations')
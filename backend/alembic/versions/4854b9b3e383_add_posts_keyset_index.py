@@ -0,0 +1,34 @@
+"""add posts keyset index
+
+Revision ID: 4854b9b3e383
+Revises: 33d2046fa5bf
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4854b9b3e383'
+down_revision: Union[str, None] = '33d2046fa5bf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 키셋 비교에서 NULL 이 빠지지 않도록 is_notice 를 NOT NULL 로 고정
+    op.execute("UPDATE posts SET is_notice = false WHERE is_notice IS NULL")
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.alter_column('is_notice', existing_type=sa.Boolean(), nullable=False)
+    op.create_index('ix_posts_board_notice_created_id', 'posts', ['board_id', 'is_notice', 'created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_comments_post_id'), 'comments', ['post_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_comments_post_id'), table_name='comments')
+    op.drop_index('ix_posts_board_notice_created_id', table_name='posts')
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.alter_column('is_notice', existing_type=sa.Boolean(), nullable=True)
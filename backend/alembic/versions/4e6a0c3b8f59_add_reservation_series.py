@@ -0,0 +1,32 @@
+"""add reservation repeat rule and series
+
+Revision ID: 4e6a0c3b8f59
+Revises: 3d5f9b2a7e48
+Create Date: 2026-10-18 18:32:07.640518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e6a0c3b8f59'
+down_revision: Union[str, None] = '3d5f9b2a7e48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # repeat_rule 은 모델에만 있고 초기 마이그레이션에서 빠져 있었다
+    op.add_column('reservations', sa.Column('repeat_rule', sa.String(length=255), nullable=True))
+    op.add_column('reservations', sa.Column('series_id', sa.String(length=32), nullable=True))
+    op.create_index('ix_reservations_series_start', 'reservations', ['series_id', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservations_series_start', table_name='reservations')
+    with op.batch_alter_table('reservations') as batch_op:
+        batch_op.drop_column('series_id')
+        batch_op.drop_column('repeat_rule')
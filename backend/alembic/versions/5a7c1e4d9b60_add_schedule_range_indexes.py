@@ -0,0 +1,35 @@
+"""add schedule range indexes
+
+Revision ID: 5a7c1e4d9b60
+Revises: 4e6a0c3b8f59
+Create Date: 2026-10-18 19:41:52.307184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a7c1e4d9b60'
+down_revision: Union[str, None] = '4e6a0c3b8f59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('schedules') as batch_op:
+        batch_op.alter_column('repeat_rule', existing_type=sa.String(length=50), type_=sa.String(length=255))
+        # shared_with 은 모델에만 있고 초기 마이그레이션에서 빠져 있었다
+        batch_op.add_column(sa.Column('shared_with', sa.String(length=255), nullable=True))
+    op.create_index('ix_schedules_owner_start', 'schedules', ['owner_id', 'start_time'], unique=False)
+    op.create_index('ix_schedules_type_start', 'schedules', ['type', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedules_type_start', table_name='schedules')
+    op.drop_index('ix_schedules_owner_start', table_name='schedules')
+    with op.batch_alter_table('schedules') as batch_op:
+        batch_op.drop_column('shared_with')
+        batch_op.alter_column('repeat_rule', existing_type=sa.String(length=255), type_=sa.String(length=50))
@@ -0,0 +1,124 @@
+"""add schedule shares
+
+Revision ID: 6b8d2f5a0c71
+Revises: 5a7c1e4d9b60
+Create Date: 2026-10-18 20:27:15.904236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b8d2f5a0c71'
+down_revision: Union[str, None] = '5a7c1e4d9b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+schedule_shares = sa.table(
+    'schedule_shares',
+    sa.column('schedule_id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+)
+
+
+def _joined(user_ids) -> str:
+    # shared_with(255자)에 들어가는 만큼만, 숫자 중간에서 자르지 않는다
+    joined = ",".join(user_ids)
+    return joined if len(joined) <= 255 else joined[:256].rsplit(",", 1)[0]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'schedule_shares',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('schedule_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('department_id', sa.Integer(), nullable=True),
+        sa.CheckConstraint('(user_id IS NULL) <> (department_id IS NULL)', name='ck_schedule_shares_target'),
+        sa.ForeignKeyConstraint(['schedule_id'], ['schedules.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_schedule_shares_user_schedule', 'schedule_shares', ['user_id', 'schedule_id'], unique=True)
+    op.create_index('ix_schedule_shares_department_schedule', 'schedule_shares', ['department_id', 'schedule_id'], unique=True)
+    op.create_index('ix_schedule_shares_schedule', 'schedule_shares', ['schedule_id'], unique=False)
+
+    # 쉼표로 구분된 shared_with 를 id 순으로 BATCH_SIZE 건씩 옮긴다
+    # (숫자가 아닌 값과 이미 없는 직원은 버린다)
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, shared_with FROM schedules "
+                "WHERE id > :last_id AND shared_with IS NOT NULL AND shared_with <> '' "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        pairs = {
+            (schedule_id, int(token))
+            for schedule_id, shared_with in rows
+            for token in shared_with.split(",")
+            if token.strip().isdigit()
+        }
+        if not pairs:
+            continue
+        existing = set(conn.execute(
+            sa.text("SELECT id FROM users WHERE id IN :ids").bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": sorted({user_id for _, user_id in pairs})},
+        ).scalars())
+        op.bulk_insert(schedule_shares, [
+            {"schedule_id": schedule_id, "user_id": user_id}
+            for schedule_id, user_id in sorted(pairs) if user_id in existing
+        ])
+
+    with op.batch_alter_table('schedules') as batch_op:
+        batch_op.drop_column('shared_with')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('schedules') as batch_op:
+        batch_op.add_column(sa.Column('shared_with', sa.String(length=255), nullable=True))
+
+    # 직원 공유만 되돌린다 (부서 공유는 shared_with 로 표현할 수 없다)
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        schedule_ids = conn.execute(
+            sa.text(
+                "SELECT DISTINCT schedule_id FROM schedule_shares "
+                "WHERE user_id IS NOT NULL AND schedule_id > :last_id ORDER BY schedule_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).scalars().all()
+        if not schedule_ids:
+            break
+        last_id = schedule_ids[-1]
+        shared = {}
+        for schedule_id, user_id in conn.execute(
+            sa.text(
+                "SELECT schedule_id, user_id FROM schedule_shares "
+                "WHERE user_id IS NOT NULL AND schedule_id IN :ids ORDER BY schedule_id, user_id"
+            ).bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": schedule_ids},
+        ):
+            shared.setdefault(schedule_id, []).append(str(user_id))
+        conn.execute(
+            sa.text("UPDATE schedules SET shared_with = :shared_with WHERE id = :id"),
+            [{"id": schedule_id, "shared_with": _joined(user_ids)} for schedule_id, user_ids in shared.items()],
+        )
+
+    op.drop_index('ix_schedule_shares_schedule', table_name='schedule_shares')
+    op.drop_index('ix_schedule_shares_department_schedule', table_name='schedule_shares')
+    op.drop_index('ix_schedule_shares_user_schedule', table_name='schedule_shares')
+    op.drop_table('schedule_shares')
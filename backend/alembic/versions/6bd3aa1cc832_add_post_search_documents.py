@@ -0,0 +1,91 @@
+"""add post search documents
+
+Revision ID: 6bd3aa1cc832
+Revises: 4854b9b3e383
+Create Date: 2026-10-18 11:02:17.284401
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import re
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6bd3aa1cc832'
+down_revision: Union[str, None] = '4854b9b3e383'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+# 색인 토큰화 규칙 (app.services.post_search.tokenize(unigrams=True) 와 같게 이 리비전에 고정)
+_WORD_RE = re.compile(r"[0-9a-z]+|[가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def _tokens(value) -> str:
+    tokens = []
+    for match in _WORD_RE.finditer((value or "").lower()):
+        word = match.group()
+        if _HANGUL_RE.match(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+            tokens.extend(word)
+        else:
+            tokens.append(word)
+    return " ".join(tokens)
+
+
+def upgrade() -> None:
+    # tsvector 색인은 PostgreSQL 전용 (SQLite 는 앱 내 역색인을 사용)
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    op.execute("""
+        CREATE TABLE post_search_documents (
+            post_id INTEGER PRIMARY KEY REFERENCES posts(id) ON DELETE CASCADE,
+            document TSVECTOR NOT NULL
+        )
+    """)
+    op.execute("CREATE INDEX ix_post_search_documents_document ON post_search_documents USING gin (document)")
+
+    # 기존 게시글을 한글 bigram 토큰으로 id 순 배치 색인
+    insert_document = sa.text(
+        "INSERT INTO post_search_documents (post_id, document) VALUES ("
+        ":post_id, setweight(to_tsvector('simple', :title), 'A')"
+        " || setweight(to_tsvector('simple', :content), 'B')"
+        " || setweight(to_tsvector('simple', :comments), 'C'))"
+    )
+    last_id = 0
+    while True:
+        posts = bind.execute(
+            sa.text("SELECT id, title, content FROM posts WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not posts:
+            break
+        comments = {}
+        for post_id, content in bind.execute(
+            sa.text("SELECT post_id, content FROM comments WHERE post_id IN :ids ORDER BY id")
+            .bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": [row.id for row in posts]},
+        ):
+            comments.setdefault(post_id, []).append(content)
+        bind.execute(insert_document, [
+            {
+                "post_id": row.id,
+                "title": _tokens(row.title),
+                "content": _tokens(row.content),
+                "comments": _tokens("\n".join(comments.get(row.id, []))),
+            }
+            for row in posts
+        ])
+        last_id = posts[-1].id
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    op.execute("DROP TABLE post_search_documents")
@@ -0,0 +1,48 @@
+"""add department closure
+
+Revision ID: a111b79ac1d7
+Revises: 6bd3aa1cc832
+Create Date: 2026-10-18 11:40:52.913370
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a111b79ac1d7'
+down_revision: Union[str, None] = '6bd3aa1cc832'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('department_closure',
+    sa.Column('ancestor_id', sa.Integer(), nullable=False),
+    sa.Column('descendant_id', sa.Integer(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ancestor_id'], ['departments.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['descendant_id'], ['departments.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index('ix_department_closure_descendant_depth', 'department_closure', ['descendant_id', 'depth'], unique=False)
+
+    # 기존 parent_id 로부터 closure 채우기 (자기 자신 depth=0 부터 재귀 CTE 한 번)
+    op.execute("""
+        WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM departments
+            UNION ALL
+            SELECT tree.ancestor_id, departments.id, tree.depth + 1
+            FROM tree JOIN departments ON departments.parent_id = tree.descendant_id
+            WHERE tree.depth < 64
+        )
+        INSERT INTO department_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_department_closure_descendant_depth', table_name='department_closure')
+    op.drop_table('department_closure')
@@ -0,0 +1,29 @@
+"""add users listing indexes
+
+Revision ID: b52e0c7d9f14
+Revises: a111b79ac1d7
+Create Date: 2026-10-18 12:20:41.507318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b52e0c7d9f14'
+down_revision: Union[str, None] = 'a111b79ac1d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_department_id_id', 'users', ['department_id', 'id'], unique=False)
+    # LIKE '홍%' 접두 검색이 로케일과 무관하게 인덱스를 타도록 text_pattern_ops 사용
+    op.create_index('ix_users_name_kr', 'users', ['name_kr'], unique=False, postgresql_ops={'name_kr': 'text_pattern_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_name_kr', table_name='users')
+    op.drop_index('ix_users_department_id_id', table_name='users')
@@ -0,0 +1,28 @@
+"""add attendance indexes
+
+Revision ID: c7a4e91b3d25
+Revises: b52e0c7d9f14
+Create Date: 2026-10-18 12:58:06.118392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a4e91b3d25'
+down_revision: Union[str, None] = 'b52e0c7d9f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_attendances_user_id_date', 'attendances', ['user_id', 'date'], unique=False)
+    op.create_index('ix_attendances_date_status', 'attendances', ['date', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attendances_date_status', table_name='attendances')
+    op.drop_index('ix_attendances_user_id_date', table_name='attendances')
@@ -0,0 +1,60 @@
+"""add attendance stats rollups
+
+Revision ID: d3f81a6c2e57
+Revises: c7a4e91b3d25
+Create Date: 2026-10-18 13:31:44.902175
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f81a6c2e57'
+down_revision: Union[str, None] = 'c7a4e91b3d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('attendance_daily_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('present', sa.Integer(), nullable=False),
+    sa.Column('late', sa.Integer(), nullable=False),
+    sa.Column('early_leave', sa.Integer(), nullable=False),
+    sa.Column('overtime_minutes', sa.Integer(), nullable=False),
+    sa.Column('worked_minutes', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'date')
+    )
+    op.create_index('ix_attendance_daily_stats_month_user', 'attendance_daily_stats', ['month', 'user_id'], unique=False)
+    op.create_index('ix_attendance_daily_stats_date_department', 'attendance_daily_stats', ['date', 'department_id'], unique=False)
+    op.create_table('attendance_monthly_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('days_present', sa.Integer(), nullable=False),
+    sa.Column('late_count', sa.Integer(), nullable=False),
+    sa.Column('early_leave_count', sa.Integer(), nullable=False),
+    sa.Column('overtime_minutes', sa.Integer(), nullable=False),
+    sa.Column('worked_minutes', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'month')
+    )
+    op.create_index('ix_attendance_monthly_stats_month_department', 'attendance_monthly_stats', ['month', 'department_id'], unique=False)
+    # 기존 근태 데이터의 롤업은 python -m app.db.backfill_attendance_stats 로 채운다
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attendance_monthly_stats_month_department', table_name='attendance_monthly_stats')
+    op.drop_table('attendance_monthly_stats')
+    op.drop_index('ix_attendance_daily_stats_date_department', table_name='attendance_daily_stats')
+    op.drop_index('ix_attendance_daily_stats_month_user', table_name='attendance_daily_stats')
+    op.drop_table('attendance_daily_stats')
@@ -0,0 +1,42 @@
+"""unique attendance user date
+
+Revision ID: e94b27d0c6a1
+Revises: d3f81a6c2e57
+Create Date: 2026-10-18 14:05:12.663208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e94b27d0c6a1'
+down_revision: Union[str, None] = 'd3f81a6c2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 출퇴근 upsert 를 위해 직원당 하루 한 행으로 정리:
+    # 같은 (user_id, date) 의 중복 행은 가장 먼저 만들어진 행에 출근(최초)/퇴근(최종) 시각을 합친 뒤 삭제
+    op.execute("""
+        UPDATE attendances SET
+            check_in = (SELECT MIN(a2.check_in) FROM attendances a2
+                        WHERE a2.user_id = attendances.user_id AND a2.date = attendances.date),
+            check_out = (SELECT MAX(a2.check_out) FROM attendances a2
+                         WHERE a2.user_id = attendances.user_id AND a2.date = attendances.date)
+        WHERE id IN (SELECT MIN(id) FROM attendances GROUP BY user_id, date HAVING COUNT(*) > 1)
+    """)
+    op.execute("""
+        DELETE FROM attendances
+        WHERE id NOT IN (SELECT MIN(id) FROM attendances GROUP BY user_id, date)
+    """)
+    op.drop_index('ix_attendances_user_id_date', table_name='attendances')
+    op.create_index('ix_attendances_user_id_date', 'attendances', ['user_id', 'date'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attendances_user_id_date', table_name='attendances')
+    op.create_index('ix_attendances_user_id_date', 'attendances', ['user_id', 'date'], unique=False)
@@ -0,0 +1,27 @@
+"""add attendance version
+
+Revision ID: f1c5d8a2b730
+Revises: e94b27d0c6a1
+Create Date: 2026-10-18 14:44:29.381920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c5d8a2b730'
+down_revision: Union[str, None] = 'e94b27d0c6a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('attendances', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('attendances') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,31 @@
+"""근태 통계 롤업 백필
+
+기간 내 attendance_daily_stats / attendance_monthly_stats 를 원본 근태에서 다시 만든다.
+
+    python -m app.db.backfill_attendance_stats --from 2026-01-01 --to 2026-06-30 --chunk-days 7
+"""
+from app.db.database import SessionLocal
+from app.services.attendance_stats import rebuild_rollups
+from datetime import date
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="근태 통계 롤업 백필")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, default=date.today(), help="종료일 (기본: 오늘)")
+    parser.add_argument("--chunk-days", type=int, default=7, help="한 번에 처리할 일 수")
+    args = parser.parse_args()
+    if args.date_from > args.date_to:
+        parser.error("--from 이 --to 보다 늦습니다.")
+
+    db = SessionLocal()
+    try:
+        total = rebuild_rollups(db, args.date_from, args.date_to, args.chunk_days, log=print)
+    finally:
+        db.close()
+    print(f"일별 롤업 {total}건을 다시 만들었습니다.")
+
+
+if __name__ == "__main__":
+    main()
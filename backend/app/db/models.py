@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, Date, DateTime, ForeignKey, Enum, Text, Index, JSON, DDL, CheckConstraint, event, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 import enum
@@ -52,6 +52,12 @@ class User(Base):
         foreign_keys="[Attendance.approver_id]"
     )
 
+    __table_args__ = (
+        # 직원 목록: 부서 필터 + id 키셋, 이름 접두 검색
+        Index("ix_users_department_id_id", "department_id", "id"),
+        Index("ix_users_name_kr", "name_kr", postgresql_ops={"name_kr": "text_pattern_ops"}),
+    )
+
 class Department(Base):
     __tablename__ = "departments"
 
@@ -64,6 +70,18 @@ class Department(Base):
     users = relationship("User", back_populates="department")
     parent = relationship("Department", remote_side=[id])
 
+class DepartmentClosure(Base):
+    """부서 계층 closure table (자기 자신 포함, depth=0)"""
+    __tablename__ = "department_closure"
+
+    ancestor_id = Column(Integer, ForeignKey("departments.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("departments.id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_department_closure_descendant_depth", "descendant_id", "depth"),
+    )
+
 class Position(Base):
     __tablename__ = "positions"
 
@@ -88,6 +106,7 @@ class Attendance(Base):
     approved_at = Column(DateTime)
     memo = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 낙관적 잠금용
 
     user = relationship(
         "User",
@@ -100,6 +119,47 @@ class Attendance(Base):
         foreign_keys="[Attendance.approver_id]"
     )
 
+    __table_args__ = (
+        # 직원별 기간 조회, 날짜+상태 조회용 (직원당 하루 한 행: 출퇴근 upsert 키)
+        Index("ix_attendances_user_id_date", "user_id", "date", unique=True),
+        Index("ix_attendances_date_status", "date", "status"),
+    )
+
+# 근태 통계 롤업 (원본 근태 변경 시 app.services.attendance_stats.refresh_rollups 로 갱신)
+class AttendanceDailyStat(Base):
+    __tablename__ = "attendance_daily_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    month = Column(Date, nullable=False)  # 해당 월 1일
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
+    present = Column(Integer, nullable=False, default=0)
+    late = Column(Integer, nullable=False, default=0)
+    early_leave = Column(Integer, nullable=False, default=0)
+    overtime_minutes = Column(Integer, nullable=False, default=0)
+    worked_minutes = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_attendance_daily_stats_month_user", "month", "user_id"),
+        Index("ix_attendance_daily_stats_date_department", "date", "department_id"),
+    )
+
+class AttendanceMonthlyStat(Base):
+    __tablename__ = "attendance_monthly_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(Date, primary_key=True)
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
+    days_present = Column(Integer, nullable=False, default=0)
+    late_count = Column(Integer, nullable=False, default=0)
+    early_leave_count = Column(Integer, nullable=False, default=0)
+    overtime_minutes = Column(Integer, nullable=False, default=0)
+    worked_minutes = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_attendance_monthly_stats_month_department", "month", "department_id"),
+    )
+
 class Approval(Base):
     __tablename__ = "approvals"
 
@@ -108,6 +168,7 @@ class Approval(Base):
     type = Column(String(50), nullable=False)  # 예: 휴가, 지출 등
     status = Column(String(20), nullable=False)  # 예: 진행중, 승인, 반려
     content = Column(Text, nullable=False)
+    amount = Column(BigInteger)  # 지출 등 금액 기준 결재 경로 선택용 (원)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="approvals")
@@ -127,6 +188,39 @@ class ApprovalLine(Base):
 
     approval = relationship("Approval", back_populates="approval_lines")
 
+    __table_args__ = (
+        # 결재함: 대기 중인 결재선만 담는 부분 인덱스
+        Index(
+            "ix_approval_lines_pending_approver", "approver_id", "status",
+            postgresql_where=text("status = '대기'"),
+            sqlite_where=text("status = '대기'"),
+        ),
+        # 같은 문서의 앞 순서 결재선 확인용
+        Index("ix_approval_lines_approval_order", "approval_id", "order"),
+    )
+
+class ApprovalRouteTemplate(Base):
+    """결재 경로 템플릿
+
+    steps 예: [{"position_level": 4}, {"position_level": 2}, {"position_level": 1}]
+    각 단계는 기안자 부서에서 상위 부서로 올라가며 해당 직급 레벨의 첫 직원으로 정해진다
+    (parallel 이 참이면 그 부서의 해당 직급 전원이 병렬 결재).
+    같은 type 에서 amount >= min_amount 인 템플릿 중 min_amount 가 가장 큰 것이 적용된다.
+    """
+    __tablename__ = "approval_route_templates"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    type = Column(String(50), nullable=False)
+    min_amount = Column(BigInteger, nullable=False, default=0)
+    steps = Column(JSON, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_approval_route_templates_type_amount", "type", "min_amount"),
+    )
+
 class Board(Base):
     __tablename__ = "boards"
 
@@ -145,19 +239,42 @@ class Post(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
-    is_notice = Column(Boolean, default=False)
+    is_notice = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # 게시판별 목록 키셋 페이지네이션용
+    __table_args__ = (
+        Index("ix_posts_board_notice_created_id", "board_id", "is_notice", "created_at", "id"),
+    )
+
     board = relationship("Board", back_populates="posts")
     comments = relationship("Comment", back_populates="post")
     user = relationship("User", back_populates="posts")
 
+# PostgreSQL: 게시글 검색 색인 (app.services.post_search 가 같은 트랜잭션에서 갱신)
+# (SQLite 등에서는 app.services.post_search 의 프로세스 내 역색인이 대신한다)
+event.listen(
+    Post.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE post_search_documents ("
+        "post_id INTEGER PRIMARY KEY REFERENCES posts(id) ON DELETE CASCADE, "
+        "document TSVECTOR NOT NULL);"
+        "CREATE INDEX ix_post_search_documents_document ON post_search_documents USING gin (document)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Post.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS post_search_documents").execute_if(dialect="postgresql"),
+)
+
 class Comment(Base):
     __tablename__ = "comments"
 
     id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
+    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -217,12 +334,35 @@ class Reservation(Base):
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
     status = Column(SqlEnum("예약", "승인", "취소", name="reservation_status"), default="예약")
-    repeat_rule = Column(String(50))
+    repeat_rule = Column(String(255))
+    # 같은 반복 예약으로 만들어진 예약 묶음 (단건 예약은 NULL)
+    series_id = Column(String(32))
     purpose = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     facility = relationship("Facility", back_populates="reservations")
 
+    __table_args__ = (
+        # 시설별 기간 조회 (충돌 확인/빈 시간 조회)
+        Index("ix_reservations_facility_start", "facility_id", "start_time", "end_time"),
+        # "이 예약 및 이후 예약" 취소/수정
+        Index("ix_reservations_series_start", "series_id", "start_time"),
+    )
+
+# PostgreSQL: 취소되지 않은 예약끼리 같은 시설에서 시간이 겹치지 않도록 DB 가 보장
+# (SQLite 등에서는 app.services.reservations 의 시설 잠금 + 구간 검사가 대신한다)
+RESERVATION_NO_OVERLAP = "reservations_no_overlap"
+event.listen(
+    Reservation.__table__,
+    "after_create",
+    DDL(
+        "CREATE EXTENSION IF NOT EXISTS btree_gist;"
+        f"ALTER TABLE reservations ADD CONSTRAINT {RESERVATION_NO_OVERLAP} "
+        "EXCLUDE USING gist (facility_id WITH =, tsrange(start_time, end_time) WITH &&) "
+        "WHERE (status <> '취소')"
+    ).execute_if(dialect="postgresql"),
+)
+
 class Schedule(Base):
     __tablename__ = "schedules"
 
@@ -233,11 +373,33 @@ class Schedule(Base):
     end_time = Column(DateTime, nullable=False)
     type = Column(SqlEnum("사내", "부서", "개인", name="schedule_type"), nullable=False)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    shared_with = Column(String(255))
     is_repeat = Column(Boolean, default=False)
-    repeat_rule = Column(String(50))
+    repeat_rule = Column(String(255))
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # 캘린더 기간 조회 (개인 일정 / 사내·부서 일정)
+        Index("ix_schedules_owner_start", "owner_id", "start_time"),
+        Index("ix_schedules_type_start", "type", "start_time"),
+    )
+
+# 일정 공유 대상 — 직원(user_id) 또는 부서(department_id, 하위 부서 포함) 중 하나
+class ScheduleShare(Base):
+    __tablename__ = "schedule_shares"
+
+    id = Column(Integer, primary_key=True)
+    schedule_id = Column(Integer, ForeignKey("schedules.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    department_id = Column(Integer, ForeignKey("departments.id", ondelete="CASCADE"))
+
+    __table_args__ = (
+        CheckConstraint("(user_id IS NULL) <> (department_id IS NULL)", name="ck_schedule_shares_target"),
+        # 나에게 / 내 부서에 공유된 일정
+        Index("ix_schedule_shares_user_schedule", "user_id", "schedule_id", unique=True),
+        Index("ix_schedule_shares_department_schedule", "department_id", "schedule_id", unique=True),
+        Index("ix_schedule_shares_schedule", "schedule_id"),
+    )
+
 class Notification(Base):
     __tablename__ = "notifications"
 
@@ -251,6 +413,35 @@ class Notification(Base):
 
     user = relationship("User", back_populates="notifications")
 
+class NotificationOutbox(Base):
+    """알림 발송 대기열 (채널별 한 행, 업무 변경과 같은 트랜잭션에서 기록)
+
+    status: pending → sent, 재시도 한도를 넘기면 failed
+    """
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    type = Column(String(50), nullable=False)
+    title = Column(String(200), nullable=False)
+    content = Column(Text, nullable=False)
+    channel = Column(String(20), nullable=False)  # inapp, email
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        # 디스패처: 발송할 차례인 pending 행만 담는 부분 인덱스
+        Index(
+            "ix_notification_outbox_pending", "next_attempt_at", "id",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
+
 class AttendanceCreate(BaseModel):
     date: datetime
     check_in: Optional[datetime] = None
@@ -0,0 +1,114 @@
+from collections import deque
+from datetime import datetime
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 이 시간(ms)보다 오래 열려 있던 세션을 느린 세션으로 기록
+DB_SLOW_SESSION_MS = float(os.getenv("DB_SLOW_SESSION_MS", "1000"))
+
+
+class PoolMetrics:
+    """엔진 하나에 대한 커넥션 대기시간 / 세션 점유시간 누적 통계"""
+
+    def __init__(self, name: str, slow_session_ms: float = DB_SLOW_SESSION_MS):
+        self.name = name
+        self.slow_session_ms = slow_session_ms
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.wait_count = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.sessions = 0
+            self.session_total_ms = 0.0
+            self.session_max_ms = 0.0
+            self.slow_sessions = 0
+            self.recent_slow_sessions = deque(maxlen=20)
+            self.since = datetime.utcnow()
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+
+    def record_session(self, held_ms: float) -> None:
+        with self._lock:
+            self.sessions += 1
+            self.session_total_ms += held_ms
+            self.session_max_ms = max(self.session_max_ms, held_ms)
+            if held_ms >= self.slow_session_ms:
+                self.slow_sessions += 1
+                self.recent_slow_sessions.append({
+                    "held_ms": round(held_ms, 1),
+                    "closed_at": datetime.utcnow().isoformat(),
+                })
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            return {
+                "pool": _pool_status(pool),
+                "connection_wait": {
+                    "count": self.wait_count,
+                    "avg_ms": round(self.wait_total_ms / self.wait_count, 2) if self.wait_count else 0.0,
+                    "max_ms": round(self.wait_max_ms, 2),
+                },
+                "sessions": {
+                    "count": self.sessions,
+                    "avg_held_ms": round(self.session_total_ms / self.sessions, 2) if self.sessions else 0.0,
+                    "max_held_ms": round(self.session_max_ms, 2),
+                    "slow_threshold_ms": self.slow_session_ms,
+                    "slow_count": self.slow_sessions,
+                    "recent_slow": list(self.recent_slow_sessions),
+                },
+                "since": self.since.isoformat(),
+            }
+
+
+def _pool_status(pool) -> dict:
+    status = {"class": type(pool).__name__}
+    # QueuePool 계열만 크기/오버플로 정보를 제공한다
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            status[name] = method()
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if max_overflow is not None:
+        status["max_overflow"] = max_overflow
+    return status
+
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def get_metrics(name: str) -> PoolMetrics:
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = PoolMetrics(name)
+        return _registry[name]
+
+
+class _TimedGetMixin:
+    # pool_logging_name 은 pool.recreate() 후에도 유지되므로 이를 메트릭 키로 쓴다
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            get_metrics(self._orig_logging_name or "default").record_wait((time.perf_counter() - started) * 1000)
+
+
+class InstrumentedQueuePool(_TimedGetMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedGetMixin, AsyncAdaptedQueuePool):
+    pass
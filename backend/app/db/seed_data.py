@@ -3,6 +3,7 @@ from app.db.models import Department, Position, User, Board
 from datetime import datetime
 import bcrypt
 from sqlalchemy import text
+from app.services.org import rebuild_closure
 
 def create_initial_data(db: Session):
     # 기존 데이터 삭제 (CASCADE)
@@ -20,6 +21,8 @@ def create_initial_data(db: Session):
     
     for dept in departments:
         db.add(dept)
+    db.flush()
+    rebuild_closure(db)  # 부서 계층 closure 생성
     db.commit()  # 부서 데이터 먼저 저장
     
     # 직급 데이터
@@ -3,6 +3,7 @@ from app.db.database import SessionLocal
 from datetime import datetime
 import bcrypt
 from sqlalchemy import or_
+from app.services.org import rebuild_closure
 
 db = SessionLocal()
 
@@ -11,6 +12,8 @@ dept = db.query(Department).filter(or_(Department.id == 1, Department.code == "A
 if not dept:
     dept = Department(id=1, code="ADMIN", name="경영지원팀", created_at=datetime.utcnow())
     db.add(dept)
+    db.flush()
+    rebuild_closure(db)
     db.commit()
 else:
     # 이미 있으면 dept 객체 재사용
@@ -1,11 +1,13 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.db.database import SessionLocal
-from app.db.models import User
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_db, get_async_db
+from app.db.models import User, Department, Position
+from app.services.principal_cache import Principal, PrincipalDepartment, PrincipalPosition, principal_cache
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 import os
 from dotenv import load_dotenv
 
@@ -29,16 +31,33 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-# 데이터베이스 세션 의존성
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def load_principal(db: AsyncSession, user_id: int) -> Optional[Principal]:
+    # 사용자/부서/직급을 한 번의 조인 쿼리로 읽어 스냅샷을 만든다
+    result = await db.execute(
+        select(
+            User.id, User.email, User.name_kr, User.name_en, User.is_active,
+            Department.id, Department.name,
+            Position.id, Position.name, Position.level,
+        )
+        .join(Department, User.department_id == Department.id)
+        .join(Position, User.position_id == Position.id)
+        .where(User.id == user_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return Principal(
+        id=row[0],
+        email=row[1],
+        name_kr=row[2],
+        name_en=row[3],
+        is_active=bool(row[4]),
+        department=PrincipalDepartment(id=row[5], name=row[6]),
+        position=PrincipalPosition(id=row[7], name=row[8], level=row[9]),
+    )
 
-# 현재 사용자 의존성
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def resolve_principal(token: str, db: AsyncSession) -> Tuple[Principal, int]:
+    """토큰을 검증하고 (Principal, 토큰 만료 시각) 을 돌려준다."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -46,22 +65,32 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     )
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+        user_id = int(payload.get("sub"))
+        exp = int(payload.get("exp"))
+    except (JWTError, TypeError, ValueError):
         raise credentials_exception
-    
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise credentials_exception
-    return user
 
-# 관리자 권한 확인 의존성
-async def get_current_admin(current_user: User = Depends(get_current_user)):
-    if current_user.position.name != "사장":
+    # 캐시 적중 시 DB 를 조회하지 않는다
+    principal = principal_cache.get(user_id, exp)
+    if principal is None:
+        principal = await load_principal(db, user_id)
+        if principal is None:
+            raise credentials_exception
+        principal_cache.put(exp, principal)
+    return principal, exp
+
+# 현재 사용자 의존성
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> Principal:
+    principal, _ = await resolve_principal(token, db)
+    return principal
+
+def is_admin(principal: Principal) -> bool:
+    return principal.position.name == "사장"
+
+async def get_current_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
+    if not is_admin(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 권한이 필요합니다."
         )
-    return current_user 
\ No newline at end of file
+    return current_user
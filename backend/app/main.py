@@ -1,8 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.routers import auth, users, departments, positions
 from app.routers import posts
 from app.routers import boards
+from app.routers import admin
+from app.routers import attendances
+from app.routers import approvals
+from app.routers import notifications
+from app.routers import reservations
+from app.routers import facilities
+from app.routers import schedules
+from app.services.passwords import PasswordPoolSaturated, password_pool
+from app.services.attendance_buffer import attendance_buffer
+from app.services.notification_dispatcher import NOTIFICATION_DISPATCHER, notification_dispatcher
+from app.services.notification_hub import notification_hub, pg_listener
 
 app = FastAPI(title="ADChemTo Intranet System")
 
@@ -17,6 +29,47 @@ app.add_middleware(
     max_age=3600,
 )
 
+@app.exception_handler(PasswordPoolSaturated)
+async def password_pool_saturated_handler(request: Request, exc: PasswordPoolSaturated):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "요청이 많아 잠시 후 다시 시도해주세요."},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.on_event("startup")
+async def start_notification_dispatcher():
+    # 별도 프로세스로 돌리는 경우 NOTIFICATION_DISPATCHER=0
+    if NOTIFICATION_DISPATCHER:
+        notification_dispatcher.start()
+
+@app.on_event("shutdown")
+async def stop_notification_dispatcher():
+    await notification_dispatcher.stop()
+
+notification_listener = pg_listener()
+
+@app.on_event("startup")
+async def start_notification_listener():
+    # 실시간 알림: PostgreSQL 은 LISTEN, 그 외에는 같은 프로세스의 허브로 직접 전달
+    notification_hub.bind_loop()
+    if notification_listener is not None:
+        notification_listener.start()
+
+@app.on_event("shutdown")
+async def stop_notification_listener():
+    if notification_listener is not None:
+        await notification_listener.stop()
+
+@app.on_event("shutdown")
+def shutdown_password_pool():
+    password_pool.shutdown()
+
+@app.on_event("shutdown")
+async def drain_attendance_buffer():
+    # 종료 전에 버퍼에 남은 출퇴근 기록을 커밋
+    await attendance_buffer.drain()
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -24,6 +77,13 @@ app.include_router(departments.router)
 app.include_router(positions.router)
 app.include_router(posts.router)
 app.include_router(boards.router)
+app.include_router(admin.router)
+app.include_router(attendances.router)
+app.include_router(approvals.router)
+app.include_router(notifications.router)
+app.include_router(reservations.router)
+app.include_router(facilities.router)
+app.include_router(schedules.router)
 
 @app.get("/")
 async def root():
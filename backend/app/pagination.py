@@ -0,0 +1,37 @@
+from fastapi import HTTPException, status
+from datetime import date, datetime
+import base64
+import json
+
+# 키셋(커서) 페이지네이션용 불투명 커서 인코딩/디코딩
+
+def encode_cursor(*values) -> str:
+    payload = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(token: str, *types) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("cursor length mismatch")
+        return tuple(_convert(value, type_) for value, type_ in zip(payload, types))
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다."
+        )
+
+def _convert(value, type_):
+    if value is None:
+        return None
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    if type_ is date:
+        return date.fromisoformat(value)
+    if type_ is bool:
+        if not isinstance(value, bool):
+            raise ValueError("invalid bool")
+        return value
+    return type_(value)
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends
+from app.db.database import pool_metrics_snapshot, reset_pool_metrics
+from app.dependencies import get_current_admin
+from app.db.models import User
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+# DB 커넥션 풀 사용 현황 (풀 크기 산정용)
+@router.get("/db-pool")
+async def get_db_pool_metrics(
+    reset: bool = False,
+    current_user: User = Depends(get_current_admin)
+):
+    snapshot = pool_metrics_snapshot()
+    if reset:
+        reset_pool_metrics()
+    return snapshot
@@ -1,35 +1,260 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.models import Approval, ApprovalLine, User
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session, aliased
+from typing import List, Optional
+from app.db.models import Approval, ApprovalLine, ApprovalRouteTemplate, User
 from app.dependencies import get_db, get_current_user, get_current_admin
-from datetime import datetime
+from app.pagination import decode_cursor, encode_cursor
+from app.schemas.approval import (
+    ApprovalCreate, ApprovalCreateResult, ApprovalDecision, ApprovalDecisionResult, ApprovalInboxCount,
+    ApprovalInboxItem, ApprovalInboxResponse, ApprovalLineCreate, ApprovalLinesCreate,
+    ApprovalRouteTemplateCreate, ApprovalRouteTemplateResponse
+)
+from app.services.approval_routes import UnresolvedRoute, approval_routes, insert_lines, route_for, route_lines
+from app.services.approval_workflow import (
+    APPROVED, REJECTED, ApprovalBusy, ApprovalWorkflowError, decide, workflow_notifications
+)
+from app.services.notifications import enqueue_notifications
 
 router = APIRouter(prefix="/approvals", tags=["approvals"])
 
-@router.post("/{approval_id}/lines")
-def add_approval_line(approval_id: int, approver_id: int, order: int, db: Session = Depends(get_db), current_admin=Depends(get_current_admin)):
-    line = ApprovalLine(
-        approval_id=approval_id,
-        approver_id=approver_id,
-        order=order,
-        status="대기"
+INBOX_SUMMARY_LENGTH = 100
+
+def _actionable_lines(approver_id: int) -> list:
+    """approver_id 가 지금 처리할 차례인 결재선 조건
+
+    본인 결재선이 대기 상태이고, 같은 문서의 앞 순서 결재선이 모두 승인된 경우
+    (앞 순서가 대기 중이거나 반려되었다면 아직/더 이상 차례가 아님)
+    문서가 반려로 종결되면 같은 단계의 병렬 결재선도 빠진다
+    """
+    earlier = aliased(ApprovalLine)
+    document = aliased(Approval)
+    return [
+        ApprovalLine.approver_id == approver_id,
+        ApprovalLine.status == "대기",
+        exists().where(document.id == ApprovalLine.approval_id, document.status == "진행중"),
+        ~exists().where(
+            earlier.approval_id == ApprovalLine.approval_id,
+            earlier.order < ApprovalLine.order,
+            earlier.status != "승인",
+        ),
+    ]
+
+# 결재함 — 내 차례인 결재선과 문서 요약/기안자를 한 번의 쿼리로 조회 (최근 요청순 커서 페이지네이션)
+@router.get("/inbox", response_model=ApprovalInboxResponse)
+def get_inbox(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = (
+        db.query(
+            ApprovalLine.id, ApprovalLine.approval_id, ApprovalLine.order, ApprovalLine.created_at,
+            Approval.type, Approval.status, func.substr(Approval.content, 1, INBOX_SUMMARY_LENGTH).label("summary"),
+            Approval.created_at.label("requested_at"), Approval.user_id, User.name_kr
+        )
+        .join(Approval, ApprovalLine.approval_id == Approval.id)
+        .join(User, Approval.user_id == User.id)
+        .filter(*_actionable_lines(current_user.id))
+    )
+    if cursor:
+        (line_id,) = decode_cursor(cursor, int)
+        query = query.filter(ApprovalLine.id < line_id)
+    rows = query.order_by(ApprovalLine.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
+    items = [
+        ApprovalInboxItem(
+            line_id=row.id,
+            approval_id=row.approval_id,
+            order=row.order,
+            type=row.type,
+            status=row.status,
+            summary=row.summary or "",
+            author_id=row.user_id,
+            author_name=row.name_kr,
+            requested_at=row.requested_at,
+            line_created_at=row.created_at,
+        )
+        for row in rows
+    ]
+    return ApprovalInboxResponse(items=items, next_cursor=next_cursor)
+
+# 결재함 건수 (메뉴 배지용) — 부분 인덱스만 읽는 COUNT
+@router.get("/inbox/count", response_model=ApprovalInboxCount)
+def get_inbox_count(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    count = db.scalar(select(func.count(ApprovalLine.id)).where(*_actionable_lines(current_user.id)))
+    return ApprovalInboxCount(count=count or 0)
+
+# 결재 경로 템플릿 관리 (관리자)
+@router.get("/templates", response_model=List[ApprovalRouteTemplateResponse])
+def get_route_templates(db: Session = Depends(get_db), current_admin=Depends(get_current_admin)):
+    return db.query(ApprovalRouteTemplate).order_by(ApprovalRouteTemplate.type, ApprovalRouteTemplate.min_amount).all()
+
+@router.post("/templates", response_model=ApprovalRouteTemplateResponse)
+def create_route_template(
+    template: ApprovalRouteTemplateCreate,
+    db: Session = Depends(get_db),
+    current_admin=Depends(get_current_admin)
+):
+    db_template = ApprovalRouteTemplate(**template.dict())
+    db.add(db_template)
+    db.commit()
+    db.refresh(db_template)
+    approval_routes.invalidate()
+    return db_template
+
+@router.put("/templates/{template_id}", response_model=ApprovalRouteTemplateResponse)
+def update_route_template(
+    template_id: int,
+    template: ApprovalRouteTemplateCreate,
+    db: Session = Depends(get_db),
+    current_admin=Depends(get_current_admin)
+):
+    db_template = db.query(ApprovalRouteTemplate).filter(ApprovalRouteTemplate.id == template_id).first()
+    if not db_template:
+        raise HTTPException(status_code=404, detail="결재 경로 템플릿을 찾을 수 없습니다.")
+    for field, value in template.dict().items():
+        setattr(db_template, field, value)
+    db.commit()
+    db.refresh(db_template)
+    approval_routes.invalidate()
+    return db_template
+
+@router.delete("/templates/{template_id}")
+def delete_route_template(template_id: int, db: Session = Depends(get_db), current_admin=Depends(get_current_admin)):
+    db_template = db.query(ApprovalRouteTemplate).filter(ApprovalRouteTemplate.id == template_id).first()
+    if not db_template:
+        raise HTTPException(status_code=404, detail="결재 경로 템플릿을 찾을 수 없습니다.")
+    db.delete(db_template)
+    db.commit()
+    approval_routes.invalidate()
+    return {"message": "결재 경로 템플릿이 삭제되었습니다."}
+
+def _check_approvers(db: Session, approver_ids: set) -> None:
+    found = set(db.scalars(select(User.id).where(User.id.in_(approver_ids), User.is_active.is_(True))))
+    missing = sorted(approver_ids - found)
+    if missing:
+        raise HTTPException(status_code=400, detail=f"존재하지 않는 결재자가 있습니다: {missing}")
+
+def _request_notifications(approver_ids) -> list:
+    return [
+        {"user_id": approver_id, "type": "결재", "title": "결재 요청", "content": "결재 요청이 도착했습니다."}
+        for approver_id in approver_ids
+    ]
+
+# 결재 상신 — 문서와 결재선을 한 트랜잭션, 결재선은 한 번의 INSERT
+@router.post("/", response_model=ApprovalCreateResult)
+def create_approval(
+    approval: ApprovalCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    if approval.lines:
+        lines = sorted({(line.approver_id, line.order) for line in approval.lines}, key=lambda line: (line[1], line[0]))
+        if any(approver_id == current_user.id for approver_id, _ in lines):
+            raise HTTPException(status_code=400, detail="기안자는 결재선에 포함될 수 없습니다.")
+        _check_approvers(db, {approver_id for approver_id, _ in lines})
+    else:
+        try:
+            route = route_for(db, current_user.id, current_user.department_id, approval.type, approval.amount)
+        except UnresolvedRoute as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        if not route:
+            raise HTTPException(status_code=400, detail="적용할 결재 경로가 없습니다.")
+        lines = route_lines(route)
+
+    db_approval = Approval(
+        user_id=current_user.id,
+        type=approval.type,
+        status="진행중",
+        content=approval.content,
+        amount=approval.amount
     )
-    db.add(line)
+    db.add(db_approval)
+    db.flush()
+    insert_lines(db, db_approval.id, lines)
+    first_order = lines[0][1]
+    enqueue_notifications(db, _request_notifications(approver_id for approver_id, order in lines if order == first_order))
     db.commit()
-    # 알림 예시 (실제 구현은 별도 함수로)
-    # send_notification(approver_id, "결재 요청이 도착했습니다.")
-    return {"message": "결재선이 추가되었습니다."}
-
-@router.put("/lines/{line_id}/approve")
-def approve_line(line_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    line = db.query(ApprovalLine).filter(ApprovalLine.id == line_id).first()
-    if not line:
-        raise HTTPException(status_code=404, detail="결재선을 찾을 수 없습니다.")
-    if line.approver_id != current_user.id:
-        raise HTTPException(status_code=403, detail="승인 권한이 없습니다.")
-    line.status = "승인"
-    line.decided_at = datetime.utcnow()
+
+    return ApprovalCreateResult(
+        id=db_approval.id,
+        status=db_approval.status,
+        lines=[ApprovalLineCreate(approver_id=approver_id, order=order) for approver_id, order in lines]
+    )
+
+# 결재선 일괄 추가 (관리자) — 여러 결재선을 한 번의 INSERT 로
+@router.post("/{approval_id}/lines")
+def add_approval_lines(
+    approval_id: int,
+    payload: ApprovalLinesCreate,
+    db: Session = Depends(get_db),
+    current_admin=Depends(get_current_admin)
+):
+    status = db.query(Approval.status).filter(Approval.id == approval_id).with_for_update().scalar()
+    if status is None:
+        raise HTTPException(status_code=404, detail="결재 문서를 찾을 수 없습니다.")
+    if status != "진행중":
+        raise HTTPException(status_code=409, detail="이미 종결된 결재입니다.")
+    lines = sorted({(line.approver_id, line.order) for line in payload.lines}, key=lambda line: (line[1], line[0]))
+    _check_approvers(db, {approver_id for approver_id, _ in lines})
+    insert_lines(db, approval_id, lines)
+    current_order = db.scalar(
+        select(func.min(ApprovalLine.order))
+        .where(ApprovalLine.approval_id == approval_id, ApprovalLine.status == "대기")
+    )
+    # 추가된 결재선 중 지금 차례인 결재자에게만 알림
+    enqueue_notifications(db, _request_notifications(approver_id for approver_id, order in lines if order == current_order))
     db.commit()
-    # 알림 예시 (실제 구현은 별도 함수로)
-    # send_notification(line.approval.user_id, "결재가 승인되었습니다.")
-    return {"message": "결재가 승인되었습니다."} 
\ No newline at end of file
+    return {"message": f"결재선 {len(lines)}건이 추가되었습니다."}
+
+def _decide(db: Session, line_id: int, actor_id: int, decision: str, comment: Optional[str]):
+    try:
+        result = decide(db, line_id, actor_id, decision, comment)
+        enqueue_notifications(db, workflow_notifications(result))
+        db.commit()
+    except ApprovalBusy as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail, headers={"Retry-After": str(exc.retry_after)})
+    except ApprovalWorkflowError as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail)
+    return result
+
+# 결재선 승인/반려 — 순서·병렬 단계 확인, 문서 상태 종결, 같은 요청 재시도는 변경 없이 현재 상태 반환
+@router.put("/lines/{line_id}/approve", response_model=ApprovalDecisionResult)
+def approve_line(
+    line_id: int,
+    decision: Optional[ApprovalDecision] = Body(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    result = _decide(db, line_id, current_user.id, APPROVED, decision.comment if decision else None)
+    return ApprovalDecisionResult(
+        message="결재가 승인되었습니다.",
+        approval_id=result.approval_id,
+        approval_status=result.approval_status,
+        line_status=result.line_status,
+        changed=result.changed,
+    )
+
+@router.put("/lines/{line_id}/reject", response_model=ApprovalDecisionResult)
+def reject_line(
+    line_id: int,
+    decision: Optional[ApprovalDecision] = Body(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    result = _decide(db, line_id, current_user.id, REJECTED, decision.comment if decision else None)
+    return ApprovalDecisionResult(
+        message="결재가 반려되었습니다.",
+        approval_id=result.approval_id,
+        approval_status=result.approval_status,
+        line_status=result.line_status,
+        changed=result.changed,
+    )
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.models import Asset, AssetHistory, User
 from app.dependencies import get_db, get_current_user, get_current_admin
+from app.services.notifications import enqueue_notification
 from datetime import datetime
 
 router = APIRouter(prefix="/assets", tags=["assets"])
@@ -16,9 +17,8 @@ def add_asset_history(asset_id: int, action: str, memo: str, db: Session = Depen
         memo=memo
     )
     db.add(history)
+    enqueue_notification(db, current_user.id, "자산", "자산 이력 추가", f"자산 {asset_id}에 {action} 이력이 추가되었습니다.")
     db.commit()
-    # 알림 예시 (실제 구현은 별도 함수로)
-    # send_notification(current_user.id, f"자산 {asset_id}에 {action} 이력이 추가되었습니다.")
     return {"message": "자산 이력이 추가되었습니다."}
 
 @router.get("/{asset_id}/history")
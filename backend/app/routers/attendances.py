@@ -1,34 +1,281 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
-from app.db.models import Attendance, User
-from app.dependencies import get_db, get_current_user, get_current_admin
-from datetime import datetime
+from typing import Literal, Optional
+from app.db.models import Attendance, AttendanceMonthlyStat, Department, User
+from app.dependencies import get_db, get_current_user, get_current_admin, is_admin
+from app.pagination import decode_cursor, encode_cursor
+from app.schemas.attendance import (
+    AttendanceListItem, AttendanceListResponse, AttendanceStatsResponse, AttendanceCheckResponse,
+    AttendanceApproveRequest, AttendanceApproveResponse, AttendanceUpdate, AttendanceUpdateResult,
+    AttendanceBatchUpdate, AttendanceBatchUpdateResponse,
+)
+from app.services import org
+from app.services.attendance_buffer import CHECK_IN, CHECK_OUT, attendance_buffer
+from app.services.attendance_approval import SKIP_NOT_FOUND, approval_notifications, approve_attendances
+from app.services.notifications import enqueue_notifications
+from app.services.attendance_edits import CONFLICT_NOT_FOUND, update_attendances
+from datetime import date, datetime, time, timedelta
 
 router = APIRouter(prefix="/attendances", tags=["attendances"])
 
+# 출근/퇴근 기록 — (직원, 날짜) 기준 upsert 라 재요청해도 같은 결과
+#  - 쓰기는 버퍼에 모아 일괄 커밋하며, 커밋이 끝난 뒤 응답한다
+@router.post("/check-in", response_model=AttendanceCheckResponse)
+async def check_in(current_user: User = Depends(get_current_user)):
+    return await attendance_buffer.submit(CHECK_IN, current_user.id, datetime.now())
+
+@router.post("/check-out", response_model=AttendanceCheckResponse)
+async def check_out(current_user: User = Depends(get_current_user)):
+    return await attendance_buffer.submit(CHECK_OUT, current_user.id, datetime.now())
+
+# 근태 일괄 승인 — id 목록 또는 조건(직원/부서/기간/상태)을 한 번의 UPDATE 로 처리
+@router.put("/approve", response_model=AttendanceApproveResponse)
+def approve_attendances_bulk(
+    request: AttendanceApproveRequest,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin)
+):
+    if not request.ids and not (request.date_from and request.date_to):
+        raise HTTPException(status_code=400, detail="승인할 근태 id 목록 또는 조회 기간을 지정해야 합니다.")
+    if request.date_from and request.date_to and request.date_from > request.date_to:
+        raise HTTPException(status_code=400, detail="조회 시작일이 종료일보다 늦습니다.")
+    approved, skipped = approve_attendances(
+        db,
+        current_admin.id,
+        ids=request.ids or None,
+        user_id=request.user_id,
+        department_id=request.department_id,
+        date_from=request.date_from,
+        date_to=request.date_to,
+        status=request.status,
+    )
+    # 알림은 직원별로 묶어 같은 트랜잭션에서 outbox 에 기록
+    enqueue_notifications(db, approval_notifications(approved))
+    db.commit()
+    return AttendanceApproveResponse(
+        approved=len(approved),
+        approved_ids=[row.id for row in approved],
+        skipped=[{"id": attendance_id, "reason": reason} for attendance_id, reason in skipped.items()],
+    )
+
 @router.put("/{attendance_id}/approve")
-def approve_attendance(attendance_id: int, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
-    attendance = db.query(Attendance).filter(Attendance.id == attendance_id).first()
-    if not attendance:
+def approve_attendance(
+    attendance_id: int,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin)
+):
+    approved, skipped = approve_attendances(db, current_admin.id, ids=[attendance_id])
+    if skipped.get(attendance_id) == SKIP_NOT_FOUND:
         raise HTTPException(status_code=404, detail="근태 기록을 찾을 수 없습니다.")
-    attendance.approved = True
-    attendance.approver_id = current_admin.id
-    attendance.approved_at = datetime.utcnow()
-    # 알림 예시 (실제 구현은 별도 함수로)
-    # send_notification(attendance.user_id, "근태가 승인되었습니다.")
+    enqueue_notifications(db, approval_notifications(approved))
     db.commit()
     return {"message": "근태가 승인되었습니다."}
 
-@router.put("/{attendance_id}")
-def update_attendance(attendance_id: int, update_data: dict, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
-    attendance = db.query(Attendance).filter(Attendance.id == attendance_id).first()
-    if not attendance:
-        raise HTTPException(status_code=404, detail="근태 기록을 찾을 수 없습니다.")
-    for key, value in update_data.items():
-        setattr(attendance, key, value)
+def _conflicts(conflicts) -> list:
+    return [
+        {"id": attendance_id, "reason": reason, "current_version": version}
+        for attendance_id, (reason, version) in conflicts.items()
+    ]
+
+# 근태 일괄 수정 (정정 자료 반영용) — 기본은 하나라도 충돌하면 전체 롤백
+@router.put("/batch", response_model=AttendanceBatchUpdateResponse)
+def update_attendances_batch(
+    request: AttendanceBatchUpdate,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin)
+):
+    ids = [item.id for item in request.items]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="같은 근태 기록이 중복되어 있습니다.")
+    updated, conflicts = update_attendances(db, [
+        (item.id, item.version, item.dict(exclude_unset=True, exclude={"id", "version"}))
+        for item in request.items
+    ])
+    if conflicts and not request.partial:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=_conflicts(conflicts))
+    db.commit()
+    return AttendanceBatchUpdateResponse(
+        updated=[dict(row._mapping) for row in updated],
+        conflicts=_conflicts(conflicts),
+    )
+
+@router.put("/{attendance_id}", response_model=AttendanceUpdateResult)
+def update_attendance(
+    attendance_id: int,
+    update_data: AttendanceUpdate,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin)
+):
+    fields = update_data.dict(exclude_unset=True, exclude={"version"})
+    updated, conflicts = update_attendances(db, [(attendance_id, update_data.version, fields)])
+    if conflicts:
+        reason, version = conflicts[attendance_id]
+        if reason == CONFLICT_NOT_FOUND:
+            raise HTTPException(status_code=404, detail=reason)
+        raise HTTPException(status_code=409, detail={"message": reason, "current_version": version})
     db.commit()
-    return {"message": "근태 기록이 수정되었습니다."}
+    return dict(updated[0]._mapping)
+
+# 근태 목록 (직원/부서(하위 포함)/기간/상태 필터, (date, id) 내림차순 커서 페이지네이션)
+#  - 관리자가 아니면 본인 기록만 조회할 수 있다
+@router.get("/", response_model=AttendanceListResponse)
+def get_attendances(
+    user_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    status: Optional[str] = None,
+    approved: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if not is_admin(current_user):
+        if (user_id is not None and user_id != current_user.id) or department_id is not None:
+            raise HTTPException(status_code=403, detail="본인의 근태 기록만 조회할 수 있습니다.")
+        user_id = current_user.id
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="조회 시작일이 종료일보다 늦습니다.")
+
+    query = (
+        db.query(
+            Attendance.id, Attendance.user_id, User.name_kr, User.department_id, Attendance.date,
+            Attendance.check_in, Attendance.check_out, Attendance.status, Attendance.approved,
+            Attendance.approver_id, Attendance.approved_at, Attendance.memo, Attendance.created_at,
+            Attendance.version
+        )
+        .join(User, Attendance.user_id == User.id)
+    )
+    if user_id is not None:
+        query = query.filter(Attendance.user_id == user_id)
+    if department_id is not None:
+        query = query.filter(User.department_id.in_(org.descendant_ids(department_id)))
+    if date_from:
+        query = query.filter(Attendance.date >= datetime.combine(date_from, time.min))
+    if date_to:
+        query = query.filter(Attendance.date < datetime.combine(date_to + timedelta(days=1), time.min))
+    if status:
+        query = query.filter(Attendance.status == status)
+    if approved is not None:
+        query = query.filter(Attendance.approved.is_(approved))
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor, datetime, int)
+        query = query.filter(tuple_(Attendance.date, Attendance.id) < tuple_(cursor_date, cursor_id))
+    rows = query.order_by(Attendance.date.desc(), Attendance.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].date, rows[-1].id)
+    items = [
+        AttendanceListItem(
+            id=row.id,
+            user_id=row.user_id,
+            user_name=row.name_kr,
+            department_id=row.department_id,
+            date=row.date,
+            check_in=row.check_in,
+            check_out=row.check_out,
+            status=row.status,
+            approved=bool(row.approved),
+            approver_id=row.approver_id,
+            approved_at=row.approved_at,
+            memo=row.memo,
+            created_at=row.created_at,
+            version=row.version,
+        )
+        for row in rows
+    ]
+    return AttendanceListResponse(items=items, next_cursor=next_cursor)
+
+def _parse_month(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="월은 YYYY-MM 형식이어야 합니다.")
+
+def _totals(row) -> dict:
+    return {
+        "days_present": row.days_present or 0,
+        "late_count": row.late_count or 0,
+        "early_leave_count": row.early_leave_count or 0,
+        "overtime_hours": round((row.overtime_minutes or 0) / 60, 1),
+        "worked_hours": round((row.worked_minutes or 0) / 60, 1),
+    }
+
+# 근태 통계 (월별 롤업 테이블만 조회) — 직원별 또는 부서별
+@router.get("/stats", response_model=AttendanceStatsResponse)
+def get_attendance_stats(
+    month_from: Optional[str] = None,
+    month_to: Optional[str] = None,
+    department_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    group_by: Literal["user", "department"] = "user",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if not is_admin(current_user):
+        if (user_id is not None and user_id != current_user.id) or department_id is not None or group_by != "user":
+            raise HTTPException(status_code=403, detail="본인의 근태 통계만 조회할 수 있습니다.")
+        user_id = current_user.id
+    start = _parse_month(month_from) if month_from else date.today().replace(day=1)
+    end = _parse_month(month_to) if month_to else start
+    if start > end:
+        raise HTTPException(status_code=400, detail="조회 시작 월이 종료 월보다 늦습니다.")
+
+    sums = [
+        func.sum(AttendanceMonthlyStat.days_present).label("days_present"),
+        func.sum(AttendanceMonthlyStat.late_count).label("late_count"),
+        func.sum(AttendanceMonthlyStat.early_leave_count).label("early_leave_count"),
+        func.sum(AttendanceMonthlyStat.overtime_minutes).label("overtime_minutes"),
+        func.sum(AttendanceMonthlyStat.worked_minutes).label("worked_minutes"),
+    ]
+
+    def scoped(query):
+        query = query.filter(AttendanceMonthlyStat.month >= start, AttendanceMonthlyStat.month <= end)
+        if user_id is not None:
+            query = query.filter(AttendanceMonthlyStat.user_id == user_id)
+        if department_id is not None:
+            query = query.filter(AttendanceMonthlyStat.department_id.in_(org.descendant_ids(department_id)))
+        return query
 
-@router.get("/")
-def get_attendances(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return db.query(Attendance).all() 
\ No newline at end of file
+    summary = scoped(db.query(*sums)).one()
+    monthly = (
+        scoped(db.query(AttendanceMonthlyStat.month, *sums))
+        .group_by(AttendanceMonthlyStat.month)
+        .order_by(AttendanceMonthlyStat.month)
+        .all()
+    )
+    if group_by == "user":
+        items = (
+            scoped(
+                db.query(User.id, User.name_kr.label("name"), *sums)
+                .select_from(AttendanceMonthlyStat)
+                .join(User, AttendanceMonthlyStat.user_id == User.id)
+            )
+            .group_by(User.id, User.name_kr)
+            .order_by(User.name_kr)
+            .all()
+        )
+    else:
+        items = (
+            scoped(
+                db.query(Department.id, Department.name.label("name"), *sums)
+                .select_from(AttendanceMonthlyStat)
+                .join(Department, AttendanceMonthlyStat.department_id == Department.id)
+            )
+            .group_by(Department.id, Department.name)
+            .order_by(Department.name)
+            .all()
+        )
+    return AttendanceStatsResponse(
+        month_from=start.strftime("%Y-%m"),
+        month_to=end.strftime("%Y-%m"),
+        group_by=group_by,
+        summary=_totals(summary),
+        monthly=[{"month": row.month.strftime("%Y-%m"), **_totals(row)} for row in monthly],
+        items=[{"id": row.id, "name": row.name, **_totals(row)} for row in items],
+    )
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.dependencies import get_db, create_access_token, get_current_user
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.dependencies import get_async_db, create_access_token, get_current_user
 from app.db.models import User
-import bcrypt
+from app.services.passwords import password_pool
 from datetime import timedelta
 from typing import Dict
 
@@ -12,13 +13,11 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.post("/token", response_model=Dict[str, str])
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not bcrypt.checkpw(
-        form_data.password.encode('utf-8'),
-        user.password.encode('utf-8')
-    ):
+    user = await db.scalar(select(User).where(User.email == form_data.username).limit(1))
+    # bcrypt 검증은 전용 스레드 풀에서 실행 (포화 시 503)
+    if not user or not await password_pool.verify_password(form_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
@@ -1,17 +1,10 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
-from app.db.database import SessionLocal
+from app.dependencies import get_db
 from app.db import models
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/boards/")
 def get_boards(db: Session = Depends(get_db)):
     boards = db.query(models.Board).all()
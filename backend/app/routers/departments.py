@@ -1,28 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.dependencies import get_db, get_current_admin
+from app.dependencies import get_async_db, get_current_admin, get_current_user
 from app.db.models import Department, User
-from app.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentResponse
+from app.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentResponse, DepartmentTreeNode
+from app.services.department_tree import department_tree
+from app.services import org
+from app.services.principal_cache import principal_cache
+from app.services.user_directory import user_counts
+from app.services.approval_routes import approval_routes
 
 router = APIRouter(prefix="/departments", tags=["departments"])
 
 @router.get("/", response_model=List[DepartmentResponse])
 async def get_departments(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    departments = db.query(Department).all()
+    departments = (await db.scalars(select(Department))).all()
     return departments
 
+# 조직도 (하위 부서 포함 인원수, 선택적으로 구성원 포함) — ETag 로 변경 시에만 재전송
+@router.get("/tree", response_model=List[DepartmentTreeNode])
+async def get_department_tree(
+    request: Request,
+    include_members: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    etag, body = await department_tree.get(db, include_members)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.post("/", response_model=DepartmentResponse)
 async def create_department(
     department: DepartmentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
     # 부서 코드 중복 확인
-    db_dept = db.query(Department).filter(Department.code == department.code).first()
+    db_dept = await db.scalar(select(Department).where(Department.code == department.code).limit(1))
     if db_dept:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -31,26 +51,31 @@ async def create_department(
     
     # 상위 부서 존재 확인
     if department.parent_id:
-        parent_dept = db.query(Department).filter(Department.id == department.parent_id).first()
+        parent_dept = await db.scalar(select(Department).where(Department.id == department.parent_id).limit(1))
         if not parent_dept:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="존재하지 않는 상위 부서입니다."
             )
     
+    await org.lock_hierarchy(db)
     db_dept = Department(**department.dict())
     db.add(db_dept)
-    db.commit()
-    db.refresh(db_dept)
+    await db.flush()
+    await org.add_department(db, db_dept.id, db_dept.parent_id)
+    await db.commit()
+    await db.refresh(db_dept)
+    department_tree.upsert_department(db_dept)
+    approval_routes.invalidate()
     return db_dept
 
 @router.get("/{department_id}", response_model=DepartmentResponse)
 async def get_department(
     department_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_dept = db.query(Department).filter(Department.id == department_id).first()
+    db_dept = await db.scalar(select(Department).where(Department.id == department_id).limit(1))
     if db_dept is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -62,10 +87,10 @@ async def get_department(
 async def update_department(
     department_id: int,
     department: DepartmentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_dept = db.query(Department).filter(Department.id == department_id).first()
+    db_dept = await db.scalar(select(Department).where(Department.id == department_id).limit(1))
     if db_dept is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,10 +99,10 @@ async def update_department(
     
     # 부서 코드 중복 확인
     if department.code:
-        existing_dept = db.query(Department).filter(
+        existing_dept = await db.scalar(select(Department).where(
             Department.code == department.code,
             Department.id != department_id
-        ).first()
+        ).limit(1))
         if existing_dept:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -86,27 +111,44 @@ async def update_department(
     
     # 상위 부서 존재 확인
     if department.parent_id:
-        parent_dept = db.query(Department).filter(Department.id == department.parent_id).first()
+        parent_dept = await db.scalar(select(Department).where(Department.id == department.parent_id).limit(1))
         if not parent_dept:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="존재하지 않는 상위 부서입니다."
             )
     
-    for field, value in department.dict(exclude_unset=True).items():
+    fields = department.dict(exclude_unset=True)
+    
+    # 상위 부서 변경 시 순환 확인 후 closure 이동
+    if "parent_id" in fields and fields["parent_id"] != db_dept.parent_id:
+        await org.lock_hierarchy(db)
+        if fields["parent_id"] is not None and await org.is_under(db, fields["parent_id"], department_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="자기 자신 또는 하위 부서를 상위 부서로 지정할 수 없습니다."
+            )
+        await org.move_department(db, department_id, fields["parent_id"])
+    
+    for field, value in fields.items():
         setattr(db_dept, field, value)
     
-    db.commit()
-    db.refresh(db_dept)
+    await db.commit()
+    await db.refresh(db_dept)
+    principal_cache.invalidate_department(department_id)
+    department_tree.upsert_department(db_dept)
+    approval_routes.invalidate()
+    # 상위 부서가 바뀌면 하위 부서 포함 인원수도 달라진다
+    user_counts.invalidate()
     return db_dept
 
 @router.delete("/{department_id}")
 async def delete_department(
     department_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_dept = db.query(Department).filter(Department.id == department_id).first()
+    db_dept = await db.scalar(select(Department).where(Department.id == department_id).limit(1))
     if db_dept is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -114,7 +156,7 @@ async def delete_department(
         )
     
     # 하위 부서가 있는지 확인
-    child_depts = db.query(Department).filter(Department.parent_id == department_id).all()
+    child_depts = await db.scalar(select(Department.id).where(Department.parent_id == department_id).limit(1))
     if child_depts:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -122,13 +164,17 @@ async def delete_department(
         )
     
     # 부서에 소속된 직원이 있는지 확인
-    users = db.query(User).filter(User.department_id == department_id).all()
+    users = await db.scalar(select(User.id).where(User.department_id == department_id).limit(1))
     if users:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="직원이 소속된 부서는 삭제할 수 없습니다."
         )
     
-    db.delete(db_dept)
-    db.commit()
+    await org.lock_hierarchy(db)
+    await org.remove_department(db, department_id)
+    await db.delete(db_dept)
+    await db.commit()
+    department_tree.remove_department(department_id)
+    approval_routes.invalidate()
     return {"message": "부서가 성공적으로 삭제되었습니다."} 
\ No newline at end of file
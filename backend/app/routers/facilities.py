@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.db.models import Facility
+from app.dependencies import get_db, get_current_user
+from app.schemas.facility import FacilityAvailabilityGrid, FacilityResponse
+from app.services.facility_availability import encode_day, facility_availability
+from datetime import date, timedelta
+
+router = APIRouter(prefix="/facilities", tags=["facilities"])
+
+FACILITY_GRID_MAX_DAYS = 62
+
+@router.get("/", response_model=List[FacilityResponse])
+def get_facilities(db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    return db.query(Facility).order_by(Facility.id).all()
+
+# 예약 캘린더용 시설별 점유 격자 — from~to (둘 다 포함) 를 slot 분 단위로
+# (시설, 날짜) 캐시가 없을 때만 reservations 범위 조회 한 번
+@router.get("/availability", response_model=FacilityAvailabilityGrid)
+def get_availability_grid(
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    slot: int = Query(30, description="슬롯 크기 (분)"),
+    facility_id: Optional[List[int]] = Query(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    if end < start:
+        raise HTTPException(status_code=400, detail="to 는 from 이후 날짜여야 합니다.")
+    if (end - start).days >= FACILITY_GRID_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {FACILITY_GRID_MAX_DAYS}일입니다.")
+    if not 5 <= slot <= 60 or 1440 % slot:
+        raise HTTPException(status_code=400, detail="slot 은 1440 의 약수인 5~60 분이어야 합니다. (예: 15, 30)")
+
+    query = db.query(Facility.id, Facility.name).order_by(Facility.id)
+    if facility_id:
+        query = query.filter(Facility.id.in_(facility_id))
+    facilities = query.all()
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    occupancy = facility_availability.get(db, [facility.id for facility in facilities], days) if facilities else {}
+
+    step = timedelta(minutes=slot)
+    return FacilityAvailabilityGrid(
+        start=start,
+        end=end,
+        slot_minutes=slot,
+        facilities=[
+            {
+                "facility_id": facility.id,
+                "name": facility.name,
+                "days": [
+                    {"date": day, "runs": encode_day(day, occupancy[(facility.id, day)], step)}
+                    for day in days
+                ],
+            }
+            for facility in facilities
+        ],
+    )
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.db.database import AsyncSessionLocal
+from app.dependencies import resolve_principal
+from app.services.notification_hub import notification_hub
+import asyncio
+import json
+import os
+import time
+
+router = APIRouter(prefix="/notifications", tags=["notifications"])
+
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = float(os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", "25"))
+# 끊긴 뒤 EventSource 재연결 대기 (ms)
+NOTIFICATION_STREAM_RETRY_MS = 5000
+
+def _sse(event: str, data: dict, id: Optional[int] = None) -> str:
+    head = f"id: {id}\n" if id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+# 실시간 알림 스트림 (Server-Sent Events)
+#  - EventSource 는 헤더를 못 붙이므로 Authorization 헤더 또는 ?token= 으로 인증
+#  - 연결 동안 DB 세션을 잡지 않는다 (인증은 principal 캐시, 알림은 허브에서 push)
+#  - 주기적으로 주석 행(: ping)을 보내 프록시 유휴 타임아웃을 막는다
+#  - 토큰이 만료되면 expired 이벤트 후 종료, 느린 구독자는 resync 이벤트 후 종료
+@router.get("/stream")
+async def stream_notifications(request: Request, token: Optional[str] = Query(None)):
+    authorization = request.headers.get("Authorization", "")
+    if authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    async with AsyncSessionLocal() as db:
+        principal, exp = await resolve_principal(token, db)
+
+    subscription = notification_hub.subscribe(principal.id)
+
+    async def events():
+        try:
+            yield f"retry: {NOTIFICATION_STREAM_RETRY_MS}\n\n"
+            while True:
+                if subscription.overflowed:
+                    yield _sse("resync", {})
+                    return
+                remaining = exp - time.time()
+                if remaining <= 0:
+                    yield _sse("expired", {})
+                    return
+                try:
+                    item = await asyncio.wait_for(
+                        subscription.queue.get(), min(NOTIFICATION_STREAM_HEARTBEAT_SECONDS, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield _sse("notification", item, id=item["id"])
+        finally:
+            notification_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
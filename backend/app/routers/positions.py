@@ -1,28 +1,33 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.dependencies import get_db, get_current_admin
+from app.dependencies import get_async_db, get_current_admin
 from app.db.models import Position, User
 from app.schemas.position import PositionCreate, PositionUpdate, PositionResponse
+from app.services.principal_cache import principal_cache
+from app.services.department_tree import department_tree
+from app.services.user_directory import user_counts
+from app.services.approval_routes import approval_routes
 
 router = APIRouter(prefix="/positions", tags=["positions"])
 
 @router.get("/", response_model=List[PositionResponse])
 async def get_positions(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    positions = db.query(Position).all()
+    positions = (await db.scalars(select(Position))).all()
     return positions
 
 @router.post("/", response_model=PositionResponse)
 async def create_position(
     position: PositionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
     # 직급 이름 중복 확인
-    db_pos = db.query(Position).filter(Position.name == position.name).first()
+    db_pos = await db.scalar(select(Position).where(Position.name == position.name).limit(1))
     if db_pos:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -30,7 +35,7 @@ async def create_position(
         )
     
     # 직급 레벨 중복 확인
-    db_pos = db.query(Position).filter(Position.level == position.level).first()
+    db_pos = await db.scalar(select(Position).where(Position.level == position.level).limit(1))
     if db_pos:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -39,17 +44,17 @@ async def create_position(
     
     db_pos = Position(**position.dict())
     db.add(db_pos)
-    db.commit()
-    db.refresh(db_pos)
+    await db.commit()
+    await db.refresh(db_pos)
     return db_pos
 
 @router.get("/{position_id}", response_model=PositionResponse)
 async def get_position(
     position_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_pos = db.query(Position).filter(Position.id == position_id).first()
+    db_pos = await db.scalar(select(Position).where(Position.id == position_id).limit(1))
     if db_pos is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -61,10 +66,10 @@ async def get_position(
 async def update_position(
     position_id: int,
     position: PositionUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_pos = db.query(Position).filter(Position.id == position_id).first()
+    db_pos = await db.scalar(select(Position).where(Position.id == position_id).limit(1))
     if db_pos is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,10 +78,10 @@ async def update_position(
     
     # 직급 이름 중복 확인
     if position.name:
-        existing_pos = db.query(Position).filter(
+        existing_pos = await db.scalar(select(Position).where(
             Position.name == position.name,
             Position.id != position_id
-        ).first()
+        ).limit(1))
         if existing_pos:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -85,10 +90,10 @@ async def update_position(
     
     # 직급 레벨 중복 확인
     if position.level:
-        existing_pos = db.query(Position).filter(
+        existing_pos = await db.scalar(select(Position).where(
             Position.level == position.level,
             Position.id != position_id
-        ).first()
+        ).limit(1))
         if existing_pos:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -98,17 +103,21 @@ async def update_position(
     for field, value in position.dict(exclude_unset=True).items():
         setattr(db_pos, field, value)
     
-    db.commit()
-    db.refresh(db_pos)
+    await db.commit()
+    await db.refresh(db_pos)
+    principal_cache.invalidate_position(position_id)
+    department_tree.invalidate()
+    user_counts.invalidate()
+    approval_routes.invalidate()
     return db_pos
 
 @router.delete("/{position_id}")
 async def delete_position(
     position_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_pos = db.query(Position).filter(Position.id == position_id).first()
+    db_pos = await db.scalar(select(Position).where(Position.id == position_id).limit(1))
     if db_pos is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -116,13 +125,14 @@ async def delete_position(
         )
     
     # 해당 직급을 가진 직원이 있는지 확인
-    users = db.query(User).filter(User.position_id == position_id).all()
+    users = await db.scalar(select(User.id).where(User.position_id == position_id).limit(1))
     if users:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="해당 직급을 가진 직원이 존재합니다."
         )
     
-    db.delete(db_pos)
-    db.commit()
+    await db.delete(db_pos)
+    await db.commit()
+    principal_cache.invalidate_position(position_id)
     return {"message": "직급이 성공적으로 삭제되었습니다."} 
\ No newline at end of file
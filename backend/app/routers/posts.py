@@ -1,32 +1,80 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload
-from typing import List
+from typing import Optional
 from app.dependencies import get_db, get_current_user, get_current_admin
-from app.db.models import Post, Board, User
-from app.schemas.post import PostCreate, PostUpdate, PostResponse
+from app.db.models import Post, Board, User, Comment
+from app.pagination import decode_cursor, encode_cursor
+from app.schemas.post import PostCreate, PostUpdate, PostResponse, PostSummary, PostListResponse, PostSearchResponse
+from app.services import post_search
 from datetime import datetime
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
-# 게시글 목록 조회 (공지사항 상단 고정)
-@router.get("/", response_model=List[PostResponse])
-def get_posts(board_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    posts = db.query(Post).options(joinedload(Post.user)).filter(Post.board_id == board_id).order_by(Post.is_notice.desc(), Post.created_at.desc()).all()
-    result = []
-    for post in posts:
-        result.append(PostResponse(
-            id=post.id,
-            board_id=post.board_id,
-            user_id=post.user_id,
-            title=post.title,
-            content=post.content,
-            is_notice=post.is_notice,
-            created_at=post.created_at,
-            updated_at=post.updated_at,
-            author_name=post.user.name_kr if post.user else ""
-        ))
-    return result
+# 게시글 목록 조회 (공지사항 상단 고정, 커서 페이지네이션)
+@router.get("/", response_model=PostListResponse)
+def get_posts(
+    board_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    comment_count = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+    query = (
+        db.query(
+            Post.id, Post.board_id, Post.user_id, Post.title, Post.is_notice,
+            Post.created_at, Post.updated_at, User.name_kr, comment_count.label("comment_count")
+        )
+        .outerjoin(User, Post.user_id == User.id)
+        .filter(Post.board_id == board_id)
+    )
+    # (is_notice, created_at, id) 내림차순 키셋 — posts(board_id, is_notice, created_at, id) 인덱스 사용
+    if cursor:
+        is_notice, created_at, post_id = decode_cursor(cursor, bool, datetime, int)
+        query = query.filter(
+            tuple_(Post.is_notice, Post.created_at, Post.id) < tuple_(is_notice, created_at, post_id)
+        )
+    rows = query.order_by(Post.is_notice.desc(), Post.created_at.desc(), Post.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.is_notice, last.created_at, last.id)
+    items = [
+        PostSummary(
+            id=row.id,
+            board_id=row.board_id,
+            user_id=row.user_id,
+            title=row.title,
+            is_notice=row.is_notice,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            author_name=row.name_kr or "",
+            comment_count=row.comment_count,
+        )
+        for row in rows
+    ]
+    return PostListResponse(items=items, next_cursor=next_cursor)
+
+# 게시글/댓글 검색 (제목·본문·댓글, 관련도순)
+@router.get("/search", response_model=PostSearchResponse)
+def search_posts(
+    q: str = Query(..., min_length=1, max_length=100),
+    board_id: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    total, items = post_search.search_posts(db, q, board_id, skip, limit)
+    return PostSearchResponse(total=total, items=items)
 
 # 게시글 상세 조회
 @router.get("/{post_id}", response_model=PostResponse)
@@ -62,6 +110,8 @@ def create_post(post: PostCreate, db: Session = Depends(get_db), current_user: U
         updated_at=datetime.utcnow(),
     )
     db.add(db_post)
+    db.flush()
+    post_search.index_post(db, db_post.id)
     db.commit()
     db.refresh(db_post)
     return PostResponse(
@@ -91,6 +141,8 @@ def update_post(post_id: int, post: PostUpdate, db: Session = Depends(get_db), c
     for field, value in post.dict(exclude_unset=True).items():
         setattr(db_post, field, value)
     db_post.updated_at = datetime.utcnow()
+    db.flush()
+    post_search.index_post(db, db_post.id)
     db.commit()
     db.refresh(db_post)
     return PostResponse(
@@ -117,6 +169,7 @@ def delete_post(post_id: int, db: Session = Depends(get_db), current_user: User
     # 본인 글 또는 관리자만 삭제 가능
     if db_post.user_id != current_user.id and not current_user.position.level == 1:
         raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
+    post_search.remove_post(db, post_id)
     db.delete(db_post)
     db.commit()
     return {"message": "게시글이 성공적으로 삭제되었습니다."} 
\ No newline at end of file
@@ -1,63 +1,206 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.db.models import Reservation, User
-from app.dependencies import get_db, get_current_user, get_current_admin
-from datetime import datetime, timedelta
+from typing import List, Literal
+from uuid import uuid4
+from app.db.models import RESERVATION_NO_OVERLAP, Reservation, User
+from app.dependencies import get_db, get_current_user, get_current_admin, is_admin
+from app.schemas.reservation import FacilityAvailability, ReservationCreate, ReservationResponse, ReservationUpdate
+from app.services.facility_availability import facility_availability
+from app.services.notifications import enqueue_notification
+from app.services.recurrence import RecurrenceError, RecurrenceRule, expand
+from app.services.reservations import (
+    CANCELLED, THIS, active_reservations, find_conflicts, free_intervals, insert_reservations, lock_facility,
+    merge_intervals, scope_condition, self_overlaps, shifted
+)
+from datetime import date, datetime, time, timedelta
+import os
 
 router = APIRouter(prefix="/reservations", tags=["reservations"])
 
-@router.post("/")
-def create_reservation(reservation_in, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    reservations = []
-    if getattr(reservation_in, 'repeat_rule', None):
-        for i in range(4):
-            start = reservation_in.start_time + timedelta(weeks=i)
-            end = reservation_in.end_time + timedelta(weeks=i)
-            reservation = Reservation(
-                facility_id=reservation_in.facility_id,
-                user_id=current_user.id,
-                start_time=start,
-                end_time=end,
-                purpose=reservation_in.purpose,
-                status="예약",
-                repeat_rule=reservation_in.repeat_rule
-            )
-            db.add(reservation)
-            reservations.append(reservation)
+RESERVATION_SERIES_MAX = int(os.getenv("RESERVATION_SERIES_MAX", "366"))
+# "weekly" 처럼 주기만 보낸 약식 반복 (예약 화면) 은 예전과 같이 4회
+RESERVATION_SHORTHAND_COUNT = 4
+
+def _conflict_error(conflicts) -> HTTPException:
+    return HTTPException(status_code=409, detail={
+        "message": "이미 예약된 시간입니다.",
+        "conflicts": [
+            {"id": row.id, "start_time": row.start_time.isoformat(), "end_time": row.end_time.isoformat()}
+            for row in conflicts
+        ],
+    })
+
+# 시설의 하루 예약 현황/빈 시간 — (facility_id, start_time, end_time) 인덱스 범위 조회 한 번
+@router.get("/availability", response_model=FacilityAvailability)
+def get_availability(facility_id: int, date: date, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    day_start = datetime.combine(date, time.min)
+    day_end = day_start + timedelta(days=1)
+    busy = merge_intervals(
+        (max(row.start_time, day_start), min(row.end_time, day_end))
+        for row in active_reservations(db, facility_id, day_start, day_end)
+    )
+    return FacilityAvailability(
+        facility_id=facility_id,
+        date=date,
+        busy=[{"start_time": start, "end_time": end} for start, end in busy],
+        free=[{"start_time": start, "end_time": end} for start, end in free_intervals(busy, day_start, day_end)],
+    )
+
+def _occurrence_starts(reservation_in: ReservationCreate):
+    """(발생 시작 시각 목록, 정규화한 반복 규칙)"""
+    if not reservation_in.repeat_rule:
+        return [reservation_in.start_time], None
+    try:
+        rule = RecurrenceRule.parse(reservation_in.repeat_rule, default_count=RESERVATION_SHORTHAND_COUNT)
+        starts = expand(rule, reservation_in.start_time, set(reservation_in.exdates), RESERVATION_SERIES_MAX)
+    except RecurrenceError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not starts:
+        raise HTTPException(status_code=400, detail="반복 규칙에 해당하는 날짜가 없습니다.")
+    return starts, str(rule)
+
+def _get_reservation(db: Session, reservation_id: int, current_user, action: str) -> Reservation:
+    reservation = db.query(Reservation).filter(Reservation.id == reservation_id).first()
+    if not reservation:
+        raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다.")
+    if reservation.user_id != current_user.id and not is_admin(current_user):
+        raise HTTPException(status_code=403, detail=f"{action} 권한이 없습니다.")
+    return reservation
+
+# 예약 생성 — 반복 규칙을 펼친 뒤 시설 단위로 직렬화하고,
+# 시리즈 전체를 범위 조회 한 번으로 검사해 겹치면 409 (충돌한 예약 목록 포함), 저장은 INSERT 한 번
+@router.post("/", response_model=List[ReservationResponse])
+def create_reservation(reservation_in: ReservationCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    starts, repeat_rule = _occurrence_starts(reservation_in)
+    duration = reservation_in.end_time - reservation_in.start_time
+    intervals = [(start, start + duration) for start in starts]
+    if self_overlaps(intervals):
+        raise HTTPException(status_code=400, detail="반복 예약끼리 시간이 겹칩니다.")
+
+    if not lock_facility(db, reservation_in.facility_id):
+        raise HTTPException(status_code=404, detail="시설을 찾을 수 없습니다.")
+    conflicts = find_conflicts(db, reservation_in.facility_id, intervals)
+    if conflicts:
+        db.rollback()
+        raise _conflict_error(conflicts)
+
+    series_id = uuid4().hex if repeat_rule else None
+    reservations = insert_reservations(db, [
+        {
+            "facility_id": reservation_in.facility_id,
+            "user_id": current_user.id,
+            "start_time": start,
+            "end_time": end,
+            "purpose": reservation_in.purpose,
+            "status": "예약",
+            "repeat_rule": repeat_rule,
+            "series_id": series_id,
+        }
+        for start, end in intervals
+    ])
+    try:
         db.commit()
-        return reservations
-    else:
-        reservation = Reservation(
-            facility_id=reservation_in.facility_id,
-            user_id=current_user.id,
-            start_time=reservation_in.start_time,
-            end_time=reservation_in.end_time,
-            purpose=reservation_in.purpose,
-            status="예약"
+    except IntegrityError as exc:
+        # EXCLUDE 제약 위반 (잠금 밖에서 들어온 쓰기 등)
+        db.rollback()
+        if RESERVATION_NO_OVERLAP in str(exc.orig):
+            raise _conflict_error(find_conflicts(db, reservation_in.facility_id, intervals))
+        raise
+    facility_availability.invalidate(reservation_in.facility_id, intervals)
+    return reservations
+
+# 예약 수정 — scope=following 이면 같은 반복의 이후 예약도 같은 만큼 옮기고 같은 길이로 (UPDATE 한 번)
+# 시간이 바뀌면 다시 승인받아야 하므로 상태는 "예약" 으로 돌아간다
+@router.put("/{reservation_id}", response_model=List[ReservationResponse])
+def update_reservation(
+    reservation_id: int,
+    reservation_in: ReservationUpdate,
+    scope: Literal["this", "following"] = THIS,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    reservation = _get_reservation(db, reservation_id, current_user, "수정")
+    if reservation.status == CANCELLED:
+        raise HTTPException(status_code=409, detail="취소된 예약입니다.")
+    start = reservation_in.start_time or reservation.start_time
+    end = reservation_in.end_time or start + (reservation.end_time - reservation.start_time)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="종료 시각은 시작 시각보다 늦어야 합니다.")
+    delta, duration = start - reservation.start_time, end - start
+    moved = delta or duration != reservation.end_time - reservation.start_time
+
+    condition = scope_condition(reservation, scope)
+    if moved and not lock_facility(db, reservation.facility_id):
+        raise HTTPException(status_code=404, detail="시설을 찾을 수 없습니다.")
+    targets = db.query(Reservation.id, Reservation.start_time, Reservation.end_time).filter(condition).all()
+    values = {}
+    if reservation_in.purpose is not None:
+        values["purpose"] = reservation_in.purpose
+    if moved:
+        intervals = [(row.start_time + delta, row.start_time + delta + duration) for row in targets]
+        if self_overlaps(intervals):
+            raise HTTPException(status_code=400, detail="반복 예약끼리 시간이 겹칩니다.")
+        conflicts = find_conflicts(db, reservation.facility_id, intervals, exclude_ids={row.id for row in targets})
+        if conflicts:
+            db.rollback()
+            raise _conflict_error(conflicts)
+        # SET 의 start_time 은 수정 전 값이므로 종료 시각도 기존 시작 시각 기준으로 계산
+        values.update(
+            start_time=shifted(db, Reservation.start_time, delta),
+            end_time=shifted(db, Reservation.start_time, delta + duration),
+            status="예약",
         )
-        db.add(reservation)
-        db.commit()
-        db.refresh(reservation)
-        return reservation
+    if values:
+        db.execute(update(Reservation).where(condition).values(**values).execution_options(synchronize_session=False))
+        try:
+            db.commit()
+        except IntegrityError as exc:
+            db.rollback()
+            if RESERVATION_NO_OVERLAP in str(exc.orig):
+                raise HTTPException(status_code=409, detail="이미 예약된 시간입니다.")
+            raise
+        if moved:
+            facility_availability.invalidate(
+                reservation.facility_id, [(row.start_time, row.end_time) for row in targets] + intervals
+            )
+    return (
+        db.query(Reservation)
+        .filter(Reservation.id.in_([row.id for row in targets]))
+        .order_by(Reservation.start_time)
+        .all()
+    )
 
 @router.put("/{reservation_id}/approve")
 def approve_reservation(reservation_id: int, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
     reservation = db.query(Reservation).filter(Reservation.id == reservation_id).first()
     if not reservation:
         raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다.")
+    if reservation.status == CANCELLED:
+        raise HTTPException(status_code=409, detail="취소된 예약입니다.")
     reservation.status = "승인"
-    # 알림 예시 (실제 구현은 별도 함수로)
-    # send_notification(reservation.user_id, "예약이 승인되었습니다.")
+    facility_id, interval = reservation.facility_id, (reservation.start_time, reservation.end_time)
+    enqueue_notification(db, reservation.user_id, "예약", "예약 승인", "예약이 승인되었습니다.")
     db.commit()
+    facility_availability.invalidate(facility_id, [interval])
     return {"message": "예약이 승인되었습니다."}
 
+# 예약 취소 — scope=following 이면 같은 반복의 이 예약 및 이후 예약을 UPDATE 한 번으로
 @router.put("/{reservation_id}/cancel")
-def cancel_reservation(reservation_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    reservation = db.query(Reservation).filter(Reservation.id == reservation_id).first()
-    if not reservation:
-        raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다.")
-    if reservation.user_id != current_user.id and not hasattr(current_user, 'is_admin'):
-        raise HTTPException(status_code=403, detail="취소 권한이 없습니다.")
-    reservation.status = "취소"
+def cancel_reservation(
+    reservation_id: int,
+    scope: Literal["this", "following"] = THIS,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    reservation = _get_reservation(db, reservation_id, current_user, "취소")
+    facility_id = reservation.facility_id
+    cancelled = db.execute(
+        update(Reservation).where(scope_condition(reservation, scope)).values(status=CANCELLED)
+        .returning(Reservation.start_time, Reservation.end_time)
+        .execution_options(synchronize_session=False)
+    ).all()
     db.commit()
-    return {"message": "예약이 취소되었습니다."} 
\ No newline at end of file
+    facility_availability.invalidate(facility_id, [(row.start_time, row.end_time) for row in cancelled])
+    return {"message": "예약이 취소되었습니다.", "cancelled": len(cancelled)}
@@ -1,14 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.db.models import Schedule, User
+from app.db.models import Department, Schedule, User
 from app.dependencies import get_db, get_current_user
-from typing import List
-from datetime import datetime
+from app.schemas.schedule import (
+    ScheduleCreate, ScheduleCreateResult, ScheduleOccurrence, ScheduleRangeResponse, ScheduleResponse
+)
+from app.services.notifications import enqueue_notifications
+from app.services.recurrence import RecurrenceError, RecurrenceRule
+from app.services.schedule_calendar import (
+    expand, insert_shares, share_recipients, shared_schedule_ids, visible_schedules
+)
+from itertools import islice
+from typing import List, Union
+from datetime import date, datetime, time, timedelta
+import os
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 
-@router.post("/")
-def create_schedule(schedule_in, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+SCHEDULE_RANGE_MAX_DAYS = 366
+SCHEDULE_RANGE_MAX_ITEMS = int(os.getenv("SCHEDULE_RANGE_MAX_ITEMS", "5000"))
+
+def _as_datetime(value: Union[datetime, date]) -> datetime:
+    # 날짜만 주면 그 날 0시
+    return value if isinstance(value, datetime) else datetime.combine(value, time.min)
+
+# 캘린더 기간 조회 — 사내/부서/개인 일정을 합쳐 [from, to) 에 걸치는 발생만 시작 시각 순으로
+@router.get("/", response_model=ScheduleRangeResponse)
+def get_schedules(
+    start: Union[datetime, date] = Query(..., alias="from"),
+    end: Union[datetime, date] = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    start, end = _as_datetime(start), _as_datetime(end)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="to 는 from 이후여야 합니다.")
+    if end - start > timedelta(days=SCHEDULE_RANGE_MAX_DAYS + 1):
+        raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {SCHEDULE_RANGE_MAX_DAYS}일입니다.")
+    rows = visible_schedules(db, current_user.id, current_user.department_id, start, end)
+    occurrences = list(islice(expand(rows, start, end), SCHEDULE_RANGE_MAX_ITEMS + 1))
+    return ScheduleRangeResponse(
+        items=[
+            ScheduleOccurrence(
+                schedule_id=occurrence.schedule.id,
+                title=occurrence.schedule.title,
+                content=occurrence.schedule.content,
+                type=occurrence.schedule.type,
+                owner_id=occurrence.schedule.owner_id,
+                start_time=occurrence.start_time,
+                end_time=occurrence.end_time,
+                is_repeat=bool(occurrence.schedule.is_repeat),
+                repeat_rule=occurrence.schedule.repeat_rule,
+            )
+            for occurrence in occurrences[:SCHEDULE_RANGE_MAX_ITEMS]
+        ],
+        truncated=len(occurrences) > SCHEDULE_RANGE_MAX_ITEMS,
+    )
+
+def _check_share_targets(db: Session, user_ids: List[int], department_ids: List[int]) -> None:
+    missing = sorted(set(user_ids) - set(db.scalars(select(User.id).where(User.id.in_(user_ids), User.is_active.is_(True)))))
+    if missing:
+        raise HTTPException(status_code=400, detail=f"존재하지 않는 직원이 있습니다: {missing}")
+    missing = sorted(set(department_ids) - set(db.scalars(select(Department.id).where(Department.id.in_(department_ids)))))
+    if missing:
+        raise HTTPException(status_code=400, detail=f"존재하지 않는 부서가 있습니다: {missing}")
+
+# 일정 생성 — 공유 대상(직원/부서)은 schedule_shares 에 한 번의 INSERT, 알림도 같은 트랜잭션
+@router.post("/", response_model=ScheduleCreateResult)
+def create_schedule(schedule_in: ScheduleCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    repeat_rule = None
+    if schedule_in.repeat_rule:
+        try:
+            repeat_rule = str(RecurrenceRule.parse(schedule_in.repeat_rule))
+        except RecurrenceError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    user_ids = [user_id for user_id in schedule_in.all_shared_user_ids() if user_id != current_user.id]
+    department_ids = sorted(set(schedule_in.shared_department_ids))
+    _check_share_targets(db, user_ids, department_ids)
+
     schedule = Schedule(
         title=schedule_in.title,
         content=schedule_in.content,
@@ -16,18 +86,42 @@ def create_schedule(schedule_in, db: Session = Depends(get_db), current_user=Dep
         end_time=schedule_in.end_time,
         type=schedule_in.type,
         owner_id=current_user.id,
-        shared_with=schedule_in.shared_with,  # 쉼표로 구분된 user_id 리스트
-        is_repeat=schedule_in.is_repeat,
-        repeat_rule=schedule_in.repeat_rule
+        is_repeat=repeat_rule is not None,
+        repeat_rule=repeat_rule
     )
     db.add(schedule)
+    db.flush()
+    insert_shares(db, schedule.id, user_ids, department_ids)
+    enqueue_notifications(db, [
+        {"user_id": user_id, "type": "일정", "title": "일정 공유", "content": "일정이 공유되었습니다."}
+        for user_id in sorted(share_recipients(db, user_ids, department_ids) - {current_user.id})
+    ])
     db.commit()
     db.refresh(schedule)
-    # 알림 예시 (실제 구현은 별도 함수로)
-    # for uid in schedule_in.shared_with.split(','):
-    #     send_notification(uid, "일정이 공유되었습니다.")
-    return schedule
+    return ScheduleCreateResult(
+        id=schedule.id,
+        title=schedule.title,
+        content=schedule.content,
+        start_time=schedule.start_time,
+        end_time=schedule.end_time,
+        type=schedule.type,
+        owner_id=schedule.owner_id,
+        is_repeat=schedule.is_repeat,
+        repeat_rule=schedule.repeat_rule,
+        created_at=schedule.created_at,
+        shared_user_ids=user_ids,
+        shared_department_ids=department_ids,
+    )
 
-@router.get("/shared/", response_model=List)
+# 나 또는 내 부서(상위 부서 포함)에 공유된 일정
+@router.get("/shared/", response_model=List[ScheduleResponse])
 def get_shared_schedules(db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    return db.query(Schedule).filter(Schedule.shared_with.contains(str(current_user.id))).all() 
\ No newline at end of file
+    return (
+        db.query(Schedule)
+        .filter(
+            Schedule.id.in_(shared_schedule_ids(current_user.id, current_user.department_id)),
+            Schedule.owner_id != current_user.id,
+        )
+        .order_by(Schedule.start_time.desc(), Schedule.id.desc())
+        .all()
+    )
@@ -1,32 +1,64 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from app.dependencies import get_db, get_current_admin
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.dependencies import get_async_db, get_current_admin
 from app.db.models import User, Department, Position
-from app.schemas.user import UserCreate, UserUpdate, UserResponse
-import bcrypt
+from app.pagination import decode_cursor
+from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserBulkResult, UserListResponse
+from app.services.principal_cache import principal_cache
+from app.services.department_tree import department_tree
+from app.services.approval_routes import approval_routes
+from app.services.passwords import password_pool
+from app.services import user_bulk, user_directory
 from datetime import datetime
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-@router.get("/", response_model=List[UserResponse])
+# 직원 목록 조회 (필터 + id 키셋 페이지네이션, include=department,position 로 이름 포함)
+@router.get("/", response_model=UserListResponse)
 async def get_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    include: Optional[str] = None,
+    department_id: Optional[int] = None,
+    include_subdepartments: bool = True,
+    position_level: Optional[int] = None,
+    is_active: Optional[bool] = None,
+    name: Optional[str] = Query(None, max_length=50),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    try:
+        includes = user_directory.parse_include(include)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 include 값입니다: {exc}"
+        )
+    filters = user_directory.UserFilter(
+        department_id=department_id,
+        include_subdepartments=include_subdepartments,
+        position_level=position_level,
+        is_active=is_active,
+        name_prefix=name.strip() if name else None,
+    )
+    after_id = decode_cursor(cursor, int)[0] if cursor else None
+    items, next_cursor = await user_directory.list_users(db, filters, includes, after_id, limit)
+    # 전체 건수는 요청 시에만, 캐시된 추정치로 제공
+    total = await user_directory.user_counts.get(db, filters) if with_total else None
+    return UserListResponse(items=items, next_cursor=next_cursor, total=total)
 
 @router.post("/", response_model=UserResponse)
 async def create_user(
     user: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
     # 이메일 중복 확인
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = await db.scalar(select(User).where(User.email == user.email).limit(1))
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -34,14 +66,14 @@ async def create_user(
         )
     
     # 부서와 직급 존재 확인
-    department = db.query(Department).filter(Department.id == user.department_id).first()
+    department = await db.scalar(select(Department).where(Department.id == user.department_id).limit(1))
     if not department:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="존재하지 않는 부서입니다."
         )
     
-    position = db.query(Position).filter(Position.id == user.position_id).first()
+    position = await db.scalar(select(Position).where(Position.id == user.position_id).limit(1))
     if not position:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -49,7 +81,7 @@ async def create_user(
         )
     
     # 비밀번호 해시 생성
-    hashed_password = bcrypt.hashpw(user.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    hashed_password = await password_pool.hash_password(user.password)
     
     db_user = User(
         employee_id=user.employee_id,
@@ -68,17 +100,52 @@ async def create_user(
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    department_tree.invalidate()
+    user_directory.user_counts.invalidate()
+    approval_routes.invalidate()
     return db_user
 
+# 직원 일괄 등록 (CSV/XLSX) — 행별 오류 목록을 반환하고 정상 행만 저장
+@router.post("/bulk", response_model=UserBulkResult)
+async def bulk_create_users(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin)
+):
+    try:
+        result = await user_bulk.import_users(db, file)
+    except user_bulk.BulkFileError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+    if result.created:
+        department_tree.invalidate()
+        user_directory.user_counts.invalidate()
+        approval_routes.invalidate()
+    return result
+
+# 직원 목록 CSV 내보내기 (스트리밍)
+@router.get("/export")
+async def export_users(
+    current_user: User = Depends(get_current_admin)
+):
+    filename = f"users_{datetime.now().strftime('%Y%m%d')}.csv"
+    return StreamingResponse(
+        user_bulk.export_users_csv(),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = await db.scalar(select(User).where(User.id == user_id).limit(1))
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -90,10 +157,10 @@ async def get_user(
 async def update_user(
     user_id: int,
     user: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = await db.scalar(select(User).where(User.id == user_id).limit(1))
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,7 +169,7 @@ async def update_user(
     
     # 부서와 직급 존재 확인
     if user.department_id:
-        department = db.query(Department).filter(Department.id == user.department_id).first()
+        department = await db.scalar(select(Department).where(Department.id == user.department_id).limit(1))
         if not department:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -110,7 +177,7 @@ async def update_user(
             )
     
     if user.position_id:
-        position = db.query(Position).filter(Position.id == user.position_id).first()
+        position = await db.scalar(select(Position).where(Position.id == user.position_id).limit(1))
         if not position:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -119,30 +186,38 @@ async def update_user(
     
     # 비밀번호가 제공된 경우에만 업데이트
     if user.password:
-        hashed_password = bcrypt.hashpw(user.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed_password = await password_pool.hash_password(user.password)
         db_user.password = hashed_password
     
     # 나머지 필드 업데이트
     for field, value in user.dict(exclude_unset=True, exclude={'password'}).items():
         setattr(db_user, field, value)
     
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    principal_cache.invalidate_user(user_id)
+    department_tree.invalidate()
+    user_directory.user_counts.invalidate()
+    approval_routes.invalidate()
     return db_user
 
 @router.delete("/{user_id}")
 async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin)
 ):
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = await db.scalar(select(User).where(User.id == user_id).limit(1))
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다."
         )
     
-    db.delete(db_user)
-    db.commit()
+    await db.delete(db_user)
+    await db.commit()
+    principal_cache.invalidate_user(user_id)
+    department_tree.invalidate()
+    user_directory.user_counts.invalidate()
+    approval_routes.invalidate()
     return {"message": "사용자가 성공적으로 삭제되었습니다."} 
\ No newline at end of file
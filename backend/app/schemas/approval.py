@@ -0,0 +1,76 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+# 결재함 (내가 지금 처리해야 할 결재선)
+class ApprovalInboxItem(BaseModel):
+    line_id: int
+    approval_id: int
+    order: int
+    type: str
+    status: str
+    summary: str
+    author_id: int
+    author_name: str
+    requested_at: Optional[datetime] = None
+    line_created_at: Optional[datetime] = None
+
+class ApprovalInboxResponse(BaseModel):
+    items: List[ApprovalInboxItem]
+    next_cursor: Optional[str] = None
+
+class ApprovalInboxCount(BaseModel):
+    count: int
+
+# 결재선 승인/반려
+class ApprovalDecision(BaseModel):
+    comment: Optional[str] = None
+
+class ApprovalDecisionResult(BaseModel):
+    message: str
+    approval_id: int
+    approval_status: str
+    line_status: str
+    changed: bool
+
+# 결재 경로 템플릿
+class ApprovalRouteStep(BaseModel):
+    position_level: int
+    parallel: bool = False
+
+class ApprovalRouteTemplateBase(BaseModel):
+    name: str
+    type: str
+    min_amount: int = Field(0, ge=0)
+    steps: List[ApprovalRouteStep] = Field(..., min_length=1)
+    is_active: bool = True
+
+class ApprovalRouteTemplateCreate(ApprovalRouteTemplateBase):
+    pass
+
+class ApprovalRouteTemplateResponse(ApprovalRouteTemplateBase):
+    id: int
+    created_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+# 결재선 일괄 추가 (같은 order 는 병렬 결재)
+class ApprovalLineCreate(BaseModel):
+    approver_id: int
+    order: int = Field(..., ge=1)
+
+class ApprovalLinesCreate(BaseModel):
+    lines: List[ApprovalLineCreate] = Field(..., min_length=1, max_length=50)
+
+# 결재 상신 — lines 를 생략하면 템플릿으로 결재선을 만든다
+class ApprovalCreate(BaseModel):
+    type: str
+    content: str
+    amount: Optional[int] = Field(None, ge=0)
+    lines: Optional[List[ApprovalLineCreate]] = Field(None, min_length=1, max_length=50)
+
+class ApprovalCreateResult(BaseModel):
+    id: int
+    status: str
+    lines: List[ApprovalLineCreate]
@@ -0,0 +1,125 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Literal, Optional
+from datetime import date, datetime
+
+# 근태 목록 (필요한 컬럼만 조회한 행을 그대로 직렬화)
+class AttendanceListItem(BaseModel):
+    id: int
+    user_id: int
+    user_name: str
+    department_id: int
+    date: datetime
+    check_in: Optional[datetime] = None
+    check_out: Optional[datetime] = None
+    status: str
+    approved: bool
+    approver_id: Optional[int] = None
+    approved_at: Optional[datetime] = None
+    memo: Optional[str] = None
+    created_at: Optional[datetime] = None
+    version: int
+
+class AttendanceListResponse(BaseModel):
+    items: List[AttendanceListItem]
+    next_cursor: Optional[str] = None
+
+# 출근/퇴근 기록 결과
+class AttendanceCheckResponse(BaseModel):
+    id: int
+    user_id: int
+    date: datetime
+    check_in: Optional[datetime] = None
+    check_out: Optional[datetime] = None
+    status: str
+    version: int
+
+# 근태 통계 (/attendances/stats, 롤업 테이블만 조회)
+class AttendanceStatsTotals(BaseModel):
+    days_present: int = 0
+    late_count: int = 0
+    early_leave_count: int = 0
+    overtime_hours: float = 0
+    worked_hours: float = 0
+
+class AttendanceMonthlyStats(AttendanceStatsTotals):
+    month: str  # YYYY-MM
+
+class AttendanceStatsRow(AttendanceStatsTotals):
+    id: int
+    name: str
+
+class AttendanceStatsResponse(BaseModel):
+    month_from: str
+    month_to: str
+    group_by: str
+    summary: AttendanceStatsTotals
+    monthly: List[AttendanceMonthlyStats]
+    items: List[AttendanceStatsRow]
+
+# 근태 일괄 승인 (id 목록 또는 필터, 함께 주면 AND)
+class AttendanceApproveRequest(BaseModel):
+    ids: Optional[List[int]] = Field(None, max_length=1000)
+    user_id: Optional[int] = None
+    department_id: Optional[int] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    status: Optional[str] = None
+
+class AttendanceSkipped(BaseModel):
+    id: int
+    reason: str
+
+class AttendanceApproveResponse(BaseModel):
+    approved: int
+    approved_ids: List[int]
+    skipped: List[AttendanceSkipped]
+
+# 근태 수정 — 지정한 필드만 바꾸며, version 은 조회 시 받은 값 (다르면 409)
+AttendanceStatus = Literal["출근", "퇴근", "외출", "조퇴", "연장근무"]
+
+class AttendanceUpdate(BaseModel):
+    version: int
+    date: Optional[datetime] = None
+    check_in: Optional[datetime] = None
+    check_out: Optional[datetime] = None
+    status: Optional[AttendanceStatus] = None
+    memo: Optional[str] = None
+
+    class Config:
+        extra = "forbid"
+
+    # 생략은 "바꾸지 않음" 이고, date/status 는 NOT NULL 이라 null 로 지울 수 없다
+    @field_validator("date", "status")
+    @classmethod
+    def check_not_null(cls, value):
+        if value is None:
+            raise ValueError("null 로 지정할 수 없습니다.")
+        return value
+
+class AttendanceBatchUpdateItem(AttendanceUpdate):
+    id: int
+
+class AttendanceBatchUpdate(BaseModel):
+    items: List[AttendanceBatchUpdateItem] = Field(..., min_length=1, max_length=500)
+    # False 면 하나라도 충돌 시 전체 롤백, True 면 성공한 행만 반영
+    partial: bool = False
+
+class AttendanceUpdateResult(BaseModel):
+    id: int
+    user_id: int
+    date: datetime
+    check_in: Optional[datetime] = None
+    check_out: Optional[datetime] = None
+    status: str
+    approved: bool
+    memo: Optional[str] = None
+    version: int
+
+class AttendanceUpdateConflict(BaseModel):
+    id: int
+    reason: str
+    current_version: Optional[int] = None
+
+class AttendanceBatchUpdateResponse(BaseModel):
+    updated: List[AttendanceUpdateResult]
+    conflicts: List[AttendanceUpdateConflict]
@@ -24,4 +24,23 @@ class DepartmentResponse(DepartmentBase):
         orm_mode = True
 
 # 순환 참조 해결을 위한 업데이트
-DepartmentResponse.update_forward_refs() 
\ No newline at end of file
+DepartmentResponse.update_forward_refs()
+
+# 조직도 (/departments/tree)
+class DepartmentMember(BaseModel):
+    id: int
+    name_kr: str
+    position: str
+    position_level: int
+
+class DepartmentTreeNode(BaseModel):
+    id: int
+    code: str
+    name: str
+    parent_id: Optional[int] = None
+    headcount: int
+    total_headcount: int
+    members: Optional[List[DepartmentMember]] = None
+    children: List['DepartmentTreeNode'] = []
+
+DepartmentTreeNode.update_forward_refs()
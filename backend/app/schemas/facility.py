@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import List, Optional
+
+class FacilityResponse(BaseModel):
+    id: int
+    name: str
+    location: str
+    capacity: int
+    status: str
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+# 하루 점유 격자: [[상태, 연속 슬롯 수], ...] (상태 0 빈 시간, 1 예약, 2 승인)
+class FacilityDayGrid(BaseModel):
+    date: date
+    runs: List[List[int]]
+
+class FacilityGrid(BaseModel):
+    facility_id: int
+    name: str
+    days: List[FacilityDayGrid]
+
+class FacilityAvailabilityGrid(BaseModel):
+    start: date
+    end: date
+    slot_minutes: int
+    facilities: List[FacilityGrid]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class PostBase(BaseModel):
@@ -27,4 +27,34 @@ class PostResponse(BaseModel):
     author_name: str
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+# 목록용 요약 (본문 제외)
+class PostSummary(BaseModel):
+    id: int
+    board_id: int
+    user_id: int
+    title: str
+    is_notice: bool
+    created_at: datetime
+    updated_at: datetime
+    author_name: str
+    comment_count: int
+
+class PostListResponse(BaseModel):
+    items: List[PostSummary]
+    next_cursor: Optional[str] = None
+
+class PostSearchResult(BaseModel):
+    id: int
+    board_id: int
+    title: str
+    title_highlight: str
+    snippet: str
+    author_name: str
+    created_at: datetime
+    score: float
+
+class PostSearchResponse(BaseModel):
+    total: int
+    items: List[PostSearchResult]
@@ -0,0 +1,64 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from datetime import date, datetime
+
+class ReservationCreate(BaseModel):
+    facility_id: int
+    start_time: datetime
+    end_time: datetime
+    purpose: Optional[str] = None
+    # RRULE 형식 (예: FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20261231) — app.services.recurrence 참고
+    # "daily"/"weekly"/"monthly" 처럼 주기만 보내면 4회
+    repeat_rule: Optional[str] = Field(None, max_length=255)
+    # 반복에서 뺄 날짜
+    exdates: List[date] = []
+
+    @model_validator(mode="after")
+    def check_time_order(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("종료 시각은 시작 시각보다 늦어야 합니다.")
+        return self
+
+# 예약 수정 (scope=following 이면 같은 반복의 이후 예약에도 같은 만큼 이동/길이 적용)
+class ReservationUpdate(BaseModel):
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    purpose: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_time_order(self):
+        if self.start_time and self.end_time and self.end_time <= self.start_time:
+            raise ValueError("종료 시각은 시작 시각보다 늦어야 합니다.")
+        return self
+
+class ReservationResponse(BaseModel):
+    id: int
+    facility_id: int
+    user_id: int
+    start_time: datetime
+    end_time: datetime
+    status: str
+    repeat_rule: Optional[str] = None
+    series_id: Optional[str] = None
+    purpose: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+# 충돌한 기존 예약 (409 응답 detail.conflicts)
+class ReservationConflict(BaseModel):
+    id: int
+    start_time: datetime
+    end_time: datetime
+
+# 시설의 하루 빈 시간/예약된 시간
+class TimeSlot(BaseModel):
+    start_time: datetime
+    end_time: datetime
+
+class FacilityAvailability(BaseModel):
+    facility_id: int
+    date: date
+    busy: List[TimeSlot]
+    free: List[TimeSlot]
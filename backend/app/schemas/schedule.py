@@ -0,0 +1,70 @@
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Literal, Optional
+from datetime import datetime
+
+class ScheduleCreate(BaseModel):
+    title: str = Field(..., max_length=200)
+    content: Optional[str] = None
+    start_time: datetime
+    end_time: datetime
+    type: Literal["사내", "부서", "개인"] = "개인"
+    shared_user_ids: List[int] = []
+    # 공유 부서 (하위 부서 포함)
+    shared_department_ids: List[int] = []
+    # 이전 형식 — 쉼표로 구분된 user_id 리스트 (shared_user_ids 에 합쳐진다)
+    shared_with: Optional[str] = None
+    # RRULE 형식 (예: FREQ=WEEKLY;BYDAY=MO) — 끝(COUNT/UNTIL)이 없어도 된다
+    repeat_rule: Optional[str] = Field(None, max_length=255)
+
+    @field_validator("shared_with")
+    @classmethod
+    def check_shared_with(cls, value):
+        if value and not all(token.strip().isdigit() for token in value.split(",") if token.strip()):
+            raise ValueError("shared_with 는 쉼표로 구분된 직원 id 여야 합니다.")
+        return value
+
+    @model_validator(mode="after")
+    def check_time_order(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("종료 시각은 시작 시각보다 늦어야 합니다.")
+        return self
+
+    def all_shared_user_ids(self) -> List[int]:
+        legacy = [int(token) for token in (self.shared_with or "").split(",") if token.strip()]
+        return sorted(set(self.shared_user_ids) | set(legacy))
+
+class ScheduleResponse(BaseModel):
+    id: int
+    title: str
+    content: Optional[str] = None
+    start_time: datetime
+    end_time: datetime
+    type: str
+    owner_id: int
+    is_repeat: Optional[bool] = None
+    repeat_rule: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+class ScheduleCreateResult(ScheduleResponse):
+    shared_user_ids: List[int] = []
+    shared_department_ids: List[int] = []
+
+# 기간 조회 결과 — 반복 일정은 발생마다 한 항목 (schedule_id 가 같다)
+class ScheduleOccurrence(BaseModel):
+    schedule_id: int
+    title: str
+    content: Optional[str] = None
+    type: str
+    owner_id: int
+    start_time: datetime
+    end_time: datetime
+    is_repeat: bool
+    repeat_rule: Optional[str] = None
+
+class ScheduleRangeResponse(BaseModel):
+    items: List[ScheduleOccurrence]
+    # 최대 건수에서 잘렸으면 True (기간을 줄여 다시 조회)
+    truncated: bool = False
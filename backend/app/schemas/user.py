@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr
-from datetime import datetime
-from typing import Optional
+from pydantic import BaseModel, EmailStr, field_validator
+from datetime import date, datetime
+from typing import List, Optional
 
 class UserBase(BaseModel):
     employee_id: str
@@ -40,4 +40,59 @@ class UserResponse(UserBase):
     profile_image: Optional[str] = None
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+class UserDepartmentRef(BaseModel):
+    id: int
+    code: str
+    name: str
+
+class UserPositionRef(BaseModel):
+    id: int
+    name: str
+    level: int
+
+# 목록 조회용 (include=department,position 일 때 이름까지 함께 반환)
+class UserListItem(UserResponse):
+    department: Optional[UserDepartmentRef] = None
+    position: Optional[UserPositionRef] = None
+
+class UserListResponse(BaseModel):
+    items: List[UserListItem]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+# 일괄 등록 파일의 한 행 (부서는 코드, 직급은 이름 또는 레벨로 지정)
+class UserBulkRow(BaseModel):
+    employee_id: str
+    name_kr: str
+    name_en: str
+    birth_date: datetime
+    gender: str
+    hire_date: datetime
+    email: EmailStr
+    password: str
+    department_code: str
+    position: str
+    phone_number: str
+    phone_landline: Optional[str] = None
+
+    @field_validator("birth_date", "hire_date", mode="before")
+    @classmethod
+    def parse_date_only(cls, value):
+        # 파일에는 보통 날짜만 적으므로 "YYYY-MM-DD" 도 허용
+        if isinstance(value, str) and len(value) == 10:
+            try:
+                return datetime.combine(date.fromisoformat(value), datetime.min.time())
+            except ValueError:
+                return value
+        return value
+
+class UserBulkRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+class UserBulkResult(BaseModel):
+    created: int
+    failed: int
+    errors: List[UserBulkRowError]
@@ -0,0 +1,133 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from app.db.models import ApprovalLine, ApprovalRouteTemplate, DepartmentClosure, Position, User
+import os
+import threading
+import time
+
+# 결재 경로 템플릿 해석
+#  - (기안 부서, 결재 종류) 별로 템플릿 목록과 단계별 결재자 해석 결과를 캐시
+#    → 캐시 적중 시 결재 상신에 필요한 조회는 0회
+#  - 템플릿/직원/부서/직급 변경 시 invalidate(), 그 외에는 TTL 로 만료
+#  - 결재선은 한 번의 executemany INSERT 로 만든다
+
+APPROVAL_ROUTE_CACHE_TTL_SECONDS = float(os.getenv("APPROVAL_ROUTE_CACHE_TTL_SECONDS", "300"))
+
+# (min_amount, template_id, 단계별 결재자 id 목록, 결재자를 찾지 못한 단계 설명 목록)
+ResolvedRoute = Tuple[int, int, List[List[int]], List[str]]
+
+
+class UnresolvedRoute(ValueError):
+    """적용할 템플릿의 단계 중 결재자를 찾을 수 없는 단계가 있음"""
+
+
+def _resolve_templates(db: Session, department_id: int, type: str) -> List[ResolvedRoute]:
+    templates = db.execute(
+        select(ApprovalRouteTemplate.id, ApprovalRouteTemplate.name, ApprovalRouteTemplate.min_amount, ApprovalRouteTemplate.steps)
+        .where(ApprovalRouteTemplate.type == type, ApprovalRouteTemplate.is_active.is_(True))
+        .order_by(ApprovalRouteTemplate.min_amount.desc(), ApprovalRouteTemplate.id)
+    ).all()
+    if not templates:
+        return []
+
+    # 기안 부서부터 최상위 부서까지 (가까운 순) 소속 직원을 한 번에 읽는다
+    depth = {
+        row.ancestor_id: row.depth
+        for row in db.execute(
+            select(DepartmentClosure.ancestor_id, DepartmentClosure.depth)
+            .where(DepartmentClosure.descendant_id == department_id)
+        )
+    }
+    members: Dict[Tuple[int, int], List[int]] = {}
+    for row in db.execute(
+        select(User.id, User.department_id, Position.level)
+        .join(Position, User.position_id == Position.id)
+        .where(User.is_active.is_(True), User.department_id.in_(list(depth)))
+        .order_by(User.id)
+    ):
+        members.setdefault((row.department_id, row.level), []).append(row.id)
+    chain = sorted(depth, key=depth.get)
+
+    resolved = []
+    for template in templates:
+        steps, unresolved = [], []
+        for number, step in enumerate(template.steps, start=1):
+            for ancestor_id in chain:
+                approvers = members.get((ancestor_id, step["position_level"]))
+                if approvers:
+                    steps.append(list(approvers) if step.get("parallel") else approvers[:1])
+                    break
+            else:
+                # 단계를 조용히 빼면 결재선이 짧아지므로, 상신 시 오류로 알린다
+                unresolved.append(f"'{template.name}' {number}단계 (직급 레벨 {step['position_level']})")
+        resolved.append((template.min_amount, template.id, steps, unresolved))
+    return resolved
+
+
+class ApprovalRouteCache:
+    def __init__(self, ttl: float = APPROVAL_ROUTE_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[int, str], Tuple[float, List[ResolvedRoute]]] = {}
+        self._generation = 0
+
+    def get(self, db: Session, department_id: int, type: str) -> List[ResolvedRoute]:
+        key = (department_id, type)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+
+        routes = _resolve_templates(db, department_id, type)
+        with self._lock:
+            # 조회 도중 무효화되었다면 오래된 결과를 넣지 않는다
+            if generation == self._generation:
+                self._entries[key] = (now + self.ttl, routes)
+        return routes
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+approval_routes = ApprovalRouteCache()
+
+
+def route_for(db: Session, drafter_id: int, department_id: int, type: str, amount: Optional[int]) -> Optional[List[List[int]]]:
+    """기안자에게 적용할 단계별 결재자 목록 (적용할 템플릿이 없으면 None)
+
+    기안자 본인과 앞 단계에 이미 포함된 결재자는 빼고, 비게 된 단계는 건너뛴다.
+    부서 계통에 해당 직급 직원이 없는 단계가 있으면 UnresolvedRoute.
+    """
+    for min_amount, _, steps, unresolved in approval_routes.get(db, department_id, type):
+        if (amount or 0) < min_amount:
+            continue
+        if unresolved:
+            raise UnresolvedRoute(f"결재자를 찾을 수 없는 결재 단계가 있습니다: {', '.join(unresolved)}")
+        seen = {drafter_id}
+        route = []
+        for approvers in steps:
+            approvers = [approver_id for approver_id in approvers if approver_id not in seen]
+            if approvers:
+                seen.update(approvers)
+                route.append(approvers)
+        return route
+    return None
+
+
+def insert_lines(db: Session, approval_id: int, lines: List[Tuple[int, int]]) -> None:
+    """(approver_id, order) 목록을 한 번에 INSERT 한다. 커밋은 호출자가 한다."""
+    if not lines:
+        return
+    db.execute(insert(ApprovalLine), [
+        {"approval_id": approval_id, "approver_id": approver_id, "order": order, "status": "대기"}
+        for approver_id, order in lines
+    ])
+
+
+def route_lines(route: List[List[int]]) -> List[Tuple[int, int]]:
+    return [(approver_id, order) for order, approvers in enumerate(route, start=1) for approver_id in approvers]
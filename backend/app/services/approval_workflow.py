@@ -0,0 +1,138 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from app.db.models import Approval, ApprovalLine
+from datetime import datetime
+
+# 결재 진행 엔진
+#  - 같은 order 의 결재선은 병렬 단계(모두 승인해야 다음 단계), order 가 커질수록 다음 단계
+#  - 반려 시 문서를 즉시 반려로 종결 (남은 결재선은 결재함에서 빠진다)
+#  - 문서 행을 SELECT ... FOR UPDATE SKIP LOCKED 로 잠그고 처리 — 다른 결재자가 처리 중이면
+#    기다리지 않고 ApprovalBusy 를 발생시켜 클라이언트가 재시도하게 한다
+#  - 같은 결정을 다시 보내면 변경 없이 현재 상태를 돌려준다 (재시도에 안전)
+#  - 커밋은 호출자가 한다
+
+APPROVED = "승인"
+REJECTED = "반려"
+PENDING = "대기"
+IN_PROGRESS = "진행중"
+
+
+class ApprovalWorkflowError(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class ApprovalBusy(ApprovalWorkflowError):
+    """같은 문서를 다른 트랜잭션이 처리 중"""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__(409, "다른 결재가 처리 중입니다. 잠시 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+
+
+@dataclass
+class WorkflowResult:
+    approval_id: int
+    approval_status: str
+    line_status: str
+    changed: bool
+    finalized: bool = False
+    # 이번 결정으로 차례가 된 결재자 (알림 대상)
+    next_approver_ids: List[int] = field(default_factory=list)
+    author_id: Optional[int] = None
+
+
+def decide(db: Session, line_id: int, actor_id: int, decision: str, comment: Optional[str] = None) -> WorkflowResult:
+    if decision not in (APPROVED, REJECTED):
+        raise ApprovalWorkflowError(400, "알 수 없는 결재 결정입니다.")
+
+    line = db.query(ApprovalLine.approval_id, ApprovalLine.approver_id).filter(ApprovalLine.id == line_id).first()
+    if line is None:
+        raise ApprovalWorkflowError(404, "결재선을 찾을 수 없습니다.")
+    if line.approver_id != actor_id:
+        raise ApprovalWorkflowError(403, "승인 권한이 없습니다.")
+
+    # 문서 단위로 직렬화 (PostgreSQL 외에서는 FOR UPDATE 가 생략되고 아래 조건부 UPDATE 가 보호)
+    approval = (
+        db.query(Approval.id, Approval.status, Approval.user_id)
+        .filter(Approval.id == line.approval_id)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if approval is None:
+        raise ApprovalBusy()
+
+    lines = (
+        db.query(ApprovalLine.id, ApprovalLine.order, ApprovalLine.status, ApprovalLine.approver_id)
+        .filter(ApprovalLine.approval_id == approval.id)
+        .order_by(ApprovalLine.order, ApprovalLine.id)
+        .all()
+    )
+    mine = next(item for item in lines if item.id == line_id)
+
+    if mine.status == decision:
+        return WorkflowResult(approval.id, approval.status, mine.status, changed=False, author_id=approval.user_id)
+    if mine.status != PENDING:
+        raise ApprovalWorkflowError(409, "이미 처리된 결재선입니다.")
+    if approval.status != IN_PROGRESS:
+        raise ApprovalWorkflowError(409, "이미 종결된 결재입니다.")
+    current_order = min(item.order for item in lines if item.status == PENDING)
+    if mine.order != current_order:
+        raise ApprovalWorkflowError(409, "아직 결재 차례가 아닙니다.")
+
+    now = datetime.utcnow()
+    changed = db.execute(
+        update(ApprovalLine)
+        .where(ApprovalLine.id == line_id, ApprovalLine.status == PENDING)
+        .values(status=decision, comment=comment, decided_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not changed:
+        # 잠금이 없는 DB 에서 동시에 처리된 경우
+        raise ApprovalBusy()
+
+    # 남은 결재선은 쓰기 이후에 다시 읽는다 — 잠금이 없는 DB 에서 병렬 결재자가 동시에 승인해도
+    # 마지막으로 쓴 쪽이 종결을 놓치지 않도록
+    remaining = (
+        db.query(ApprovalLine.order, ApprovalLine.approver_id)
+        .filter(ApprovalLine.approval_id == approval.id, ApprovalLine.status == PENDING)
+        .all()
+    )
+    result = WorkflowResult(approval.id, approval.status, decision, changed=True, author_id=approval.user_id)
+    if decision == REJECTED or not remaining:
+        final_status = REJECTED if decision == REJECTED else APPROVED
+        db.execute(
+            update(Approval)
+            .where(Approval.id == approval.id, Approval.status == IN_PROGRESS)
+            .values(status=final_status)
+            .execution_options(synchronize_session=False)
+        )
+        result.approval_status = final_status
+        result.finalized = True
+    elif not any(item.order == current_order for item in remaining):
+        # 병렬 단계가 모두 끝났으면 다음 단계 결재자에게 차례가 넘어간다
+        next_order = min(item.order for item in remaining)
+        result.next_approver_ids = [item.approver_id for item in remaining if item.order == next_order]
+    return result
+
+
+def workflow_notifications(result: WorkflowResult) -> List[dict]:
+    """결정 결과에 따른 알림 (다음 차례 결재자, 종결 시 기안자)"""
+    if not result.changed:
+        return []
+    notifications = [
+        {"user_id": user_id, "type": "결재", "title": "결재 요청", "content": "결재 요청이 도착했습니다."}
+        for user_id in result.next_approver_ids
+    ]
+    if result.finalized and result.author_id is not None:
+        notifications.append({
+            "user_id": result.author_id,
+            "type": "결재",
+            "title": f"결재 {result.approval_status}",
+            "content": f"결재가 {result.approval_status}되었습니다.",
+        })
+    return notifications
@@ -0,0 +1,100 @@
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.db.models import Attendance, User
+from app.services import org
+from app.services.attendance_stats import attendance_key, refresh_rollups
+from datetime import date, datetime, time, timedelta
+
+# 근태 일괄 승인
+#  - id 목록/필터 조건을 하나의 UPDATE ... RETURNING 으로 처리
+#  - 승인되지 않은 id 는 사유와 함께 돌려준다 (건너뛴 id 가 있을 때만 추가 조회 1회)
+
+SKIP_NOT_FOUND = "존재하지 않는 근태 기록입니다."
+SKIP_ALREADY_APPROVED = "이미 승인된 근태 기록입니다."
+SKIP_FILTERED = "조건에 맞지 않는 근태 기록입니다."
+
+
+def _criteria(
+    ids: Optional[List[int]],
+    user_id: Optional[int],
+    department_id: Optional[int],
+    date_from: Optional[date],
+    date_to: Optional[date],
+    status: Optional[str],
+) -> list:
+    criteria = []
+    if ids is not None:
+        criteria.append(Attendance.id.in_(ids))
+    if user_id is not None:
+        criteria.append(Attendance.user_id == user_id)
+    if department_id is not None:
+        criteria.append(Attendance.user_id.in_(
+            select(User.id).where(User.department_id.in_(org.descendant_ids(department_id)))
+        ))
+    if date_from:
+        criteria.append(Attendance.date >= datetime.combine(date_from, time.min))
+    if date_to:
+        criteria.append(Attendance.date < datetime.combine(date_to + timedelta(days=1), time.min))
+    if status:
+        criteria.append(Attendance.status == status)
+    return criteria
+
+
+def approve_attendances(
+    db: Session,
+    approver_id: int,
+    ids: Optional[List[int]] = None,
+    user_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    status: Optional[str] = None,
+) -> Tuple[List, Dict[int, str]]:
+    """조건에 맞는 미승인 근태를 승인한다. 커밋은 호출자가 한다.
+
+    반환값: (승인된 행(id, user_id, date) 목록, {건너뛴 id: 사유})
+    """
+    criteria = _criteria(ids, user_id, department_id, date_from, date_to, status)
+    approved = db.execute(
+        update(Attendance)
+        .where(*criteria, Attendance.approved.isnot(True))
+        .values(approved=True, approver_id=approver_id, approved_at=datetime.utcnow(), version=Attendance.version + 1)
+        .returning(Attendance.id, Attendance.user_id, Attendance.date)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    skipped: Dict[int, str] = {}
+    if ids:
+        missing = set(ids) - {row.id for row in approved}
+        if missing:
+            existing = dict(
+                db.query(Attendance.id, Attendance.approved).filter(Attendance.id.in_(missing)).all()
+            )
+            for attendance_id in sorted(missing):
+                if attendance_id not in existing:
+                    skipped[attendance_id] = SKIP_NOT_FOUND
+                elif existing[attendance_id]:
+                    skipped[attendance_id] = SKIP_ALREADY_APPROVED
+                else:
+                    # 미승인인데 갱신되지 않았다면 함께 준 필터 조건에서 빠진 것
+                    skipped[attendance_id] = SKIP_FILTERED
+
+    if approved:
+        refresh_rollups(db, [attendance_key(row.user_id, row.date) for row in approved])
+    return approved, skipped
+
+
+def approval_notifications(approved) -> List[dict]:
+    """직원별로 한 건씩 묶은 승인 알림"""
+    counts = Counter(row.user_id for row in approved)
+    return [
+        {
+            "user_id": user_id,
+            "type": "근태",
+            "title": "근태 승인",
+            "content": "근태가 승인되었습니다." if count == 1 else f"근태 {count}건이 승인되었습니다.",
+        }
+        for user_id, count in counts.items()
+    ]
@@ -0,0 +1,190 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import AsyncSessionLocal
+from app.db.models import Attendance
+from app.services.attendance_stats import refresh_rollups
+from datetime import datetime, time
+import asyncio
+import os
+
+# 출퇴근 기록 쓰기 버퍼
+#  - 요청은 (종류, 직원, 시각) 을 버퍼에 넣고 커밋 완료를 기다린다
+#  - FLUSH_INTERVAL_MS 마다 또는 FLUSH_MAX_ROWS 건이 모이면 한 트랜잭션으로
+#    attendances(user_id, date) 유니크 키에 일괄 upsert 후 커밋
+#  - 같은 배치 안의 중복은 미리 합친다 (출근은 가장 이른 시각, 퇴근은 가장 늦은 시각)
+#  - 배치가 실패하면 (직원, 날짜) 별로 나눠 다시 써서, 실패한 행의 요청만 오류를 받는다
+
+FLUSH_INTERVAL_MS = int(os.getenv("ATTENDANCE_FLUSH_INTERVAL_MS", "200"))
+FLUSH_MAX_ROWS = int(os.getenv("ATTENDANCE_FLUSH_MAX_ROWS", "200"))
+
+CHECK_IN = "check_in"
+CHECK_OUT = "check_out"
+
+RETURNED_COLUMNS = (
+    Attendance.id, Attendance.user_id, Attendance.date, Attendance.check_in,
+    Attendance.check_out, Attendance.status, Attendance.version,
+)
+
+
+def work_day(at: datetime) -> datetime:
+    """근태 행의 date 컬럼 값 (해당 일 0시)"""
+    return datetime.combine(at.date(), time.min)
+
+
+def _insert_for(session: AsyncSession):
+    return pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+
+async def _upsert_check_ins(session: AsyncSession, rows: Dict[Tuple[int, datetime], datetime]) -> List:
+    if not rows:
+        return []
+    insert = _insert_for(session)
+    stmt = insert(Attendance).values([
+        {
+            "user_id": user_id, "date": day, "check_in": at, "status": "출근",
+            "approved": False, "created_at": datetime.utcnow(),
+        }
+        for (user_id, day), at in rows.items()
+    ])
+    # 이미 출근했다면 처음 기록을 유지 (재요청해도 결과가 같다)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Attendance.user_id, Attendance.date],
+        set_={
+            "check_in": func.coalesce(Attendance.check_in, stmt.excluded.check_in),
+            "version": Attendance.version + 1,
+        },
+    ).returning(*RETURNED_COLUMNS)
+    return (await session.execute(stmt)).all()
+
+
+async def _upsert_check_outs(session: AsyncSession, rows: Dict[Tuple[int, datetime], datetime]) -> List:
+    if not rows:
+        return []
+    insert = _insert_for(session)
+    stmt = insert(Attendance).values([
+        {
+            "user_id": user_id, "date": day, "check_out": at, "status": "퇴근",
+            "approved": False, "created_at": datetime.utcnow(),
+        }
+        for (user_id, day), at in rows.items()
+    ])
+    # 퇴근은 마지막 기록으로 갱신, 조퇴/외출 등 수동 상태는 유지
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Attendance.user_id, Attendance.date],
+        set_={
+            "check_out": stmt.excluded.check_out,
+            "status": case((Attendance.status == "출근", "퇴근"), else_=Attendance.status),
+            "version": Attendance.version + 1,
+        },
+    ).returning(*RETURNED_COLUMNS)
+    return (await session.execute(stmt)).all()
+
+
+def _fail(batch: List[Tuple[str, int, datetime, asyncio.Future]], exc: Exception) -> None:
+    for *_, future in batch:
+        if not future.done():
+            future.set_exception(exc)
+
+
+class AttendanceWriteBuffer:
+    def __init__(self, interval_ms: int = FLUSH_INTERVAL_MS, max_rows: int = FLUSH_MAX_ROWS):
+        self.interval = interval_ms / 1000
+        self.max_rows = max_rows
+        self._pending: List[Tuple[str, int, datetime, asyncio.Future]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._tasks = set()
+        self.flush_count = 0
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._timer = None
+            self._flush_lock = asyncio.Lock()
+
+    async def submit(self, kind: str, user_id: int, at: datetime):
+        """기록을 버퍼에 넣고, 커밋된 뒤의 근태 행을 돌려준다."""
+        self._bind_loop()
+        future = self._loop.create_future()
+        self._pending.append((kind, user_id, at, future))
+        if len(self._pending) >= self.max_rows:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self.interval, self._schedule_flush)
+        return await future
+
+    def _schedule_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = self._loop.create_task(self._flush(batch))
+        # 태스크가 GC 되지 않도록 완료 전까지 참조를 유지
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: List[Tuple[str, int, datetime, asyncio.Future]]) -> Dict[Tuple[int, datetime], dict]:
+        """배치를 한 트랜잭션으로 upsert 하고 (직원, 날짜) 별 근태 행을 돌려준다."""
+        check_ins: Dict[Tuple[int, datetime], datetime] = {}
+        check_outs: Dict[Tuple[int, datetime], datetime] = {}
+        for kind, user_id, at, _ in batch:
+            key = (user_id, work_day(at))
+            if kind == CHECK_IN:
+                check_ins[key] = min(at, check_ins.get(key, at))
+            else:
+                check_outs[key] = max(at, check_outs.get(key, at))
+
+        async with AsyncSessionLocal() as session:
+            results = {}
+            for row in await _upsert_check_ins(session, check_ins):
+                results[(row.user_id, row.date)] = dict(row._mapping)
+            for row in await _upsert_check_outs(session, check_outs):
+                results[(row.user_id, row.date)] = dict(row._mapping)
+            keys = [(user_id, day.date()) for user_id, day in set(check_ins) | set(check_outs)]
+            await session.run_sync(refresh_rollups, keys)
+            await session.commit()
+        self.flush_count += 1
+        return results
+
+    async def _flush(self, batch: List[Tuple[str, int, datetime, asyncio.Future]]) -> None:
+        # 배치 순서를 지키기 위해 flush 는 한 번에 하나씩
+        async with self._flush_lock:
+            try:
+                results = await self._write(batch)
+            except Exception as exc:
+                # 한 행 때문에 배치 전체가 실패하지 않도록 (직원, 날짜) 별로 나눠 다시 쓴다
+                # → 실패한 행을 제출한 요청만 오류를 받는다
+                groups: Dict[Tuple[int, datetime], List] = {}
+                for entry in batch:
+                    groups.setdefault((entry[1], work_day(entry[2])), []).append(entry)
+                if len(groups) == 1:
+                    _fail(batch, exc)
+                    return
+                results = {}
+                for group in groups.values():
+                    try:
+                        results.update(await self._write(group))
+                    except Exception as group_exc:
+                        _fail(group, group_exc)
+
+        for _, user_id, at, future in batch:
+            if not future.done():
+                future.set_result(results.get((user_id, work_day(at))))
+
+    async def drain(self) -> None:
+        """대기 중인 기록을 모두 커밋한다 (종료 시 호출)."""
+        if self._loop is None or self._loop is not asyncio.get_running_loop():
+            return
+        self._schedule_flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+attendance_buffer = AttendanceWriteBuffer()
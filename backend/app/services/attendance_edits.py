@@ -0,0 +1,71 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.db.models import Attendance
+from app.services.attendance_buffer import work_day
+from app.services.attendance_stats import attendance_key, refresh_rollups
+
+# 근태 수정 (낙관적 잠금)
+#  - UPDATE ... WHERE id = :id AND version = :version RETURNING 한 번으로 수정
+#  - 갱신된 행이 없으면 존재 여부만 확인해 404/409 사유를 구분한다
+
+CONFLICT_NOT_FOUND = "근태 기록을 찾을 수 없습니다."
+CONFLICT_VERSION = "다른 사용자가 먼저 수정했습니다. 다시 조회 후 수정해주세요."
+CONFLICT_DUPLICATE_DATE = "해당 날짜에 이미 근태 기록이 있습니다."
+
+RETURNED_COLUMNS = (
+    Attendance.id, Attendance.user_id, Attendance.date, Attendance.check_in, Attendance.check_out,
+    Attendance.status, Attendance.approved, Attendance.memo, Attendance.version,
+)
+
+
+def _update_one(db: Session, attendance_id: int, expected_version: int, fields: dict):
+    """(수정된 행, 롤업 키) 또는 (None, (사유, 현재 version)) 을 돌려준다."""
+    old_key = None
+    if "date" in fields:
+        # 날짜가 바뀌면 이전 날짜의 롤업도 다시 계산해야 하므로 기존 값을 읽어둔다
+        old = db.query(Attendance.user_id, Attendance.date).filter(Attendance.id == attendance_id).first()
+        old_key = attendance_key(old.user_id, old.date) if old else None
+
+    row = db.execute(
+        update(Attendance)
+        .where(Attendance.id == attendance_id, Attendance.version == expected_version)
+        .values(**fields, version=Attendance.version + 1)
+        .returning(*RETURNED_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        current = db.query(Attendance.version).filter(Attendance.id == attendance_id).scalar()
+        if current is None:
+            return None, (CONFLICT_NOT_FOUND, None)
+        return None, (CONFLICT_VERSION, current)
+
+    keys = [attendance_key(row.user_id, row.date)]
+    if old_key is not None:
+        keys.append(old_key)
+    return row, keys
+
+
+def update_attendances(db: Session, items: List[Tuple[int, int, dict]]) -> Tuple[List, Dict[int, Tuple[str, Optional[int]]]]:
+    """(id, version, fields) 목록을 같은 트랜잭션에서 수정하고 롤업을 한 번에 갱신한다."""
+    updated, conflicts, keys = [], {}, []
+    for attendance_id, expected_version, fields in items:
+        if "date" in fields:
+            # 출퇴근 기록과 같이 해당 일 0시로 맞춘다 ((user_id, date) 유니크 인덱스가 같은 날을 잡도록)
+            fields = {**fields, "date": work_day(fields["date"])}
+            # 날짜 변경은 (user_id, date) 유니크 충돌이 날 수 있어 세이브포인트 안에서 실행
+            try:
+                with db.begin_nested():
+                    row, result = _update_one(db, attendance_id, expected_version, fields)
+            except IntegrityError:
+                row, result = None, (CONFLICT_DUPLICATE_DATE, expected_version)
+        else:
+            row, result = _update_one(db, attendance_id, expected_version, fields)
+        if row is None:
+            conflicts[attendance_id] = result
+        else:
+            updated.append(row)
+            keys.extend(result)
+    refresh_rollups(db, keys)
+    return updated, conflicts
@@ -0,0 +1,170 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import delete, func, insert, select, tuple_
+from sqlalchemy.orm import Session
+from app.db.models import Attendance, AttendanceDailyStat, AttendanceMonthlyStat, User
+from datetime import date, datetime, time, timedelta
+import os
+
+# 근태 통계 롤업
+#  - attendance_daily_stats: 직원 x 일 (지각/조퇴/연장근무/근무시간)
+#  - attendance_monthly_stats: 직원 x 월 (일별 롤업의 합)
+#  - 근태 행이 바뀌면 같은 트랜잭션에서 refresh_rollups() 로 해당 (직원, 날짜)만 다시 계산한다
+
+WORK_START = time.fromisoformat(os.getenv("ATTENDANCE_WORK_START", "09:00"))
+WORK_END = time.fromisoformat(os.getenv("ATTENDANCE_WORK_END", "18:00"))
+
+# 한 번에 IN (...) 으로 넘길 (직원, 날짜) 키 수
+REFRESH_BATCH_SIZE = 500
+
+
+def month_of(day: date) -> date:
+    return day.replace(day=1)
+
+
+def attendance_key(user_id: int, value: datetime) -> Tuple[int, date]:
+    """근태 행의 (user_id, date) 를 롤업 키로 변환한다."""
+    return user_id, value.date() if isinstance(value, datetime) else value
+
+
+def _minutes(delta: timedelta) -> int:
+    return max(0, int(delta.total_seconds() // 60))
+
+
+def _daily_rows(records, departments: Dict[int, int]) -> List[dict]:
+    grouped = defaultdict(list)
+    for record in records:
+        grouped[attendance_key(record.user_id, record.date)].append(record)
+
+    rows = []
+    for (user_id, day), items in grouped.items():
+        if user_id not in departments:
+            continue
+        check_ins = [item.check_in for item in items if item.check_in]
+        check_outs = [item.check_out for item in items if item.check_out]
+        first_in = min(check_ins) if check_ins else None
+        last_out = max(check_outs) if check_outs else None
+        work_end = datetime.combine(day, WORK_END)
+        rows.append({
+            "user_id": user_id,
+            "date": day,
+            "month": month_of(day),
+            "department_id": departments[user_id],
+            "present": 1 if first_in else 0,
+            "late": 1 if first_in and first_in > datetime.combine(day, WORK_START) else 0,
+            "early_leave": 1 if any(item.status == "조퇴" for item in items) or (last_out and last_out < work_end) else 0,
+            "overtime_minutes": _minutes(last_out - work_end) if last_out else 0,
+            "worked_minutes": _minutes(last_out - first_in) if first_in and last_out else 0,
+        })
+    return rows
+
+
+def _load_attendances(db: Session, start: date, end: date, user_ids: Optional[Set[int]] = None):
+    query = db.query(
+        Attendance.user_id, Attendance.date, Attendance.check_in, Attendance.check_out, Attendance.status
+    ).filter(
+        Attendance.date >= datetime.combine(start, time.min),
+        Attendance.date < datetime.combine(end + timedelta(days=1), time.min),
+    )
+    if user_ids is not None:
+        query = query.filter(Attendance.user_id.in_(user_ids))
+    return query.all()
+
+
+def _load_departments(db: Session, user_ids: Optional[Set[int]] = None) -> Dict[int, int]:
+    query = db.query(User.id, User.department_id)
+    if user_ids is not None:
+        query = query.filter(User.id.in_(user_ids))
+    return dict(query.all())
+
+
+def _refresh_monthly(db: Session, months: Set[Tuple[int, date]]) -> None:
+    """일별 롤업을 합산해 (직원, 월) 롤업을 다시 만든다."""
+    months = list(months)
+    for i in range(0, len(months), REFRESH_BATCH_SIZE):
+        batch = months[i:i + REFRESH_BATCH_SIZE]
+        db.execute(
+            delete(AttendanceMonthlyStat)
+            .where(tuple_(AttendanceMonthlyStat.user_id, AttendanceMonthlyStat.month).in_(batch))
+        )
+        db.execute(
+            insert(AttendanceMonthlyStat).from_select(
+                [
+                    "user_id", "month", "department_id", "days_present", "late_count",
+                    "early_leave_count", "overtime_minutes", "worked_minutes",
+                ],
+                select(
+                    AttendanceDailyStat.user_id,
+                    AttendanceDailyStat.month,
+                    func.max(AttendanceDailyStat.department_id),
+                    func.sum(AttendanceDailyStat.present),
+                    func.sum(AttendanceDailyStat.late),
+                    func.sum(AttendanceDailyStat.early_leave),
+                    func.sum(AttendanceDailyStat.overtime_minutes),
+                    func.sum(AttendanceDailyStat.worked_minutes),
+                )
+                .where(tuple_(AttendanceDailyStat.user_id, AttendanceDailyStat.month).in_(batch))
+                .group_by(AttendanceDailyStat.user_id, AttendanceDailyStat.month)
+            )
+        )
+
+
+def refresh_rollups(db: Session, keys: Iterable[Tuple[int, date]]) -> None:
+    """변경된 (user_id, date) 키의 일별/월별 롤업을 다시 계산한다. 커밋은 호출자가 한다."""
+    keys = list(set(keys))
+    if not keys:
+        return
+    db.flush()
+    for i in range(0, len(keys), REFRESH_BATCH_SIZE):
+        batch = keys[i:i + REFRESH_BATCH_SIZE]
+        key_set = set(batch)
+        user_ids = {user_id for user_id, _ in batch}
+        days = [day for _, day in batch]
+        records = [
+            record for record in _load_attendances(db, min(days), max(days), user_ids)
+            if attendance_key(record.user_id, record.date) in key_set
+        ]
+        db.execute(
+            delete(AttendanceDailyStat)
+            .where(tuple_(AttendanceDailyStat.user_id, AttendanceDailyStat.date).in_(batch))
+        )
+        rows = _daily_rows(records, _load_departments(db, user_ids))
+        if rows:
+            db.execute(insert(AttendanceDailyStat), rows)
+    _refresh_monthly(db, {(user_id, month_of(day)) for user_id, day in keys})
+
+
+def rebuild_rollups(db: Session, start: date, end: date, chunk_days: int = 7, log=None) -> int:
+    """기간 전체 롤업을 chunk_days 일 단위로 다시 만든다 (백필용). 청크마다 커밋한다."""
+    departments = _load_departments(db)
+    total = 0
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(end, chunk_start + timedelta(days=chunk_days - 1))
+        db.execute(
+            delete(AttendanceDailyStat)
+            .where(AttendanceDailyStat.date >= chunk_start, AttendanceDailyStat.date <= chunk_end)
+        )
+        rows = _daily_rows(_load_attendances(db, chunk_start, chunk_end), departments)
+        if rows:
+            db.execute(insert(AttendanceDailyStat), rows)
+        db.commit()
+        total += len(rows)
+        if log:
+            log(f"{chunk_start} ~ {chunk_end}: {len(rows)}건")
+        chunk_start = chunk_end + timedelta(days=1)
+
+    # 기간에 걸친 월 전체를 일별 롤업에서 다시 합산
+    months = {
+        (row.user_id, row.month) for row in
+        db.query(AttendanceDailyStat.user_id, AttendanceDailyStat.month)
+        .filter(AttendanceDailyStat.month >= month_of(start), AttendanceDailyStat.month <= month_of(end))
+        .distinct()
+    }
+    db.execute(
+        delete(AttendanceMonthlyStat)
+        .where(AttendanceMonthlyStat.month >= month_of(start), AttendanceMonthlyStat.month <= month_of(end))
+    )
+    _refresh_monthly(db, months)
+    db.commit()
+    return total
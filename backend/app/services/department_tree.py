@@ -0,0 +1,156 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models import Department, Position, User
+import hashlib
+import json
+import os
+import threading
+import time
+
+# 조직도(부서 트리) 캐시
+#  - 부서 구조 + 부서별 인원수를 한 번의 쿼리로 읽어 보관
+#  - 부서 생성/수정/삭제 시 노드 단위로 패치, 직원 변경 시에는 전체 무효화
+#  - 렌더링 결과와 ETag(본문 해시)를 include_members 별로 보관
+#  - 다른 프로세스(워커)의 변경은 TTL 로 반영
+
+DEPARTMENT_TREE_CACHE_TTL_SECONDS = float(os.getenv("DEPARTMENT_TREE_CACHE_TTL_SECONDS", "300"))
+
+
+class DepartmentTreeCache:
+    def __init__(self, ttl: float = DEPARTMENT_TREE_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._nodes: Optional[Dict[int, dict]] = None
+        self._members: Optional[Dict[int, List[dict]]] = None
+        self._rendered: Dict[bool, Tuple[str, bytes]] = {}
+        self._generation = 0
+        self._expires_at = 0.0
+
+    async def _load_nodes(self, db: AsyncSession) -> Dict[int, dict]:
+        headcounts = (
+            select(User.department_id.label("department_id"), func.count(User.id).label("headcount"))
+            .where(User.is_active.is_(True))
+            .group_by(User.department_id)
+            .subquery()
+        )
+        rows = (await db.execute(
+            select(Department.id, Department.code, Department.name, Department.parent_id, headcounts.c.headcount)
+            .outerjoin(headcounts, headcounts.c.department_id == Department.id)
+        )).all()
+        return {
+            row.id: {
+                "id": row.id,
+                "code": row.code,
+                "name": row.name,
+                "parent_id": row.parent_id,
+                "headcount": row.headcount or 0,
+            }
+            for row in rows
+        }
+
+    async def _load_members(self, db: AsyncSession) -> Dict[int, List[dict]]:
+        rows = (await db.execute(
+            select(User.id, User.name_kr, User.department_id, Position.name, Position.level)
+            .join(Position, User.position_id == Position.id)
+            .where(User.is_active.is_(True))
+            .order_by(Position.level, User.name_kr)
+        )).all()
+        members = defaultdict(list)
+        for row in rows:
+            members[row.department_id].append({
+                "id": row.id,
+                "name_kr": row.name_kr,
+                "position": row[3],
+                "position_level": row.level,
+            })
+        return dict(members)
+
+    async def get(self, db: AsyncSession, include_members: bool) -> Tuple[str, bytes]:
+        if self._nodes is not None and time.monotonic() >= self._expires_at:
+            self.invalidate()
+        rendered = self._rendered.get(include_members)
+        if rendered is not None:
+            return rendered
+        generation = self._generation
+        nodes = self._nodes if self._nodes is not None else await self._load_nodes(db)
+        members = None
+        if include_members:
+            members = self._members if self._members is not None else await self._load_members(db)
+        with self._lock:
+            # 읽는 도중 무효화되었다면 결과를 캐시하지 않는다
+            if generation != self._generation:
+                return self._render(nodes, members)
+            if self._nodes is None:
+                self._nodes = nodes
+                self._expires_at = time.monotonic() + self.ttl
+            if include_members and self._members is None:
+                self._members = members
+            rendered = self._render(self._nodes, self._members if include_members else None)
+            self._rendered[include_members] = rendered
+            return rendered
+
+    @staticmethod
+    def _render(nodes: Dict[int, dict], members: Optional[Dict[int, List[dict]]]) -> Tuple[str, bytes]:
+        children = defaultdict(list)
+        roots = []
+        for node in sorted(nodes.values(), key=lambda n: n["id"]):
+            if node["parent_id"] in nodes:
+                children[node["parent_id"]].append(node["id"])
+            else:
+                roots.append(node["id"])
+
+        def build(dept_id: int) -> dict:
+            node = nodes[dept_id]
+            child_nodes = [build(child_id) for child_id in children[dept_id]]
+            result = {
+                "id": node["id"],
+                "code": node["code"],
+                "name": node["name"],
+                "parent_id": node["parent_id"],
+                "headcount": node["headcount"],
+                "total_headcount": node["headcount"] + sum(child["total_headcount"] for child in child_nodes),
+                "children": child_nodes,
+            }
+            if members is not None:
+                result["members"] = members.get(dept_id, [])
+            return result
+
+        body = json.dumps([build(root_id) for root_id in roots], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return '"' + hashlib.sha1(body).hexdigest() + '"', body
+
+    # 부서 라우터에서 커밋 후 호출하는 패치 훅
+    def upsert_department(self, department: Department) -> None:
+        with self._lock:
+            if self._nodes is not None:
+                existing = self._nodes.get(department.id)
+                self._nodes[department.id] = {
+                    "id": department.id,
+                    "code": department.code,
+                    "name": department.name,
+                    "parent_id": department.parent_id,
+                    "headcount": existing["headcount"] if existing else 0,
+                }
+            self._generation += 1
+            self._rendered.clear()
+
+    def remove_department(self, department_id: int) -> None:
+        with self._lock:
+            if self._nodes is not None:
+                self._nodes.pop(department_id, None)
+            if self._members is not None:
+                self._members.pop(department_id, None)
+            self._generation += 1
+            self._rendered.clear()
+
+    def invalidate(self) -> None:
+        """직원 소속/직급/재직 여부가 바뀌면 인원수와 구성원을 다시 읽는다."""
+        with self._lock:
+            self._nodes = None
+            self._members = None
+            self._generation += 1
+            self._rendered.clear()
+
+
+department_tree = DepartmentTreeCache()
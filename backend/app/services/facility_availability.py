@@ -0,0 +1,141 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.db.models import Reservation
+from app.services.reservations import CANCELLED
+from datetime import date, datetime, time as dtime, timedelta
+import os
+import threading
+import time
+
+# 시설 예약 현황 격자 (예약 캘린더)
+#  - (시설, 날짜) 별로 그 날의 점유 구간을 캐시 → 슬롯 크기(15/30분 등)와 무관하게 재사용
+#  - 캐시에 없는 날짜들은 reservations 범위 조회 한 번으로 모두 채운다
+#  - 예약 생성/승인/취소/수정 시 해당 (시설, 날짜) 만 invalidate(), 다른 프로세스의 변경은 TTL 로 반영
+#  - 격자는 슬롯 상태의 run-length 인코딩: [[상태, 슬롯 수], ...]
+
+FACILITY_AVAILABILITY_CACHE_TTL_SECONDS = float(os.getenv("FACILITY_AVAILABILITY_CACHE_TTL_SECONDS", "60"))
+FACILITY_AVAILABILITY_CACHE_MAX_ENTRIES = 20000
+
+# 슬롯 상태 — 한 슬롯에 여러 예약이 걸치면 큰 값
+FREE = 0
+PENDING = 1
+APPROVED = 2
+STATES = {"예약": PENDING, "승인": APPROVED}
+
+# (시작, 종료, 상태) — 하루 범위로 잘라 시작 시각 순
+Occupancy = List[Tuple[datetime, datetime, int]]
+
+
+def _days(start: datetime, end: datetime) -> Iterable[date]:
+    day = start.date()
+    while datetime.combine(day, dtime.min) < end:
+        yield day
+        day += timedelta(days=1)
+
+
+def load_occupancy(db: Session, facility_ids: Sequence[int], days: Sequence[date]) -> Dict[Tuple[int, date], Occupancy]:
+    """시설들의 날짜별 점유 구간 (reservations 범위 조회 한 번)"""
+    range_start = datetime.combine(min(days), dtime.min)
+    range_end = datetime.combine(max(days), dtime.min) + timedelta(days=1)
+    wanted = set(days)
+    occupancy: Dict[Tuple[int, date], Occupancy] = {
+        (facility_id, day): [] for facility_id in facility_ids for day in days
+    }
+    rows = db.execute(
+        select(Reservation.facility_id, Reservation.start_time, Reservation.end_time, Reservation.status)
+        .where(
+            Reservation.facility_id.in_(list(facility_ids)),
+            Reservation.start_time < range_end,
+            Reservation.end_time > range_start,
+            Reservation.status != CANCELLED,
+        )
+        .order_by(Reservation.start_time)
+    )
+    for row in rows:
+        state = STATES.get(row.status, PENDING)
+        for day in _days(max(row.start_time, range_start), min(row.end_time, range_end)):
+            if day not in wanted:
+                continue
+            day_start = datetime.combine(day, dtime.min)
+            occupancy[(row.facility_id, day)].append(
+                (max(row.start_time, day_start), min(row.end_time, day_start + timedelta(days=1)), state)
+            )
+    return occupancy
+
+
+def encode_day(day: date, occupancy: Occupancy, slot: timedelta) -> List[List[int]]:
+    """하루를 slot 단위로 나눈 상태를 run-length 인코딩 — 슬롯에 조금이라도 걸치면 점유"""
+    slots = [FREE] * (timedelta(days=1) // slot)
+    day_start = datetime.combine(day, dtime.min)
+    for start, end, state in occupancy:
+        first = (start - day_start) // slot
+        last = -((day_start - end) // slot)  # 올림
+        for index in range(first, min(last, len(slots))):
+            if state > slots[index]:
+                slots[index] = state
+    runs: List[List[int]] = []
+    for state in slots:
+        if runs and runs[-1][0] == state:
+            runs[-1][1] += 1
+        else:
+            runs.append([state, 1])
+    return runs
+
+
+class FacilityAvailabilityCache:
+    def __init__(self, ttl: float = FACILITY_AVAILABILITY_CACHE_TTL_SECONDS, max_entries: int = FACILITY_AVAILABILITY_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[int, date], Tuple[float, Occupancy]] = {}
+        self._generation = 0
+
+    def get(self, db: Session, facility_ids: Sequence[int], days: Sequence[date]) -> Dict[Tuple[int, date], Occupancy]:
+        now = time.monotonic()
+        found: Dict[Tuple[int, date], Occupancy] = {}
+        missing_facilities, missing_days = set(), set()
+        with self._lock:
+            for facility_id in facility_ids:
+                for day in days:
+                    entry = self._entries.get((facility_id, day))
+                    if entry is not None and entry[0] > now:
+                        found[(facility_id, day)] = entry[1]
+                    else:
+                        missing_facilities.add(facility_id)
+                        missing_days.add(day)
+            generation = self._generation
+        if not missing_facilities:
+            return found
+
+        loaded = load_occupancy(db, sorted(missing_facilities), sorted(missing_days))
+        with self._lock:
+            # 조회 도중 무효화되었다면 오래된 결과를 넣지 않는다
+            if generation == self._generation:
+                self._entries.update((key, (now + self.ttl, value)) for key, value in loaded.items())
+                self._evict(now)
+        loaded.update(found)
+        return loaded
+
+    def _evict(self, now: float) -> None:
+        if len(self._entries) <= self.max_entries:
+            return
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        # 그래도 많으면 먼저 넣은 것부터
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, facility_id: Optional[int] = None, intervals: Iterable[Tuple[datetime, datetime]] = ()) -> None:
+        """facility_id 가 없으면 전체, 있으면 intervals 가 걸친 날짜만"""
+        with self._lock:
+            if facility_id is None:
+                self._entries.clear()
+            else:
+                for start, end in intervals:
+                    for day in _days(start, end):
+                        self._entries.pop((facility_id, day), None)
+            self._generation += 1
+
+
+facility_availability = FacilityAvailabilityCache()
@@ -0,0 +1,250 @@
+"""알림 outbox 디스패처
+
+notification_outbox 의 pending 행을 묶어서 채널별로 발송한다.
+  - inapp: notifications 테이블에 한 번의 INSERT (outbox 상태 변경과 같은 트랜잭션이라 중복 없음),
+    커밋되면 실시간 스트림 구독자에게 전달
+  - email: SMTP 연결 하나로 배치 전체를 보낸다 (SMTP_HOST 가 설정된 경우에만 등록)
+실패한 행은 지수 백오프로 다시 시도하고, 한도를 넘기거나 재시도해도 소용없는 오류는 failed 로 남긴다.
+PostgreSQL 에서는 FOR UPDATE SKIP LOCKED 로 행을 가져가므로 여러 워커를 함께 띄울 수 있다.
+
+앱 프로세스 안에서 asyncio 태스크로 돌거나 (NOTIFICATION_DISPATCHER=1, 기본값),
+별도 프로세스로 실행한다.
+
+    python -m app.services.notification_dispatcher
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from email.message import EmailMessage
+from typing import Dict, List, Optional
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.db.models import Notification, NotificationOutbox, User
+from app.services.notification_hub import notification_event, publish_on_commit
+from app.services.notifications import on_enqueued_commit
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import os
+import smtplib
+
+NOTIFICATION_DISPATCHER = os.getenv("NOTIFICATION_DISPATCHER", "1").lower() in ("1", "true", "yes")
+NOTIFICATION_POLL_SECONDS = float(os.getenv("NOTIFICATION_POLL_SECONDS", "5"))
+NOTIFICATION_BATCH_SIZE = int(os.getenv("NOTIFICATION_BATCH_SIZE", "200"))
+NOTIFICATION_MAX_ATTEMPTS = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "8"))
+NOTIFICATION_RETRY_BASE_SECONDS = float(os.getenv("NOTIFICATION_RETRY_BASE_SECONDS", "5"))
+NOTIFICATION_RETRY_MAX_SECONDS = float(os.getenv("NOTIFICATION_RETRY_MAX_SECONDS", "600"))
+
+SMTP_HOST = os.getenv("SMTP_HOST")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "25"))
+SMTP_FROM = os.getenv("SMTP_FROM", "intranet@adchemto.local")
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "10"))
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeliveryError:
+    message: str
+    retry: bool = True
+
+
+class InAppChannel:
+    name = "inapp"
+
+    def deliver(self, db: Session, rows: List[NotificationOutbox]) -> Dict[int, Optional[DeliveryError]]:
+        created = db.execute(
+            insert(Notification).returning(
+                Notification.id, Notification.user_id, Notification.type, Notification.title,
+                Notification.content, Notification.created_at,
+            ),
+            [
+                {
+                    "user_id": row.user_id, "type": row.type, "title": row.title, "content": row.content,
+                    "is_read": False, "created_at": row.created_at,
+                }
+                for row in rows
+            ],
+        ).all()
+        # 커밋되면 /notifications/stream 구독자에게 바로 전달
+        publish_on_commit(db, [notification_event(row) for row in created])
+        return {row.id: None for row in rows}
+
+
+class EmailChannel:
+    name = "email"
+
+    def __init__(self, host: str, port: int = 25, sender: str = SMTP_FROM, timeout: float = SMTP_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.timeout = timeout
+
+    def deliver(self, db: Session, rows: List[NotificationOutbox]) -> Dict[int, Optional[DeliveryError]]:
+        addresses = dict(db.execute(
+            select(User.id, User.email).where(User.id.in_({row.user_id for row in rows}))
+        ).all())
+        results: Dict[int, Optional[DeliveryError]] = {}
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+                for row in rows:
+                    address = addresses.get(row.user_id)
+                    if not address:
+                        results[row.id] = DeliveryError("이메일 주소가 없습니다.", retry=False)
+                        continue
+                    message = EmailMessage()
+                    message["From"] = self.sender
+                    message["To"] = address
+                    message["Subject"] = f"[{row.type}] {row.title}"
+                    message.set_content(row.content)
+                    try:
+                        smtp.send_message(message)
+                        results[row.id] = None
+                    except smtplib.SMTPRecipientsRefused as exc:
+                        # 4xx (일시 거부) 만이면 나중에 다시 보낸다
+                        codes = [code for code, _ in exc.recipients.values()]
+                        results[row.id] = DeliveryError(str(exc), retry=all(code < 500 for code in codes))
+                    except smtplib.SMTPResponseException as exc:
+                        # 5xx 는 다시 보내도 같은 결과
+                        results[row.id] = DeliveryError(f"{exc.smtp_code} {exc.smtp_error!r}", retry=exc.smtp_code < 500)
+        except (smtplib.SMTPException, OSError) as exc:
+            # 연결 실패/중간 끊김: 이미 보낸 행은 그대로 두고 아직 못 보낸 행만 다시 시도 (중복 발송 방지)
+            error = DeliveryError(f"{type(exc).__name__}: {exc}")
+            for row in rows:
+                results.setdefault(row.id, error)
+        return results
+
+
+channels: Dict[str, object] = {InAppChannel.name: InAppChannel()}
+if SMTP_HOST:
+    channels[EmailChannel.name] = EmailChannel(SMTP_HOST, SMTP_PORT)
+
+
+def register_channel(channel) -> None:
+    """name 속성과 deliver(db, rows) -> {outbox id: DeliveryError | None} 를 가진 채널 등록"""
+    channels[channel.name] = channel
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(NOTIFICATION_RETRY_MAX_SECONDS, NOTIFICATION_RETRY_BASE_SECONDS * 2 ** (attempts - 1)))
+
+
+def dispatch_batch(db: Session, limit: int = NOTIFICATION_BATCH_SIZE) -> int:
+    """발송할 차례인 outbox 행을 최대 limit 건 처리하고 커밋한다. 처리한 건수를 돌려준다."""
+    now = datetime.utcnow()
+    rows = (
+        db.query(NotificationOutbox)
+        .filter(NotificationOutbox.status == "pending", NotificationOutbox.next_attempt_at <= now)
+        .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not rows:
+        db.rollback()
+        return 0
+
+    by_channel = defaultdict(list)
+    for row in rows:
+        by_channel[row.channel].append(row)
+
+    for name, group in by_channel.items():
+        channel = channels.get(name)
+        if channel is None:
+            results = {row.id: DeliveryError(f"알 수 없는 알림 채널입니다: {name}", retry=False) for row in group}
+        else:
+            try:
+                # 채널 실패 시 그 채널이 쓴 내용만 되돌린다
+                with db.begin_nested():
+                    results = channel.deliver(db, group)
+            except Exception as exc:
+                results = {row.id: DeliveryError(f"{type(exc).__name__}: {exc}") for row in group}
+
+        for row in group:
+            error = results.get(row.id, DeliveryError("발송 결과가 없습니다."))
+            row.attempts += 1
+            if error is None:
+                row.status = "sent"
+                row.sent_at = now
+                row.last_error = None
+            elif not error.retry or row.attempts >= NOTIFICATION_MAX_ATTEMPTS:
+                row.status = "failed"
+                row.last_error = error.message
+            else:
+                row.next_attempt_at = now + retry_delay(row.attempts)
+                row.last_error = error.message
+    db.commit()
+    return len(rows)
+
+
+class NotificationDispatcher:
+    def __init__(self, interval: float = NOTIFICATION_POLL_SECONDS, batch_size: int = NOTIFICATION_BATCH_SIZE):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def dispatch_once(self) -> int:
+        db = SessionLocal()
+        try:
+            return dispatch_batch(db, self.batch_size)
+        finally:
+            db.close()
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    def wake(self) -> None:
+        """outbox 커밋 직후 호출 (어느 스레드에서든)"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                processed = await asyncio.to_thread(self.dispatch_once)
+            except Exception:
+                logger.exception("알림 발송 중 오류")
+                processed = 0
+            if processed >= self.batch_size:
+                # 더 남아 있을 수 있으므로 바로 다음 배치
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
+        # 종료 직전에 쌓인 알림을 한 번 더 보낸다
+        await asyncio.to_thread(self.dispatch_once)
+
+
+notification_dispatcher = NotificationDispatcher()
+on_enqueued_commit(notification_dispatcher.wake)
+
+
+async def _main() -> None:
+    notification_dispatcher.start()
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_main())
+    except KeyboardInterrupt:
+        pass
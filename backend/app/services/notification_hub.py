@@ -0,0 +1,171 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.db.database import ASYNC_DATABASE_URL
+import asyncio
+import json
+import logging
+import os
+
+# 실시간 알림 허브 (/notifications/stream)
+#  - 사용자별 구독 목록에 크기가 정해진 큐를 하나씩 두고 fan-out, 클라이언트별 DB 폴링 없음
+#  - 큐가 가득 찬 느린 구독자는 overflowed 로 표시 → 스트림이 resync 를 보내고 끊는다
+#    (EventSource 가 다시 연결한 뒤 목록 API 로 다시 읽는다)
+#  - 발행: notifications 에 쓴 트랜잭션이 커밋될 때
+#      PostgreSQL  → 같은 트랜잭션에서 pg_notify, 각 앱 프로세스의 LISTEN 연결이 허브로 전달
+#      그 외(SQLite) → 커밋 직후 같은 프로세스의 허브로 바로 전달
+
+NOTIFICATION_STREAM_QUEUE_SIZE = int(os.getenv("NOTIFICATION_STREAM_QUEUE_SIZE", "100"))
+NOTIFICATION_PG_CHANNEL = "notifications"
+# pg_notify payload 한도(8000 bytes) 안에 들도록 본문을 자른다
+PAYLOAD_CONTENT_LENGTH = 1000
+
+logger = logging.getLogger(__name__)
+
+_PUBLISH_KEY = "notification_hub_events"
+
+
+class Subscription:
+    def __init__(self, user_id: int, maxsize: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+
+class NotificationHub:
+    def __init__(self, queue_size: int = NOTIFICATION_STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[Subscription]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped = 0
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+    def bind_loop(self) -> None:
+        self._loop = asyncio.get_running_loop()
+
+    def subscribe(self, user_id: int) -> Subscription:
+        self.bind_loop()
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscribers.get(subscription.user_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscribers[subscription.user_id]
+
+    def publish(self, events: List[dict]) -> None:
+        """이벤트 루프 스레드에서 호출"""
+        for item in events:
+            for subscription in self._subscribers.get(item["user_id"], ()):
+                if subscription.overflowed:
+                    continue
+                try:
+                    subscription.queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    subscription.overflowed = True
+                    self.dropped += 1
+
+    def publish_threadsafe(self, events: List[dict]) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.publish, events)
+
+
+notification_hub = NotificationHub()
+
+
+def notification_event(row) -> dict:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "type": row.type,
+        "title": row.title,
+        "content": row.content[:PAYLOAD_CONTENT_LENGTH],
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def publish_on_commit(db: Session, events: List[dict]) -> None:
+    """notifications 에 쓴 행을 트랜잭션이 커밋될 때 구독자에게 보낸다."""
+    if not events:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        # NOTIFY 는 커밋 시점에 전달되고 롤백되면 사라진다
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            [{"channel": NOTIFICATION_PG_CHANNEL, "payload": json.dumps(item, ensure_ascii=False)} for item in events],
+        )
+    else:
+        db.info.setdefault(_PUBLISH_KEY, []).extend(events)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    events = session.info.pop(_PUBLISH_KEY, None)
+    if events:
+        notification_hub.publish_threadsafe(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_uncommitted(session: Session) -> None:
+    session.info.pop(_PUBLISH_KEY, None)
+
+
+class PgNotificationListener:
+    """LISTEN notifications 를 유지하며 받은 이벤트를 허브로 넘긴다 (끊기면 재연결)."""
+
+    def __init__(self, dsn: str, reconnect_seconds: float = 5):
+        self.dsn = dsn
+        self.reconnect_seconds = reconnect_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        notification_hub.bind_loop()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            notification_hub.publish([json.loads(payload)])
+        except ValueError:
+            logger.warning("잘못된 알림 payload: %r", payload)
+
+    async def _run(self) -> None:
+        import asyncpg
+
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(NOTIFICATION_PG_CHANNEL, self._on_notify)
+                try:
+                    await closed.wait()
+                finally:
+                    await connection.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("알림 LISTEN 연결 실패, %s초 후 재시도", self.reconnect_seconds)
+            await asyncio.sleep(self.reconnect_seconds)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def pg_listener() -> Optional[PgNotificationListener]:
+    if not ASYNC_DATABASE_URL.startswith("postgresql"):
+        return None
+    return PgNotificationListener("postgresql://" + ASYNC_DATABASE_URL.split("://", 1)[1])
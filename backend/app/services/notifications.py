@@ -0,0 +1,58 @@
+from typing import Iterable, List, Optional
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+from app.db.models import NotificationOutbox
+from datetime import datetime
+import os
+
+# 알림 발송 (transactional outbox)
+#  - 업무 변경과 같은 트랜잭션에서 notification_outbox 에 채널별 행을 쓰기만 한다
+#    → 업무 트랜잭션이 롤백되면 알림도 사라지고, 커밋되면 반드시 발송된다
+#  - 실제 발송(notifications 저장, 메일 등)은 notification_dispatcher 가 묶어서 처리
+#  - 커밋 직후 같은 프로세스의 디스패처를 깨워 폴링 주기를 기다리지 않게 한다
+
+NOTIFICATION_CHANNELS = [
+    channel.strip() for channel in os.getenv("NOTIFICATION_CHANNELS", "inapp").split(",") if channel.strip()
+]
+
+_WAKE_KEY = "notification_outbox_pending"
+_wake_callbacks = []
+
+
+def enqueue_notifications(db: Session, notifications: Iterable[dict], channels: Optional[List[str]] = None) -> int:
+    """{user_id, type, title, content} 목록을 outbox 에 넣는다. 커밋은 호출자가 한다."""
+    channels = channels or NOTIFICATION_CHANNELS
+    now = datetime.utcnow()
+    rows = [
+        {
+            **notification, "channel": channel, "status": "pending", "attempts": 0,
+            "next_attempt_at": now, "created_at": now,
+        }
+        for notification in notifications
+        for channel in channels
+    ]
+    if rows:
+        db.execute(insert(NotificationOutbox), rows)
+        db.info[_WAKE_KEY] = True
+    return len(rows)
+
+
+def enqueue_notification(db: Session, user_id: int, type: str, title: str, content: str) -> int:
+    return enqueue_notifications(db, [{"user_id": user_id, "type": type, "title": title, "content": content}])
+
+
+def on_enqueued_commit(callback) -> None:
+    """outbox 에 행을 넣은 트랜잭션이 커밋되면 호출할 콜백 등록 (디스패처 깨우기)"""
+    _wake_callbacks.append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher(session: Session) -> None:
+    if session.info.pop(_WAKE_KEY, False):
+        for callback in _wake_callbacks:
+            callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_wake(session: Session) -> None:
+    session.info.pop(_WAKE_KEY, None)
@@ -0,0 +1,116 @@
+from typing import List, Optional
+from sqlalchemy import delete, exists, insert, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from app.db.models import DepartmentClosure
+
+# 부서 계층 조회/유지 헬퍼 (department_closure 기반)
+#  - 조회 헬퍼는 한 번의 인덱스 조회로 끝나며, *_ids() 는 다른 쿼리의
+#    IN (...) / JOIN 에 그대로 넣을 수 있는 SELECT 를 돌려준다.
+#  - 유지 함수는 부서 라우터가 같은 트랜잭션 안에서 호출한다.
+
+REBUILD_CLOSURE_SQL = """
+WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0 FROM departments
+    UNION ALL
+    SELECT tree.ancestor_id, departments.id, tree.depth + 1
+    FROM tree JOIN departments ON departments.parent_id = tree.descendant_id
+    WHERE tree.depth < 64
+)
+INSERT INTO department_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth FROM tree
+"""
+
+
+def descendant_ids(dept_id: int, include_self: bool = True):
+    stmt = select(DepartmentClosure.descendant_id).where(DepartmentClosure.ancestor_id == dept_id)
+    if not include_self:
+        stmt = stmt.where(DepartmentClosure.depth > 0)
+    return stmt
+
+
+def ancestor_ids(dept_id: int, include_self: bool = True):
+    # 가까운 상위 부서부터 (depth 오름차순)
+    stmt = (
+        select(DepartmentClosure.ancestor_id)
+        .where(DepartmentClosure.descendant_id == dept_id)
+        .order_by(DepartmentClosure.depth)
+    )
+    if not include_self:
+        stmt = stmt.where(DepartmentClosure.depth > 0)
+    return stmt
+
+
+def is_under_clause(dept_id, ancestor_id):
+    """dept_id 가 ancestor_id 와 같거나 그 하위 부서이면 참인 EXISTS 절"""
+    return exists().where(
+        DepartmentClosure.ancestor_id == ancestor_id,
+        DepartmentClosure.descendant_id == dept_id,
+    )
+
+
+async def descendants(db: AsyncSession, dept_id: int, include_self: bool = True) -> List[int]:
+    return list((await db.scalars(descendant_ids(dept_id, include_self))).all())
+
+
+async def ancestors(db: AsyncSession, dept_id: int, include_self: bool = True) -> List[int]:
+    return list((await db.scalars(ancestor_ids(dept_id, include_self))).all())
+
+
+async def is_under(db: AsyncSession, dept_id: int, ancestor_id: int) -> bool:
+    return bool(await db.scalar(select(is_under_clause(dept_id, ancestor_id))))
+
+
+async def lock_hierarchy(db: AsyncSession) -> None:
+    # 동시 이동으로 순환이 생기지 않도록 구조 변경을 트랜잭션 단위로 직렬화 (PostgreSQL)
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(text("SELECT pg_advisory_xact_lock(hashtext('department_closure'))"))
+
+
+async def add_department(db: AsyncSession, dept_id: int, parent_id: Optional[int]) -> None:
+    await db.execute(insert(DepartmentClosure).values(ancestor_id=dept_id, descendant_id=dept_id, depth=0))
+    if parent_id is not None:
+        await db.execute(
+            insert(DepartmentClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(DepartmentClosure.ancestor_id, literal(dept_id), DepartmentClosure.depth + 1)
+                .where(DepartmentClosure.descendant_id == parent_id),
+            )
+        )
+
+
+async def move_department(db: AsyncSession, dept_id: int, new_parent_id: Optional[int]) -> None:
+    """dept_id 서브트리를 new_parent_id 아래로 옮긴다 (순환 여부는 호출 전에 확인)"""
+    subtree = descendant_ids(dept_id)
+    # 1) 서브트리 밖의 조상 → 서브트리 링크 제거
+    await db.execute(
+        delete(DepartmentClosure).where(
+            DepartmentClosure.descendant_id.in_(subtree),
+            DepartmentClosure.ancestor_id.not_in(subtree),
+        ).execution_options(synchronize_session=False)
+    )
+    # 2) 새 상위 부서의 조상들 × 서브트리 노드
+    if new_parent_id is not None:
+        above = aliased(DepartmentClosure)
+        below = aliased(DepartmentClosure)
+        await db.execute(
+            insert(DepartmentClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+                .where(above.descendant_id == new_parent_id, below.ancestor_id == dept_id),
+            )
+        )
+
+
+async def remove_department(db: AsyncSession, dept_id: int) -> None:
+    await db.execute(
+        delete(DepartmentClosure).where(
+            (DepartmentClosure.descendant_id == dept_id) | (DepartmentClosure.ancestor_id == dept_id)
+        ).execution_options(synchronize_session=False)
+    )
+
+
+def rebuild_closure(db) -> None:
+    """parent_id 로부터 closure 를 다시 만든다 (시드/마이그레이션용, Session 또는 Connection)"""
+    db.execute(text("DELETE FROM department_closure"))
+    db.execute(text(REBUILD_CLOSURE_SQL))
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import asyncio
+import os
+import threading
+import bcrypt
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_POOL_MAX_QUEUE = int(os.getenv("PASSWORD_POOL_MAX_QUEUE", "32"))
+PASSWORD_POOL_RETRY_AFTER = int(os.getenv("PASSWORD_POOL_RETRY_AFTER", "1"))
+
+
+class PasswordPoolSaturated(Exception):
+    """해시 작업 대기열이 가득 차 즉시 거절해야 하는 경우"""
+
+    def __init__(self, retry_after: int = PASSWORD_POOL_RETRY_AFTER):
+        super().__init__("password pool saturated")
+        self.retry_after = retry_after
+
+
+class PasswordPool:
+    """bcrypt 연산을 이벤트 루프 밖의 고정 크기 스레드 풀에서 실행한다.
+
+    실행 중 + 대기 중인 작업 수가 workers + max_queue 를 넘으면
+    작업을 쌓지 않고 PasswordPoolSaturated 를 발생시킨다.
+    """
+
+    def __init__(self, workers: int = PASSWORD_POOL_WORKERS, max_queue: int = PASSWORD_POOL_MAX_QUEUE):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+
+    async def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolSaturated()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._slots.release()
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(hash_password_sync, password)
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password_sync, password, hashed_password)
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        """일괄 등록용: 풀이 가득 차면 로그인 요청에 자리를 양보하며 기다린다."""
+        results: List[str] = [""] * len(passwords)
+        window = asyncio.Semaphore(self.workers)
+
+        async def hash_one(index: int, password: str) -> None:
+            async with window:
+                while True:
+                    try:
+                        results[index] = await self.hash_password(password)
+                        return
+                    except PasswordPoolSaturated:
+                        await asyncio.sleep(0.05)
+
+        await asyncio.gather(*(hash_one(i, password) for i, password in enumerate(passwords)))
+        return results
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+def hash_password_sync(password: str) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+
+def verify_password_sync(password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+    except ValueError:
+        # 잘못된 형식의 해시는 불일치로 처리
+        return False
+
+
+password_pool = PasswordPool()
@@ -0,0 +1,338 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.db.models import Comment, Post, User
+import html
+import math
+import re
+import threading
+
+# 게시글/댓글 검색 인덱스
+#  - PostgreSQL: post_search_documents(tsvector, GIN) 테이블을 같은 트랜잭션에서 갱신
+#  - 그 외(SQLite 테스트 등): 프로세스 내 역색인 — 변경은 세션에 모아 두었다가 커밋된 뒤에만 반영
+#    (롤백되면 버린다)
+
+_WORD_RE = re.compile(r"[0-9a-z]+|[가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+_PENDING_KEY = "post_search_pending"
+
+# 제목/본문/댓글 가중치 (tsvector setweight A/B/C 와 동일한 비율)
+FIELD_WEIGHTS = {"title": 1.0, "content": 0.4, "comments": 0.2}
+
+
+def tokenize(value: Optional[str], unigrams: bool = False) -> List[str]:
+    """한글은 음절 bigram, 영문/숫자는 단어 단위로 토큰화한다.
+
+    색인 시에는 unigrams=True 로 한글 음절 단위 토큰도 함께 넣어
+    한 글자 검색어("팀")도 찾을 수 있게 한다.
+    """
+    tokens = []
+    for match in _WORD_RE.finditer((value or "").lower()):
+        word = match.group()
+        if _HANGUL_RE.match(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+            if unigrams:
+                tokens.extend(word)
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _query_terms(query: str) -> List[str]:
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def _match_spans(value: str, query: str) -> List[Tuple[int, int]]:
+    lowered = value.lower()
+    spans = []
+    for needle in _query_terms(query):
+        start = lowered.find(needle)
+        while start != -1:
+            spans.append((start, start + len(needle)))
+            start = lowered.find(needle, start + 1)
+    return sorted(spans)
+
+
+def _mark(value: str, spans: List[Tuple[int, int]], window_start: int, window_end: int) -> str:
+    """value[window_start:window_end] 를 이스케이프하고 spans 를 <mark> 로 감싼다."""
+    merged = []
+    for start, end in spans:
+        if start >= window_end or end <= window_start:
+            continue
+        start, end = max(start, window_start), min(end, window_end)
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    parts = []
+    cursor = window_start
+    for start, end in merged:
+        parts.append(html.escape(value[cursor:start]))
+        parts.append("<mark>" + html.escape(value[start:end]) + "</mark>")
+        cursor = end
+    parts.append(html.escape(value[cursor:window_end]))
+    return "".join(parts)
+
+
+def highlight(value: Optional[str], query: str) -> str:
+    """전체 문자열에서 검색어를 <mark> 로 강조한다 (제목용, 자르지 않음)."""
+    value = value or ""
+    return _mark(value, _match_spans(value, query), 0, len(value))
+
+
+def make_snippet(value: Optional[str], query: str, width: int = 120) -> str:
+    """검색어가 처음 등장하는 위치 주변을 잘라 <mark> 로 강조한다."""
+    value = value or ""
+    spans = _match_spans(value, query)
+    if not spans:
+        return html.escape(value[:width]) + ("…" if len(value) > width else "")
+
+    window_start = max(0, spans[0][0] - width // 3)
+    window_end = min(len(value), window_start + width)
+    return (
+        ("…" if window_start > 0 else "")
+        + _mark(value, spans, window_start, window_end)
+        + ("…" if window_end < len(value) else "")
+    )
+
+
+def _load_documents(db: Session, post_ids: Optional[List[int]] = None) -> List[dict]:
+    query = db.query(Post.id, Post.board_id, Post.title, Post.content)
+    comment_query = db.query(Comment.post_id, Comment.content)
+    if post_ids is not None:
+        query = query.filter(Post.id.in_(post_ids))
+        comment_query = comment_query.filter(Comment.post_id.in_(post_ids))
+    comments = defaultdict(list)
+    for post_id, content in comment_query.all():
+        comments[post_id].append(content)
+    return [
+        {
+            "id": row.id,
+            "board_id": row.board_id,
+            "title": row.title,
+            "content": row.content,
+            "comments": "\n".join(comments.get(row.id, [])),
+        }
+        for row in query.all()
+    ]
+
+
+class InMemoryPostIndex:
+    """SQLite 테스트 환경용 프로세스 내 역색인 (첫 검색 시 DB 에서 적재)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._doc_terms: Dict[int, Set[str]] = {}
+        self._doc_board: Dict[int, int] = {}
+
+    def _add(self, doc: dict) -> None:
+        self._remove(doc["id"])
+        weights: Dict[str, float] = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(doc[field], unigrams=True):
+                weights[token] += weight
+        for token, weight in weights.items():
+            self._postings[token][doc["id"]] = weight
+        self._doc_terms[doc["id"]] = set(weights)
+        self._doc_board[doc["id"]] = doc["board_id"]
+
+    def _remove(self, post_id: int) -> None:
+        for token in self._doc_terms.pop(post_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(post_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._doc_board.pop(post_id, None)
+
+    def ensure_loaded(self, db: Session) -> None:
+        if self._loaded:
+            return
+        documents = _load_documents(db)
+        with self._lock:
+            if not self._loaded:
+                for doc in documents:
+                    self._add(doc)
+                self._loaded = True
+
+    def stage(self, db: Session, post_id: int, removed: bool = False) -> None:
+        """현재 트랜잭션의 문서를 읽어 두고, 커밋되면 apply() 로 반영한다."""
+        if not self._loaded:
+            # 아직 적재 전이면 첫 검색 때 커밋된 내용을 읽는다
+            return
+        documents = [] if removed else _load_documents(db, [post_id])
+        db.info.setdefault(_PENDING_KEY, {})[post_id] = documents[0] if documents else None
+
+    def apply(self, changes: Dict[int, Optional[dict]]) -> None:
+        with self._lock:
+            if not self._loaded:
+                return
+            for post_id, doc in changes.items():
+                if doc is None:
+                    self._remove(post_id)
+                else:
+                    self._add(doc)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._loaded = False
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_board.clear()
+
+    def search(self, db: Session, query: str, board_id: Optional[int]) -> List[Tuple[int, float]]:
+        self.ensure_loaded(db)
+        terms = _query_terms(query)
+        if not terms:
+            return []
+        total_docs = max(len(self._doc_terms), 1)
+        scores: Optional[Dict[int, float]] = None
+        with self._lock:
+            for token in terms:
+                term_scores = self._postings.get(token, {})
+                idf = math.log(1 + total_docs / (1 + len(term_scores)))
+                # 모든 검색어를 포함한 문서만 남긴다 (AND)
+                if scores is None:
+                    scores = {post_id: weight * idf for post_id, weight in term_scores.items()}
+                else:
+                    scores = {
+                        post_id: score + term_scores[post_id] * idf
+                        for post_id, score in scores.items()
+                        if post_id in term_scores
+                    }
+            if board_id is not None:
+                scores = {post_id: score for post_id, score in scores.items() if self._doc_board.get(post_id) == board_id}
+        return sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+
+
+_memory_index = InMemoryPostIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_staged(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes:
+        _memory_index.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_staged(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _pg_upsert(db: Session, documents: List[dict]) -> None:
+    if not documents:
+        return
+    db.execute(
+        text(
+            "INSERT INTO post_search_documents (post_id, document) VALUES ("
+            ":post_id, setweight(to_tsvector('simple', :title), 'A')"
+            " || setweight(to_tsvector('simple', :content), 'B')"
+            " || setweight(to_tsvector('simple', :comments), 'C'))"
+            " ON CONFLICT (post_id) DO UPDATE SET document = EXCLUDED.document"
+        ),
+        [
+            {
+                "post_id": doc["id"],
+                "title": " ".join(tokenize(doc["title"], unigrams=True)),
+                "content": " ".join(tokenize(doc["content"], unigrams=True)),
+                "comments": " ".join(tokenize(doc["comments"], unigrams=True)),
+            }
+            for doc in documents
+        ],
+    )
+
+
+def index_post(db: Session, post_id: int) -> None:
+    """게시글(또는 그 댓글)이 생성/수정된 뒤, 커밋 전에 호출한다."""
+    if _is_postgres(db):
+        _pg_upsert(db, _load_documents(db, [post_id]))
+    else:
+        _memory_index.stage(db, post_id)
+
+
+def remove_post(db: Session, post_id: int) -> None:
+    """게시글 삭제와 같은 트랜잭션에서, 커밋 전에 호출한다."""
+    if _is_postgres(db):
+        db.execute(text("DELETE FROM post_search_documents WHERE post_id = :post_id"), {"post_id": post_id})
+    else:
+        _memory_index.stage(db, post_id, removed=True)
+
+
+def rebuild_index(db: Session, batch_size: int = 500) -> int:
+    """PostgreSQL 검색 테이블을 id 순 배치로 다시 채운다."""
+    last_id, total = 0, 0
+    while True:
+        post_ids = [
+            row[0] for row in
+            db.query(Post.id).filter(Post.id > last_id).order_by(Post.id).limit(batch_size).all()
+        ]
+        if not post_ids:
+            return total
+        _pg_upsert(db, _load_documents(db, post_ids))
+        db.commit()
+        last_id, total = post_ids[-1], total + len(post_ids)
+
+
+def search_posts(db: Session, query: str, board_id: Optional[int], skip: int, limit: int) -> Tuple[int, List[dict]]:
+    terms = _query_terms(query)
+    if not terms:
+        return 0, []
+
+    if _is_postgres(db):
+        tsquery = " & ".join(terms)
+        rows = db.execute(
+            text(
+                "SELECT p.id, ts_rank_cd(d.document, q) AS score, count(*) OVER () AS total"
+                " FROM post_search_documents d"
+                " JOIN posts p ON p.id = d.post_id,"
+                " to_tsquery('simple', :tsquery) q"
+                " WHERE d.document @@ q AND (CAST(:board_id AS integer) IS NULL OR p.board_id = :board_id)"
+                " ORDER BY score DESC, p.id DESC"
+                " LIMIT :limit OFFSET :skip"
+            ),
+            {"tsquery": tsquery, "board_id": board_id, "limit": limit, "skip": skip},
+        ).all()
+        total = rows[0].total if rows else 0
+        ranked = [(row.id, float(row.score)) for row in rows]
+    else:
+        matches = _memory_index.search(db, query, board_id)
+        total = len(matches)
+        ranked = matches[skip:skip + limit]
+
+    if not ranked:
+        return total, []
+
+    # 현재 페이지 행만 본문/작성자와 함께 읽어 스니펫을 만든다
+    post_rows = {
+        row.id: row for row in
+        db.query(Post.id, Post.board_id, Post.title, Post.content, Post.created_at, User.name_kr)
+        .outerjoin(User, Post.user_id == User.id)
+        .filter(Post.id.in_([post_id for post_id, _ in ranked]))
+        .all()
+    }
+    results = []
+    for post_id, score in ranked:
+        row = post_rows.get(post_id)
+        if row is None:
+            continue
+        results.append({
+            "id": row.id,
+            "board_id": row.board_id,
+            "title": row.title,
+            "title_highlight": highlight(row.title, query),
+            "snippet": make_snippet(row.content, query),
+            "author_name": row.name_kr or "",
+            "created_at": row.created_at,
+            "score": round(score, 4),
+        })
+    return total, results
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAXSIZE = int(os.getenv("PRINCIPAL_CACHE_MAXSIZE", "2048"))
+
+
+@dataclass(frozen=True)
+class PrincipalDepartment:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PrincipalPosition:
+    id: int
+    name: str
+    level: int
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자의 권한 판단용 스냅샷 (ORM 객체가 아님)"""
+    id: int
+    email: str
+    name_kr: str
+    name_en: str
+    is_active: bool
+    department: PrincipalDepartment
+    position: PrincipalPosition
+
+    @property
+    def department_id(self) -> int:
+        return self.department.id
+
+    @property
+    def position_id(self) -> int:
+        return self.position.id
+
+
+class PrincipalCache:
+    """(user_id, 토큰 exp) 키로 Principal 을 보관하는 TTL + LRU 캐시"""
+
+    def __init__(self, ttl_seconds: float = PRINCIPAL_CACHE_TTL_SECONDS, maxsize: int = PRINCIPAL_CACHE_MAXSIZE):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, exp: int) -> Optional[Principal]:
+        key = (user_id, exp)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            # 캐시 TTL 또는 토큰 만료 시각 중 먼저 오는 쪽에서 폐기
+            if expires_at <= now or exp <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(self, exp: int, principal: Principal) -> None:
+        key = (principal.id, exp)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _discard(self, predicate) -> int:
+        with self._lock:
+            keys = [key for key, (_, principal) in self._entries.items() if predicate(principal)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def invalidate_user(self, user_id: int) -> int:
+        return self._discard(lambda p: p.id == user_id)
+
+    def invalidate_department(self, department_id: int) -> int:
+        return self._discard(lambda p: p.department.id == department_id)
+
+    def invalidate_position(self, position_id: int) -> int:
+        return self._discard(lambda p: p.position.id == position_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,209 @@
+from calendar import monthrange
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Collection, Iterator, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta
+
+# 반복 규칙 (RFC 5545 RRULE 의 부분집합)
+#   FREQ=DAILY|WEEKLY|MONTHLY, INTERVAL=n, COUNT=n 또는 UNTIL=YYYYMMDD[THHMMSS], BYDAY=MO,WE (WEEKLY 전용)
+#   예) FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20261231   /   FREQ=MONTHLY;COUNT=12   /   weekly
+# 발생 시각은 제너레이터로 필요한 만큼만 만든다 — 끝이 없는 규칙도 조회 구간만 펼친다.
+# 예외 날짜(exdates)는 COUNT 계산 뒤에 빠진다 (RFC 5545 EXDATE 와 같음).
+
+DAILY = "DAILY"
+WEEKLY = "WEEKLY"
+MONTHLY = "MONTHLY"
+FREQS = (DAILY, WEEKLY, MONTHLY)
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+class RecurrenceError(ValueError):
+    pass
+
+
+def _parse_until(value: str) -> datetime:
+    for fmt in ("%Y%m%dT%H%M%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    for fmt in ("%Y%m%d", "%Y-%m-%d"):
+        try:
+            # 날짜만 주면 그 날 끝까지 포함
+            return datetime.combine(datetime.strptime(value, fmt).date(), time.max.replace(microsecond=0))
+        except ValueError:
+            pass
+    raise RecurrenceError(f"UNTIL 형식이 올바르지 않습니다: {value}")
+
+
+def _positive_int(name: str, value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise RecurrenceError(f"{name} 는 1 이상의 정수여야 합니다.")
+    return number
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    byday: Tuple[int, ...] = ()
+
+    @classmethod
+    def parse(cls, text: str, default_count: Optional[int] = None) -> "RecurrenceRule":
+        """default_count 는 "weekly" 처럼 주기만 준 약식 규칙에 붙일 COUNT"""
+        text = (text or "").strip()
+        if text.upper().startswith("RRULE:"):
+            text = text[6:]
+        if not text:
+            raise RecurrenceError("반복 규칙이 비어 있습니다.")
+        if "=" not in text:
+            # daily / weekly / monthly
+            parts = {"FREQ": text}
+            if default_count is not None:
+                parts["COUNT"] = str(default_count)
+        else:
+            try:
+                parts = {key.strip().upper(): value.strip() for key, value in (part.split("=", 1) for part in text.split(";") if part)}
+            except ValueError:
+                raise RecurrenceError(f"반복 규칙 형식이 올바르지 않습니다: {text}")
+
+        freq = parts.pop("FREQ", "").upper()
+        if freq not in FREQS:
+            raise RecurrenceError("FREQ 는 DAILY, WEEKLY, MONTHLY 중 하나여야 합니다.")
+        interval = _positive_int("INTERVAL", parts.pop("INTERVAL")) if "INTERVAL" in parts else 1
+        count = _positive_int("COUNT", parts.pop("COUNT")) if "COUNT" in parts else None
+        until = _parse_until(parts.pop("UNTIL")) if "UNTIL" in parts else None
+        if count is not None and until is not None:
+            raise RecurrenceError("COUNT 와 UNTIL 은 함께 쓸 수 없습니다.")
+        byday = ()
+        if "BYDAY" in parts:
+            if freq != WEEKLY:
+                raise RecurrenceError("BYDAY 는 WEEKLY 에서만 쓸 수 있습니다.")
+            names = [name.strip().upper() for name in parts.pop("BYDAY").split(",") if name.strip()]
+            if not names or any(name not in WEEKDAYS for name in names):
+                raise RecurrenceError("BYDAY 는 MO,TU,WE,TH,FR,SA,SU 로 지정해야 합니다.")
+            byday = tuple(sorted({WEEKDAYS.index(name) for name in names}))
+        if parts:
+            raise RecurrenceError(f"지원하지 않는 반복 규칙 항목입니다: {', '.join(sorted(parts))}")
+        return cls(freq=freq, interval=interval, count=count, until=until, byday=byday)
+
+    @property
+    def bounded(self) -> bool:
+        return self.count is not None or self.until is not None
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%dT%H%M%S}")
+        return ";".join(parts)
+
+    def with_until(self, until: datetime) -> "RecurrenceRule":
+        """이 시각 이전까지만 남긴 규칙 ("이후 일정 모두" 수정 시 기존 시리즈를 끊을 때)"""
+        return RecurrenceRule(self.freq, self.interval, None, until, self.byday)
+
+
+@lru_cache(maxsize=1024)
+def parse_rule(text: str) -> RecurrenceRule:
+    """저장된 규칙 문자열 해석 — 같은 문자열이 많으므로 캐시 (RecurrenceRule 은 불변)"""
+    return RecurrenceRule.parse(text)
+
+
+def occurrences(rule: RecurrenceRule, dtstart: datetime, after: Optional[datetime] = None) -> Iterator[datetime]:
+    """dtstart 부터의 발생 시각 (after 가 있으면 그 이후만, 앞부분은 계산으로 건너뛴다)"""
+    if rule.freq == MONTHLY:
+        yield from _monthly(rule, dtstart, after)
+        return
+
+    if rule.freq == WEEKLY:
+        step = timedelta(weeks=rule.interval)
+        if rule.byday:
+            origin = dtstart - timedelta(days=dtstart.weekday())
+            offsets = rule.byday
+        else:
+            origin, offsets = dtstart, (0,)
+    else:
+        step = timedelta(days=rule.interval)
+        origin, offsets = dtstart, (0,)
+    # 첫 주기에서 dtstart 보다 앞선 요일 수 (COUNT 위치 계산용)
+    skipped = sum(1 for offset in offsets if origin + timedelta(days=offset) < dtstart)
+
+    period = 0
+    if after is not None and after > origin:
+        period = (after - origin) // step
+    while True:
+        base = origin + period * step
+        for index, offset in enumerate(offsets):
+            at = base + timedelta(days=offset)
+            if at < dtstart:
+                continue
+            position = period * len(offsets) + index - skipped
+            if rule.count is not None and position >= rule.count:
+                return
+            if rule.until is not None and at > rule.until:
+                return
+            if after is None or at >= after:
+                yield at
+        period += 1
+
+
+def _monthly(rule: RecurrenceRule, dtstart: datetime, after: Optional[datetime]) -> Iterator[datetime]:
+    period = 0
+    if after is not None and rule.count is None:
+        months = (after.year - dtstart.year) * 12 + after.month - dtstart.month
+        period = max(0, months // rule.interval - 1)
+    position = 0
+    while True:
+        month_index = dtstart.month - 1 + period * rule.interval
+        year, month = dtstart.year + month_index // 12, month_index % 12 + 1
+        if year > 9999:
+            return
+        # 31일처럼 없는 날짜인 달은 건너뛴다 (RFC 5545 와 같음)
+        if dtstart.day <= monthrange(year, month)[1]:
+            at = dtstart.replace(year=year, month=month)
+            if rule.count is not None and position >= rule.count:
+                return
+            if rule.until is not None and at > rule.until:
+                return
+            position += 1
+            if after is None or at >= after:
+                yield at
+        period += 1
+
+
+def expand(rule: RecurrenceRule, dtstart: datetime, exdates: Collection[date] = (), limit: int = 366) -> List[datetime]:
+    """끝이 있는 규칙의 발생 시각 전체 (예외 날짜 제외). limit 을 넘으면 RecurrenceError."""
+    if not rule.bounded:
+        raise RecurrenceError("반복 예약에는 COUNT 또는 UNTIL 이 필요합니다.")
+    starts = [at for at in islice(occurrences(rule, dtstart), limit + 1) if at.date() not in exdates]
+    if len(starts) > limit:
+        raise RecurrenceError(f"반복 횟수는 최대 {limit}회입니다.")
+    return starts
+
+
+def between(
+    rule: RecurrenceRule,
+    dtstart: datetime,
+    duration: timedelta,
+    start: datetime,
+    end: datetime,
+    exdates: Collection[date] = (),
+) -> Iterator[datetime]:
+    """[start, end) 와 겹치는 발생 시각만 만든다."""
+    for at in occurrences(rule, dtstart, after=start - duration):
+        if at >= end:
+            return
+        if at + duration > start and at.date() not in exdates:
+            yield at
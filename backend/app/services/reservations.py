@@ -0,0 +1,163 @@
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from sqlalchemy import and_, func, insert, update
+from sqlalchemy.orm import Session
+from app.db.models import Facility, Reservation
+from datetime import datetime, timedelta
+
+# 시설 예약 충돌 검사
+#  - PostgreSQL 은 reservations_no_overlap (EXCLUDE USING gist) 제약이 최종적으로 보장
+#  - 그 외에도 공통으로: 시설 행을 잠가 같은 시설 예약을 직렬화한 뒤
+#    (facility_id, start_time, end_time) 인덱스로 한 번 범위 조회 → 메모리 구간 트리로 겹침 확인
+#    → 충돌한 기존 예약을 그대로 알려줄 수 있다
+
+CANCELLED = "취소"
+
+# 반복 예약의 취소/수정 범위
+THIS = "this"
+FOLLOWING = "following"
+
+Interval = Tuple[datetime, datetime]
+
+
+class IntervalIndex:
+    """정적 구간 트리
+
+    시작 시각으로 정렬한 배열을 균형 이진 트리로 보고, 노드마다 서브트리의 최대 종료 시각을 둔다.
+    [start, end) 와 겹치는 구간 찾기는 O(log n + 결과 수).
+    """
+
+    def __init__(self, items: Iterable[Tuple[datetime, datetime, Any]]):
+        self._items = sorted(items, key=lambda item: (item[0], item[1]))
+        self._max_end: List[datetime] = [None] * len(self._items)
+        if self._items:
+            self._build(0, len(self._items))
+
+    def _build(self, lo: int, hi: int) -> datetime:
+        mid = (lo + hi) // 2
+        max_end = self._items[mid][1]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Any]:
+        found = []
+        stack = [(0, len(self._items))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            # 이 서브트리의 구간은 모두 start 이전에 끝난다
+            if self._max_end[mid] <= start:
+                continue
+            stack.append((lo, mid))
+            item_start, item_end, payload = self._items[mid]
+            if item_start < end:
+                if item_end > start:
+                    found.append(payload)
+                stack.append((mid + 1, hi))
+        return found
+
+
+def lock_facility(db: Session, facility_id: int) -> bool:
+    """같은 시설의 예약 확인~저장을 직렬화한다. 시설이 없으면 False."""
+    if db.get_bind().dialect.name == "postgresql":
+        return db.query(Facility.id).filter(Facility.id == facility_id).with_for_update().scalar() is not None
+    # SQLite 는 행 잠금이 없으므로 쓰기 잠금을 먼저 잡는다
+    return db.execute(
+        update(Facility).where(Facility.id == facility_id).values(id=Facility.id)
+        .execution_options(synchronize_session=False)
+    ).rowcount > 0
+
+
+def active_reservations(db: Session, facility_id: int, start: datetime, end: datetime) -> List:
+    """[start, end) 와 겹치는 취소되지 않은 예약 (인덱스 범위 조회 한 번)"""
+    return (
+        db.query(Reservation.id, Reservation.user_id, Reservation.start_time, Reservation.end_time, Reservation.status)
+        .filter(
+            Reservation.facility_id == facility_id,
+            Reservation.start_time < end,
+            Reservation.end_time > start,
+            Reservation.status != CANCELLED,
+        )
+        .order_by(Reservation.start_time)
+        .all()
+    )
+
+
+def find_conflicts(db: Session, facility_id: int, intervals: Sequence[Interval], exclude_ids: Iterable[int] = ()) -> List:
+    """요청한 구간들과 겹치는 기존 예약 목록"""
+    if not intervals:
+        return []
+    exclude_ids = set(exclude_ids)
+    rows = active_reservations(db, facility_id, min(start for start, _ in intervals), max(end for _, end in intervals))
+    index = IntervalIndex((row.start_time, row.end_time, row) for row in rows if row.id not in exclude_ids)
+    conflicts = {}
+    for start, end in intervals:
+        for row in index.overlapping(start, end):
+            conflicts[row.id] = row
+    return sorted(conflicts.values(), key=lambda row: row.start_time)
+
+
+def self_overlaps(intervals: Sequence[Interval]) -> List[Interval]:
+    """요청한 구간끼리 겹치는 것 (반복 예약 등)"""
+    ordered = sorted(intervals)
+    return [later for earlier, later in zip(ordered, ordered[1:]) if later[0] < earlier[1]]
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    merged: List[List[datetime]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def free_intervals(busy: Iterable[Interval], start: datetime, end: datetime) -> List[Interval]:
+    """[start, end) 에서 busy 를 뺀 빈 구간"""
+    free = []
+    cursor = start
+    # 범위 밖의 구간은 잘라낸 뒤 비게 되므로 뺀다
+    clipped = ((max(busy_start, start), min(busy_end, end)) for busy_start, busy_end in busy)
+    for busy_start, busy_end in merge_intervals(interval for interval in clipped if interval[0] < interval[1]):
+        if busy_start > cursor:
+            free.append((cursor, busy_start))
+        cursor = max(cursor, busy_end)
+    if cursor < end:
+        free.append((cursor, end))
+    return free
+
+
+def insert_reservations(db: Session, rows: List[Dict[str, Any]]) -> List:
+    """예약 여러 건을 한 번의 INSERT 로 넣고 저장된 행을 돌려준다. 커밋은 호출자가 한다."""
+    if not rows:
+        return []
+    columns = [column for column in Reservation.__table__.columns]
+    return db.execute(insert(Reservation).returning(*columns), rows).all()
+
+
+def scope_condition(reservation: Reservation, scope: str):
+    """취소/수정 대상 — following 이면 같은 반복의 이 예약 및 이후 예약 (취소된 것 제외)"""
+    if scope == FOLLOWING and reservation.series_id:
+        return and_(
+            Reservation.series_id == reservation.series_id,
+            Reservation.start_time >= reservation.start_time,
+            Reservation.status != CANCELLED,
+        )
+    return Reservation.id == reservation.id
+
+
+def shifted(db: Session, column, delta: timedelta):
+    """column + delta 를 SQL 식으로 (여러 예약을 UPDATE 한 번으로 옮길 때)"""
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite 는 날짜를 문자열로 저장하므로 SQLAlchemy 저장 형식(소수점 6자리)에 맞춘다
+        return func.strftime("%Y-%m-%d %H:%M:%f", column, f"{delta.total_seconds():+.3f} seconds").concat("000")
+    return column + delta
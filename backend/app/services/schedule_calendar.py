@@ -0,0 +1,110 @@
+from heapq import merge
+from typing import Iterable, Iterator, List, NamedTuple, Set
+from sqlalchemy import and_, insert, or_, select, union
+from sqlalchemy.orm import Session
+from app.db.models import DepartmentClosure, Schedule, ScheduleShare, User
+from app.services.recurrence import RecurrenceError, between, parse_rule
+from datetime import datetime
+
+# 캘린더 기간 조회
+#  - 사내 일정 + 내 부서(상위 부서 포함) 일정 + 내 개인 일정 + 나에게 공유된 일정을 UNION 한 번으로 읽는다
+#    (사내/부서는 (type, start_time), 개인은 (owner_id, start_time) 인덱스)
+#  - 공유는 schedule_shares: 직원 공유는 (user_id, schedule_id) 인덱스,
+#    부서 공유는 department_closure 조인 한 번으로 상위 부서에 공유된 것까지
+#  - 반복 일정은 행 하나로 저장되어 있고, 조회 구간에 걸치는 발생만 제너레이터로 펼친다
+#    → 끝이 없는 반복도 구간 밖은 만들지 않는다
+#  - 일정별 제너레이터를 시작 시각 순으로 병합하므로 앞에서부터 필요한 만큼만 꺼내 쓸 수 있다
+
+COMPANY = "사내"
+DEPARTMENT = "부서"
+PERSONAL = "개인"
+
+SCHEDULE_COLUMNS = (
+    Schedule.id, Schedule.title, Schedule.content, Schedule.start_time, Schedule.end_time,
+    Schedule.type, Schedule.owner_id, Schedule.is_repeat, Schedule.repeat_rule,
+)
+
+
+class Occurrence(NamedTuple):
+    # 앞 두 필드로 정렬된다 (같은 일정의 발생은 시작 시각이 모두 다르다)
+    start_time: datetime
+    schedule_id: int
+    end_time: datetime
+    schedule: object  # visible_schedules 의 행
+
+
+def _in_window(start: datetime, end: datetime):
+    # 반복 일정은 시작이 구간 끝 이전이면 후보 (실제 발생은 펼치면서 거른다)
+    return and_(
+        Schedule.start_time < end,
+        or_(Schedule.end_time > start, Schedule.is_repeat.is_(True)),
+    )
+
+
+def shared_schedule_ids(user_id: int, department_id: int):
+    """나 또는 내 부서(상위 부서에 공유된 것 포함)에 공유된 일정 id 서브쿼리"""
+    by_user = select(ScheduleShare.schedule_id).where(ScheduleShare.user_id == user_id)
+    by_department = (
+        select(ScheduleShare.schedule_id)
+        .join(DepartmentClosure, DepartmentClosure.ancestor_id == ScheduleShare.department_id)
+        .where(DepartmentClosure.descendant_id == department_id)
+    )
+    return union(by_user, by_department)
+
+
+def visible_schedules(db: Session, user_id: int, department_id: int, start: datetime, end: datetime) -> List:
+    """[start, end) 에 걸칠 수 있는, 사용자가 볼 수 있는 일정 행"""
+    window = _in_window(start, end)
+    my_departments = select(DepartmentClosure.ancestor_id).where(DepartmentClosure.descendant_id == department_id)
+    company = select(*SCHEDULE_COLUMNS).where(Schedule.type == COMPANY, window)
+    department = (
+        select(*SCHEDULE_COLUMNS)
+        .join(User, Schedule.owner_id == User.id)
+        .where(Schedule.type == DEPARTMENT, window, User.department_id.in_(my_departments))
+    )
+    personal = select(*SCHEDULE_COLUMNS).where(Schedule.owner_id == user_id, Schedule.type == PERSONAL, window)
+    shared = select(*SCHEDULE_COLUMNS).where(Schedule.id.in_(shared_schedule_ids(user_id, department_id)), window)
+    # 공유된 사내/부서 일정은 앞의 결과와 겹칠 수 있으므로 UNION (중복 제거)
+    return db.execute(union(company, department, personal, shared)).all()
+
+
+def insert_shares(db: Session, schedule_id: int, user_ids: Iterable[int], department_ids: Iterable[int]) -> None:
+    """공유 대상을 한 번의 INSERT 로. 커밋은 호출자가 한다."""
+    rows = [{"schedule_id": schedule_id, "user_id": user_id, "department_id": None} for user_id in sorted(set(user_ids))]
+    rows += [{"schedule_id": schedule_id, "user_id": None, "department_id": department_id} for department_id in sorted(set(department_ids))]
+    if rows:
+        db.execute(insert(ScheduleShare), rows)
+
+
+def share_recipients(db: Session, user_ids: Iterable[int], department_ids: Iterable[int]) -> Set[int]:
+    """공유 알림을 받을 직원 — 공유 부서는 하위 부서 직원까지 (closure 조인 한 번)"""
+    recipients = set(user_ids)
+    department_ids = list(set(department_ids))
+    if department_ids:
+        recipients.update(db.scalars(
+            select(User.id)
+            .join(DepartmentClosure, DepartmentClosure.descendant_id == User.department_id)
+            .where(DepartmentClosure.ancestor_id.in_(department_ids), User.is_active.is_(True))
+        ))
+    return recipients
+
+
+def _occurrences(row, start: datetime, end: datetime) -> Iterator[Occurrence]:
+    duration = row.end_time - row.start_time
+    if row.is_repeat and row.repeat_rule:
+        try:
+            rule = parse_rule(row.repeat_rule)
+        except RecurrenceError:
+            rule = None
+        if rule is not None:
+            for at in between(rule, row.start_time, duration, start, end):
+                yield Occurrence(at, row.id, at + duration, row)
+            return
+    # 반복이 아니거나 규칙을 해석할 수 없으면 한 번만
+    if row.start_time < end and row.end_time > start:
+        yield Occurrence(row.start_time, row.id, row.end_time, row)
+
+
+def expand(rows, start: datetime, end: datetime) -> Iterator[Occurrence]:
+    """[start, end) 에 걸치는 발생을 시작 시각 순으로"""
+    return merge(*(_occurrences(row, start, end) for row in rows))
@@ -0,0 +1,145 @@
+"""로컬 개발/테스트용 SMTP 대역
+
+받은 메일을 보관하고 (선택) 표준 출력에 요약을 찍기만 하는 최소 SMTP 서버.
+외부로는 아무것도 보내지 않는다.
+
+    python -m app.services.smtp_sink --port 1025
+    SMTP_HOST=localhost SMTP_PORT=1025 NOTIFICATION_CHANNELS=inapp,email uvicorn app.main:app
+
+코드에서는 스레드로 띄워 받은 메일을 확인할 수 있다.
+
+    sink = SmtpSink(port=0).start()
+    ... EmailChannel("127.0.0.1", sink.port) ...
+    sink.messages  # [email.message.EmailMessage, ...]
+    sink.stop()
+"""
+from email import policy
+from email.parser import BytesParser
+from typing import List, Optional
+import argparse
+import asyncio
+import threading
+
+
+class SmtpSink:
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 1025, echo: bool = False,
+        reject: Optional[str] = None, defer: Optional[str] = None, drop_after: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.echo = echo
+        # 이 문자열이 들어간 수신자는 550 으로 거부 (실패 처리 확인용)
+        self.reject = reject
+        # 이 문자열이 들어간 수신자는 451 로 일시 거부 (재시도 확인용)
+        self.defer = defer
+        # 메일을 이 건수만큼 받은 뒤에는 다음 MAIL 에서 연결을 끊는다 (배치 중 연결 끊김 확인용)
+        self.drop_after = drop_after
+        self.messages: List = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        await reply("220 smtp-sink ready")
+        recipients = []
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode(errors="replace").strip()
+                verb = command[:4].upper()
+                if verb in ("HELO", "EHLO"):
+                    await reply("250 smtp-sink")
+                elif verb == "MAIL":
+                    if self.drop_after is not None and len(self.messages) >= self.drop_after:
+                        break
+                    recipients = []
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    if self.reject and self.reject in command:
+                        await reply("550 mailbox unavailable")
+                    elif self.defer and self.defer in command:
+                        await reply("451 try again later")
+                    else:
+                        recipients.append(command.split(":", 1)[1].strip())
+                        await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    lines = []
+                    while True:
+                        data = await reader.readline()
+                        if data in (b".\r\n", b".\n", b""):
+                            break
+                        # 점 투명성 (RFC 5321 4.5.2)
+                        lines.append(data[1:] if data.startswith(b"..") else data)
+                    message = BytesParser(policy=policy.default).parsebytes(b"".join(lines))
+                    self.messages.append(message)
+                    if self.echo:
+                        print(f"[smtp-sink] {message['To']} | {message['Subject']}")
+                    await reply("250 OK")
+                elif verb == "RSET":
+                    recipients = []
+                    await reply("250 OK")
+                elif verb == "NOOP":
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self) -> "SmtpSink":
+        """백그라운드 스레드에서 서버를 띄우고 포트가 열릴 때까지 기다린다."""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.call_soon(ready.set)
+            try:
+                self._loop.run_until_complete(self.serve())
+            except asyncio.CancelledError:
+                pass
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        ready.wait()
+        while self._server is None or not self._server.is_serving():
+            threading.Event().wait(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    args = parser.parse_args()
+    sink = SmtpSink(args.host, args.port, echo=True)
+    print(f"smtp-sink listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(sink.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import AsyncSessionLocal
+from app.db.models import Department, Position, User
+from app.schemas.user import UserBulkRow, UserBulkRowError, UserBulkResult
+from app.services.passwords import password_pool
+from datetime import datetime
+import csv
+import io
+import os
+
+# 직원 일괄 등록/내보내기
+#  - 업로드 파일(CSV/XLSX)을 CHUNK_SIZE 행씩 읽어 검증 → 해시 → executemany INSERT → 커밋
+#  - 부서/직급은 요청 시작 시 한 번 읽은 맵으로 검증
+#  - 내보내기는 yield_per 스트리밍으로 한 번에 한 묶음만 메모리에 올린다
+
+BULK_CHUNK_SIZE = int(os.getenv("USER_BULK_CHUNK_SIZE", "200"))
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_COLUMNS = [
+    "employee_id", "name_kr", "name_en", "birth_date", "gender", "hire_date", "email",
+    "department_code", "position", "phone_number", "phone_landline", "is_active",
+]
+
+
+class BulkFileError(Exception):
+    """업로드 파일 자체를 읽을 수 없는 경우 (행 단위 오류와 구분)"""
+
+
+def _cell(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        # 엑셀이 숫자로 저장한 사번/전화번호
+        value = int(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    value = str(value).strip()
+    return value or None
+
+
+def _iter_csv(upload: UploadFile) -> Iterator[Dict[str, Optional[str]]]:
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        for record in csv.DictReader(stream):
+            yield {(key or "").strip(): _cell(value) for key, value in record.items()}
+    except UnicodeDecodeError:
+        raise BulkFileError("CSV 파일은 UTF-8 로 저장해야 합니다.")
+    finally:
+        stream.detach()
+
+
+def _iter_xlsx(upload: UploadFile) -> Iterator[Dict[str, Optional[str]]]:
+    # openpyxl 은 엑셀 업로드에서만 필요하므로 지연 임포트
+    from openpyxl import load_workbook
+
+    try:
+        workbook = load_workbook(upload.file, read_only=True, data_only=True)
+    except Exception:
+        raise BulkFileError("엑셀 파일을 읽을 수 없습니다.")
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [(_cell(value) or "") for value in next(rows, ())]
+        for values in rows:
+            if all(value is None for value in values):
+                continue
+            yield {key: _cell(value) for key, value in zip(header, values) if key}
+    finally:
+        workbook.close()
+
+
+def iter_upload_rows(upload: UploadFile) -> Iterator[Dict[str, Optional[str]]]:
+    filename = (upload.filename or "").lower()
+    if filename.endswith(".xlsx"):
+        return _iter_xlsx(upload)
+    if filename.endswith(".csv"):
+        return _iter_csv(upload)
+    raise BulkFileError("CSV 또는 XLSX 파일만 업로드할 수 있습니다.")
+
+
+def _chunks(rows: Iterator[Dict[str, Optional[str]]], size: int) -> Iterator[List[Tuple[int, dict]]]:
+    chunk = []
+    # 1행은 헤더이므로 데이터는 2행부터
+    for row_no, record in enumerate(rows, start=2):
+        chunk.append((row_no, record))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _Lookups:
+    def __init__(self, departments: Dict[str, int], positions_by_name: Dict[str, int], positions_by_level: Dict[int, int]):
+        self.departments = departments
+        self.positions_by_name = positions_by_name
+        self.positions_by_level = positions_by_level
+        self.seen_emails = set()
+        self.seen_employee_ids = set()
+
+    def position_id(self, value: str) -> Optional[int]:
+        if value.isdigit():
+            return self.positions_by_level.get(int(value))
+        return self.positions_by_name.get(value)
+
+
+async def _load_lookups(db: AsyncSession) -> _Lookups:
+    departments = {code: dept_id for dept_id, code in (await db.execute(select(Department.id, Department.code))).all()}
+    positions_by_name, positions_by_level = {}, {}
+    for position_id, name, level in (await db.execute(select(Position.id, Position.name, Position.level))).all():
+        positions_by_name.setdefault(name, position_id)
+        positions_by_level.setdefault(level, position_id)
+    return _Lookups(departments, positions_by_name, positions_by_level)
+
+
+def _validate(row_no: int, record: dict, lookups: _Lookups, errors: Dict[int, List[str]]) -> Optional[dict]:
+    try:
+        row = UserBulkRow(**{key: value for key, value in record.items() if value is not None})
+    except ValidationError as exc:
+        errors[row_no] = [
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+        ]
+        return None
+
+    row_errors = []
+    department_id = lookups.departments.get(row.department_code)
+    if department_id is None:
+        row_errors.append(f"존재하지 않는 부서 코드입니다: {row.department_code}")
+    position_id = lookups.position_id(row.position)
+    if position_id is None:
+        row_errors.append(f"존재하지 않는 직급입니다: {row.position}")
+    if row.gender not in ("남", "여"):
+        row_errors.append("성별은 '남' 또는 '여' 여야 합니다.")
+    if row.email in lookups.seen_emails:
+        row_errors.append("파일 안에서 이메일이 중복됩니다.")
+    if row.employee_id in lookups.seen_employee_ids:
+        row_errors.append("파일 안에서 사번이 중복됩니다.")
+    lookups.seen_emails.add(row.email)
+    lookups.seen_employee_ids.add(row.employee_id)
+    if row_errors:
+        errors[row_no] = row_errors
+        return None
+
+    values = row.dict(exclude={"department_code", "position"})
+    values.update(
+        department_id=department_id,
+        position_id=position_id,
+        resume_file="",
+        cover_letter_file="",
+        is_active=True,
+        email_verified=False,
+        created_at=datetime.utcnow(),
+    )
+    return values
+
+
+async def _import_chunk(db: AsyncSession, chunk: List[Tuple[int, dict]], lookups: _Lookups, errors: Dict[int, List[str]]) -> int:
+    candidates = []
+    for row_no, record in chunk:
+        values = _validate(row_no, record, lookups, errors)
+        if values is not None:
+            candidates.append((row_no, values))
+    if not candidates:
+        return 0
+
+    # 이미 등록된 이메일/사번은 묶음당 쿼리 한 번으로 확인
+    emails = [values["email"] for _, values in candidates]
+    employee_ids = [values["employee_id"] for _, values in candidates]
+    existing = (await db.execute(
+        select(User.email, User.employee_id).where(or_(User.email.in_(emails), User.employee_id.in_(employee_ids)))
+    )).all()
+    existing_emails = {row.email for row in existing}
+    existing_employee_ids = {row.employee_id for row in existing}
+
+    rows = []
+    for row_no, values in candidates:
+        row_errors = []
+        if values["email"] in existing_emails:
+            row_errors.append("이미 등록된 이메일입니다.")
+        if values["employee_id"] in existing_employee_ids:
+            row_errors.append("이미 등록된 사번입니다.")
+        if row_errors:
+            errors[row_no] = row_errors
+        else:
+            rows.append((row_no, values))
+    if not rows:
+        return 0
+
+    hashed = await password_pool.hash_many([values["password"] for _, values in rows])
+    for (_, values), password in zip(rows, hashed):
+        values["password"] = password
+
+    try:
+        await db.execute(insert(User), [values for _, values in rows])
+        await db.commit()
+    except IntegrityError:
+        # 검증 이후 다른 요청이 같은 값을 등록한 경우: 이 묶음만 실패 처리
+        await db.rollback()
+        for row_no, _ in rows:
+            errors[row_no] = ["동시에 등록된 이메일 또는 사번과 충돌하여 저장하지 못했습니다."]
+        return 0
+    return len(rows)
+
+
+async def import_users(db: AsyncSession, upload: UploadFile, chunk_size: int = BULK_CHUNK_SIZE) -> UserBulkResult:
+    lookups = await _load_lookups(db)
+    errors: Dict[int, List[str]] = {}
+    created = 0
+    for chunk in _chunks(iter_upload_rows(upload), chunk_size):
+        created += await _import_chunk(db, chunk, lookups, errors)
+    return UserBulkResult(
+        created=created,
+        failed=len(errors),
+        errors=[UserBulkRowError(row=row_no, errors=messages) for row_no, messages in sorted(errors.items())],
+    )
+
+
+def _export_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+async def export_users_csv() -> AsyncIterator[bytes]:
+    """직원 목록을 CSV 로 스트리밍한다 (엑셀 호환을 위해 BOM 포함)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_COLUMNS)
+
+    # 응답이 끝날 때까지 세션을 유지해야 하므로 요청 의존성과 별도로 연다
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            select(
+                User.employee_id, User.name_kr, User.name_en, User.birth_date, User.gender, User.hire_date,
+                User.email, Department.code, Position.name, User.phone_number, User.phone_landline, User.is_active,
+            )
+            .join(Department, User.department_id == Department.id)
+            .join(Position, User.position_id == Position.id)
+            .order_by(User.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for partition in result.partitions():
+            for row in partition:
+                writer.writerow([_export_value(value) for value in row])
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
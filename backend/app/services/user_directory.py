@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models import Department, Position, User
+from app.pagination import encode_cursor
+from app.services import org
+import os
+import threading
+import time
+
+# 직원 목록 조회
+#  - 필요한 컬럼만 읽는 단일 조인 쿼리 (include 에 따라 부서/직급 이름 포함)
+#  - id 키셋 페이지네이션
+#  - 전체 건수는 필터별로 캐시한 추정치 (필터가 없으면 PostgreSQL 통계값)
+
+USER_COUNT_TTL_SECONDS = float(os.getenv("USER_COUNT_TTL_SECONDS", "60"))
+USER_COUNT_MAX_ENTRIES = 1024
+
+INCLUDE_OPTIONS = ("department", "position")
+
+USER_COLUMNS = (
+    User.id, User.employee_id, User.name_kr, User.name_en, User.birth_date, User.gender, User.hire_date,
+    User.email, User.department_id, User.position_id, User.phone_number, User.is_active,
+    User.email_verified, User.created_at, User.profile_image,
+)
+
+
+@dataclass(frozen=True)
+class UserFilter:
+    department_id: Optional[int] = None
+    include_subdepartments: bool = True
+    position_level: Optional[int] = None
+    is_active: Optional[bool] = None
+    name_prefix: Optional[str] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.department_id is None and self.position_level is None
+            and self.is_active is None and not self.name_prefix
+        )
+
+
+def parse_include(value: Optional[str]) -> Set[str]:
+    """include=department,position 형식을 검증해 집합으로 돌려준다."""
+    if not value:
+        return set()
+    parts = {part.strip() for part in value.split(",") if part.strip()}
+    unknown = parts - set(INCLUDE_OPTIONS)
+    if unknown:
+        raise ValueError(", ".join(sorted(unknown)))
+    return parts
+
+
+def _apply_filters(stmt, filters: UserFilter, position_joined: bool):
+    if filters.department_id is not None:
+        if filters.include_subdepartments:
+            stmt = stmt.where(User.department_id.in_(org.descendant_ids(filters.department_id)))
+        else:
+            stmt = stmt.where(User.department_id == filters.department_id)
+    if filters.position_level is not None:
+        if not position_joined:
+            stmt = stmt.join(Position, User.position_id == Position.id)
+        stmt = stmt.where(Position.level == filters.position_level)
+    if filters.is_active is not None:
+        stmt = stmt.where(User.is_active.is_(filters.is_active))
+    if filters.name_prefix:
+        stmt = stmt.where(User.name_kr.startswith(filters.name_prefix, autoescape=True))
+    return stmt
+
+
+async def list_users(
+    db: AsyncSession,
+    filters: UserFilter,
+    include: Set[str],
+    after_id: Optional[int],
+    limit: int,
+) -> Tuple[List[dict], Optional[str]]:
+    columns = list(USER_COLUMNS)
+    if "department" in include:
+        columns += [Department.code.label("department_code"), Department.name.label("department_name")]
+    if "position" in include:
+        columns += [Position.name.label("position_name"), Position.level.label("position_level")]
+
+    stmt = select(*columns)
+    if "department" in include:
+        stmt = stmt.join(Department, User.department_id == Department.id)
+    position_joined = "position" in include
+    if position_joined:
+        stmt = stmt.join(Position, User.position_id == Position.id)
+    stmt = _apply_filters(stmt, filters, position_joined)
+    if after_id is not None:
+        stmt = stmt.where(User.id > after_id)
+    rows = (await db.execute(stmt.order_by(User.id).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
+
+    items = []
+    for row in rows:
+        item = {column.key: getattr(row, column.key) for column in USER_COLUMNS}
+        item["gender"] = getattr(row.gender, "value", row.gender)
+        if "department" in include:
+            item["department"] = {"id": row.department_id, "code": row.department_code, "name": row.department_name}
+        if "position" in include:
+            item["position"] = {"id": row.position_id, "name": row.position_name, "level": row.position_level}
+        items.append(item)
+    return items, next_cursor
+
+
+class UserCountCache:
+    """필터 조합별 전체 건수를 TTL 동안 보관한다.
+
+    직원 생성/삭제/소속 변경 시 invalidate() 로 비운다. 필터가 없는 경우
+    PostgreSQL 에서는 COUNT(*) 대신 pg_class.reltuples 통계값을 쓴다.
+    """
+
+    def __init__(self, ttl: float = USER_COUNT_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[UserFilter, Tuple[float, int]] = {}
+        self._generation = 0
+
+    async def get(self, db: AsyncSession, filters: UserFilter) -> int:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(filters)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+
+        total = None
+        if filters.is_empty and db.get_bind().dialect.name == "postgresql":
+            estimate = await db.scalar(text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'users'::regclass"))
+            # 한 번도 ANALYZE 되지 않은 테이블은 -1
+            if estimate is not None and estimate >= 0:
+                total = int(estimate)
+        if total is None:
+            stmt = _apply_filters(select(func.count(User.id)), filters, position_joined=False)
+            total = await db.scalar(stmt) or 0
+
+        with self._lock:
+            if generation == self._generation:
+                # 이름 접두어처럼 조합이 많은 필터로 무한히 커지지 않도록
+                if len(self._entries) >= USER_COUNT_MAX_ENTRIES:
+                    self._entries.clear()
+                self._entries[filters] = (now + self.ttl, total)
+        return total
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+user_counts = UserCountCache()
@@ -0,0 +1,124 @@
+"""출근 기록 동시 요청 벤치마크
+
+직원 N 명이 동시에 POST /attendances/check-in 을 호출하는 아침 출근 상황을
+앱 인스턴스에 직접(ASGI) 요청해 재현한다. 쓰기 버퍼 설정(배치)과
+요청마다 커밋하는 설정(direct)의 처리량/지연/커밋 횟수를 비교한다.
+
+    python -m benchmarks.bench_check_in --users 1000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_check_in --users 1000 --keep
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def prepare(users: int):
+    from datetime import datetime
+    from sqlalchemy import delete, func, select
+    from app.db.database import SessionLocal, engine
+    from app.db.models import Attendance, AttendanceDailyStat, AttendanceMonthlyStat, Base, Department, Position, User
+    from app.dependencies import create_access_token
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        department = db.scalar(select(Department).where(Department.code == "BENCH"))
+        if department is None:
+            department = Department(code="BENCH", name="벤치마크")
+            db.add(department)
+        position = db.scalar(select(Position).order_by(Position.level.desc()).limit(1))
+        if position is None:
+            position = Position(name="사원", level=9)
+            db.add(position)
+        db.flush()
+
+        existing = db.scalar(select(func.count(User.id)).where(User.email.like("bench-%@example.com")))
+        db.add_all([
+            User(
+                employee_id=f"BENCH{i:05d}", name_kr=f"벤치{i}", name_en=f"bench{i}",
+                birth_date=datetime(1990, 1, 1), gender="남", hire_date=datetime(2020, 1, 1),
+                email=f"bench-{i}@example.com", password="!", department_id=department.id,
+                position_id=position.id, phone_number="010", resume_file="", cover_letter_file="",
+            )
+            for i in range(existing, users)
+        ])
+        db.flush()
+        user_ids = list(db.scalars(
+            select(User.id).where(User.email.like("bench-%@example.com")).order_by(User.id).limit(users)
+        ))
+        # 이전 실행의 오늘 기록 삭제
+        for model in (AttendanceDailyStat, AttendanceMonthlyStat):
+            db.execute(delete(model).where(model.user_id.in_(user_ids)))
+        db.execute(delete(Attendance).where(Attendance.user_id.in_(user_ids)))
+        db.commit()
+    finally:
+        db.close()
+    return [create_access_token({"sub": str(user_id)}) for user_id in user_ids]
+
+
+async def run(tokens, interval_ms: int, max_rows: int):
+    import httpx
+    from app.main import app
+    from app.services.attendance_buffer import attendance_buffer
+    from app.services.principal_cache import principal_cache
+
+    principal_cache.clear()
+    attendance_buffer.interval = interval_ms / 1000
+    attendance_buffer.max_rows = max_rows
+    attendance_buffer.flush_count = 0
+    latencies = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def clock_in(token):
+            started = time.perf_counter()
+            response = await client.post("/attendances/check-in", headers={"Authorization": f"Bearer {token}"})
+            latencies.append(time.perf_counter() - started)
+            return response.status_code
+
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*(clock_in(token) for token in tokens))
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, statuses, attendance_buffer.flush_count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--interval-ms", type=int, default=200, help="버퍼 flush 주기")
+    parser.add_argument("--max-rows", type=int, default=200, help="버퍼 flush 최대 건수")
+    parser.add_argument("--keep", action="store_true", help="DATABASE_URL 의 DB 를 그대로 사용")
+    args = parser.parse_args()
+
+    if not args.keep:
+        path = os.path.join(tempfile.mkdtemp(), "bench_check_in.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    print(f"DB: {os.environ.get('DATABASE_URL', '(기본 설정)')}")
+    tokens = prepare(args.users)
+
+    print(f"{'mode':<10}{'req':>6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'commits':>9}{'errors':>8}")
+    for mode, interval_ms, max_rows in (
+        ("direct", 0, 1),
+        ("buffered", args.interval_ms, args.max_rows),
+    ):
+        prepare(args.users)
+        elapsed, latencies, statuses, commits = asyncio.run(run(tokens, interval_ms, max_rows))
+        errors = sum(1 for status in statuses if status != 200)
+        print(
+            f"{mode:<10}{len(tokens):>6}{len(tokens) / elapsed:>10.1f}"
+            f"{percentile(latencies, 50) * 1000:>10.1f}{percentile(latencies, 95) * 1000:>10.1f}"
+            f"{percentile(latencies, 99) * 1000:>10.1f}{commits:>9}{errors:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
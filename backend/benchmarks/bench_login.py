@@ -0,0 +1,85 @@
+"""로그인 비밀번호 검증 처리량 벤치마크
+
+이벤트 루프에서 bcrypt 를 직접 호출하던 기존 방식(inline)과
+전용 스레드 풀(pool) 방식을 동시 접속 클라이언트 수별로 비교한다.
+처리량과 함께 같은 루프에서 도는 다른 요청이 겪는 최대 지연(loop lag)도 출력한다.
+
+    python -m benchmarks.bench_login --clients 50 --rounds 2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bcrypt
+
+from app.services.passwords import PasswordPool, PasswordPoolSaturated, verify_password_sync
+
+PASSWORD = "admin1234"
+
+
+async def login_inline(hashed: str) -> bool:
+    return verify_password_sync(PASSWORD, hashed)
+
+
+def make_pool_login(pool: PasswordPool):
+    async def login_pool(hashed: str) -> bool:
+        while True:
+            try:
+                return await pool.verify_password(PASSWORD, hashed)
+            except PasswordPoolSaturated:
+                # 실제 클라이언트처럼 Retry-After 후 재시도
+                await asyncio.sleep(0.05)
+    return login_pool
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run(login, hashed: str, clients: int, rounds: int):
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_lag(stop))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+
+    async def client():
+        for _ in range(rounds):
+            assert await login(hashed)
+
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    lag = await lag_task
+    return clients * rounds / elapsed, lag
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cost", type=int, default=12, help="bcrypt cost factor")
+    args = parser.parse_args()
+
+    hashed = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(args.cost)).decode("utf-8")
+    pool = PasswordPool(workers=args.workers) if args.workers else PasswordPool()
+
+    print(f"{'mode':<8}{'clients':>8}{'logins/s':>12}{'max lag ms':>12}")
+    for clients in args.clients:
+        for mode, login in (("inline", login_inline), ("pool", make_pool_login(pool))):
+            throughput, lag = asyncio.run(run(login, hashed, clients, args.rounds))
+            print(f"{mode:<8}{clients:>8}{throughput:>12.1f}{lag * 1000:>12.1f}")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""캘린더 기간 조회(/schedules?from=&to=) 벤치마크
+
+반복 일정 수천 개(끝이 없는 반복 포함)와 단건 일정을 만든 뒤 월/연 보기에서
+  - 보이는 일정 조회 (UNION ALL 한 번)
+  - 조회 구간만 제너레이터로 펼치기 (응답 최대 건수까지 / 전부)
+  - 비교용: 반복마다 첫 발생부터 구간 끝까지 모두 만든 뒤 거르기 (전체 materialize)
+에 걸리는 시간을 잰다.
+
+    python -m benchmarks.bench_schedule_range --events 5000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_schedule_range --keep --events 5000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def prepare(events: int, users: int, seed: int):
+    from datetime import datetime, timedelta
+    from sqlalchemy import delete, func, insert, select
+    from app.db.database import SessionLocal, engine
+    from app.db.models import Base, Department, DepartmentClosure, Position, Schedule, User
+
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(seed)
+    db = SessionLocal()
+    try:
+        department = db.scalar(select(Department).where(Department.code == "BENCH"))
+        if department is None:
+            department = Department(code="BENCH", name="벤치마크")
+            db.add(department)
+        position = db.scalar(select(Position).order_by(Position.level.desc()).limit(1))
+        if position is None:
+            position = Position(name="사원", level=9)
+            db.add(position)
+        db.flush()
+        if db.get(DepartmentClosure, (department.id, department.id)) is None:
+            db.add(DepartmentClosure(ancestor_id=department.id, descendant_id=department.id, depth=0))
+
+        existing = db.scalar(select(func.count(User.id)).where(User.email.like("calendar-%@example.com")))
+        db.add_all([
+            User(
+                employee_id=f"CAL{i:05d}", name_kr=f"일정{i}", name_en=f"calendar{i}",
+                birth_date=datetime(1990, 1, 1), gender="남", hire_date=datetime(2020, 1, 1),
+                email=f"calendar-{i}@example.com", password="!", department_id=department.id,
+                position_id=position.id, phone_number="010", resume_file="", cover_letter_file="",
+            )
+            for i in range(existing, users)
+        ])
+        db.flush()
+        user_ids = list(db.scalars(
+            select(User.id).where(User.email.like("calendar-%@example.com")).order_by(User.id).limit(users)
+        ))
+
+        # 이전 실행의 벤치마크 일정 삭제
+        db.execute(delete(Schedule).where(Schedule.title.like("bench:%")))
+        rules = [
+            "FREQ=DAILY", "FREQ=DAILY;COUNT=30", "FREQ=DAILY;INTERVAL=2",
+            "FREQ=WEEKLY;BYDAY=MO,WE,FR", "FREQ=WEEKLY;BYDAY=TU", "FREQ=WEEKLY;INTERVAL=2;UNTIL=20271231",
+            "FREQ=MONTHLY", "FREQ=MONTHLY;COUNT=12",
+        ]
+        rows = []
+        for i in range(events + events // 2):
+            start = datetime(2024, 1, 1, 8) + timedelta(days=rng.randrange(3 * 365), minutes=15 * rng.randrange(40))
+            repeat_rule = rng.choice(rules) if i < events else None
+            rows.append({
+                "title": f"bench:{i}",
+                "start_time": start,
+                "end_time": start + timedelta(minutes=rng.choice((15, 30, 60, 120))),
+                "type": rng.choices(("사내", "부서", "개인"), (1, 4, 5))[0],
+                "owner_id": rng.choice(user_ids),
+                "is_repeat": repeat_rule is not None,
+                "repeat_rule": repeat_rule,
+            })
+        db.execute(insert(Schedule), rows)
+        department_id = department.id
+        db.commit()
+    finally:
+        db.close()
+    return user_ids[0], department_id
+
+
+def eager_expand(rows, start, end):
+    """비교용 — 반복마다 첫 발생부터 구간 끝까지 전부 만든 뒤 거르고 정렬한다"""
+    from app.services.recurrence import RecurrenceError, RecurrenceRule, occurrences
+    from app.services.schedule_calendar import Occurrence
+
+    materialized = []
+    for row in rows:
+        duration = row.end_time - row.start_time
+        try:
+            rule = RecurrenceRule.parse(row.repeat_rule) if row.is_repeat and row.repeat_rule else None
+        except RecurrenceError:
+            rule = None
+        if rule is None:
+            materialized.append(Occurrence(row.start_time, row.id, row.end_time, row))
+            continue
+        for at in occurrences(rule, row.start_time):
+            if at >= end:
+                break
+            materialized.append(Occurrence(at, row.id, at + duration, row))
+    return sorted(occurrence for occurrence in materialized if occurrence.start_time < end and occurrence.end_time > start)
+
+
+def measure(label, user_id, department_id, start, end, repeat, max_items):
+    from itertools import islice
+    from app.db.database import SessionLocal
+    from app.services.schedule_calendar import expand, visible_schedules
+
+    query_ms, page_ms, full_ms, eager_ms = [], [], [], []
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            rows = visible_schedules(db, user_id, department_id, start, end)
+            query_ms.append((time.perf_counter() - started) * 1000)
+        finally:
+            db.close()
+        started = time.perf_counter()
+        page = list(islice(expand(rows, start, end), max_items + 1))
+        page_ms.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        total = sum(1 for _ in expand(rows, start, end))
+        full_ms.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        eager = eager_expand(rows, start, end)
+        eager_ms.append((time.perf_counter() - started) * 1000)
+        assert len(eager) == total, (len(eager), total)
+    print(
+        f"{label:5s} rows {len(rows):6d}  occurrences {total:7d}  "
+        f"query {statistics.median(query_ms):7.1f} ms  "
+        f"lazy first {min(len(page), max_items)} {statistics.median(page_ms):7.1f} ms  "
+        f"lazy all {statistics.median(full_ms):7.1f} ms  "
+        f"eager {statistics.median(eager_ms):7.1f} ms"
+    )
+
+
+def main():
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000, help="반복 일정 수 (단건 일정은 절반)")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", action="store_true", help="DATABASE_URL 의 DB 를 그대로 사용")
+    args = parser.parse_args()
+
+    if not args.keep:
+        path = os.path.join(tempfile.mkdtemp(), "bench_schedule_range.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    print(f"DB: {os.environ.get('DATABASE_URL', '(기본 설정)')}")
+    user_id, department_id = prepare(args.events, args.users, args.seed)
+
+    from app.routers.schedules import SCHEDULE_RANGE_MAX_ITEMS
+
+    measure("month", user_id, department_id, datetime(2026, 11, 1), datetime(2026, 12, 1), args.repeat, SCHEDULE_RANGE_MAX_ITEMS)
+    measure("year", user_id, department_id, datetime(2026, 1, 1), datetime(2027, 1, 1), args.repeat, SCHEDULE_RANGE_MAX_ITEMS)
+
+
+if __name__ == "__main__":
+    main()
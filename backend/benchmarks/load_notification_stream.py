@@ -0,0 +1,235 @@
+"""실시간 알림 스트림 부하 테스트
+
+uvicorn 으로 앱을 띄우고 /notifications/stream 에 유휴 SSE 연결을 수천 개 붙인 뒤
+  1) 유휴 상태에서 서버 CPU 사용량/메모리 (클라이언트별 폴링이 없으므로 heartbeat 비용만 든다)
+  2) 직원마다 알림 한 건씩 outbox 에 넣었을 때 모든 연결에 도착하기까지의 지연
+을 측정한다. 연결은 원시 소켓으로 열어 클라이언트 쪽 부담을 줄인다.
+
+    python -m benchmarks.load_notification_stream --connections 2000 --users 200
+    DATABASE_URL=postgresql://... python -m benchmarks.load_notification_stream --keep --connections 5000
+"""
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def prepare(users: int):
+    from datetime import datetime, timedelta
+    from sqlalchemy import func, select
+    from app.db.database import SessionLocal, engine
+    from app.db.models import Base, Department, Position, User
+    from app.dependencies import create_access_token
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        department = db.scalar(select(Department).where(Department.code == "BENCH"))
+        if department is None:
+            department = Department(code="BENCH", name="벤치마크")
+            db.add(department)
+        position = db.scalar(select(Position).order_by(Position.level.desc()).limit(1))
+        if position is None:
+            position = Position(name="사원", level=9)
+            db.add(position)
+        db.flush()
+        existing = db.scalar(select(func.count(User.id)).where(User.email.like("stream-%@example.com")))
+        db.add_all([
+            User(
+                employee_id=f"STREAM{i:05d}", name_kr=f"알림{i}", name_en=f"stream{i}",
+                birth_date=datetime(1990, 1, 1), gender="남", hire_date=datetime(2020, 1, 1),
+                email=f"stream-{i}@example.com", password="!", department_id=department.id,
+                position_id=position.id, phone_number="010", resume_file="", cover_letter_file="",
+            )
+            for i in range(existing, users)
+        ])
+        db.commit()
+        user_ids = list(db.scalars(
+            select(User.id).where(User.email.like("stream-%@example.com")).order_by(User.id).limit(users)
+        ))
+    finally:
+        db.close()
+    return {user_id: create_access_token({"sub": str(user_id)}, timedelta(hours=1)) for user_id in user_ids}
+
+
+def process_stats(pid: int):
+    """(RSS MB, 누적 CPU 초)"""
+    with open(f"/proc/{pid}/status") as f:
+        rss = next(int(line.split()[1]) for line in f if line.startswith("VmRSS")) / 1024
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return rss, cpu
+
+
+class Client:
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.pings = 0
+        self.received = {}
+        self.error = None
+
+    async def run(self, port: int, token: str, connected: asyncio.Event, counter: list, total: int):
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                f"GET /notifications/stream?token={token} HTTP/1.1\r\nHost: bench\r\n"
+                f"Accept: text/event-stream\r\n\r\n".encode()
+            )
+            await writer.drain()
+            status = await reader.readline()
+            if b" 200 " not in status:
+                raise RuntimeError(status.decode().strip())
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            counter[0] += 1
+            if counter[0] == total:
+                connected.set()
+            # chunked 본문을 줄 단위로 읽는다 (청크 크기 행은 무시)
+            event_id = None
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                if line.startswith(b": ping"):
+                    self.pings += 1
+                elif line.startswith(b"id: "):
+                    event_id = int(line[4:])
+                elif line.startswith(b"event: notification") and event_id is not None:
+                    self.received[event_id] = time.perf_counter()
+        except Exception as exc:
+            self.error = exc
+            counter[0] += 1
+            if counter[0] == total:
+                connected.set()
+
+
+async def run(args, tokens, server_pid):
+    from sqlalchemy import select
+    from app.db.database import SessionLocal
+    from app.db.models import Notification
+    from app.services.notifications import enqueue_notifications
+
+    user_ids = list(tokens)
+    clients = [Client(user_ids[i % len(user_ids)]) for i in range(args.connections)]
+    connected = asyncio.Event()
+    counter = [0]
+    started = time.perf_counter()
+    tasks = []
+    for client in clients:
+        tasks.append(asyncio.create_task(client.run(args.port, tokens[client.user_id], connected, counter, len(clients))))
+        # 연결 폭주로 accept 큐가 넘치지 않도록 조금씩
+        if len(tasks) % 200 == 0:
+            await asyncio.sleep(0.05)
+    await connected.wait()
+    connect_elapsed = time.perf_counter() - started
+    errors = [client.error for client in clients if client.error]
+    print(f"connected {len(clients) - len(errors)}/{len(clients)} in {connect_elapsed:.2f}s"
+          + (f" (errors: {errors[0]!r} ...)" if errors else ""))
+
+    rss_before, cpu_before = process_stats(server_pid)
+    await asyncio.sleep(args.hold)
+    rss_after, cpu_after = process_stats(server_pid)
+    pings = sum(client.pings for client in clients)
+    print(f"idle {args.hold:.0f}s: server CPU {cpu_after - cpu_before:.2f}s "
+          f"({(cpu_after - cpu_before) / args.hold * 100:.1f}%), RSS {rss_after:.0f} MB, heartbeats {pings}")
+
+    # 직원마다 알림 한 건 → 같은 직원의 모든 연결로 fan-out
+    db = SessionLocal()
+    try:
+        last_id = db.scalar(select(Notification.id).order_by(Notification.id.desc()).limit(1)) or 0
+        enqueue_notifications(db, [
+            {"user_id": user_id, "type": "부하", "title": "부하 테스트", "content": "알림"} for user_id in user_ids
+        ], channels=["inapp"])
+        sent_at = time.perf_counter()
+        db.commit()
+    finally:
+        db.close()
+
+    deadline = time.monotonic() + 30
+    expected = len([client for client in clients if not client.error])
+    while time.monotonic() < deadline:
+        delivered = sum(1 for client in clients if any(event_id > last_id for event_id in client.received))
+        if delivered >= expected:
+            break
+        await asyncio.sleep(0.05)
+    latencies = [
+        min(at for event_id, at in client.received.items() if event_id > last_id) - sent_at
+        for client in clients if any(event_id > last_id for event_id in client.received)
+    ]
+    print(f"fan-out: delivered {len(latencies)}/{expected}"
+          + (f", p50 {percentile(latencies, 50) * 1000:.0f} ms, p99 {percentile(latencies, 99) * 1000:.0f} ms,"
+             f" max {max(latencies) * 1000:.0f} ms" if latencies else ""))
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--heartbeat", type=float, default=5, help="서버 heartbeat 주기 (초)")
+    parser.add_argument("--hold", type=float, default=15, help="유휴 측정 시간 (초)")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="DATABASE_URL 의 DB 를 그대로 사용")
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    if args.connections + 100 > hard:
+        print(f"열 수 있는 파일 수 한도({hard})가 부족합니다.")
+        sys.exit(1)
+
+    if not args.keep:
+        path = os.path.join(tempfile.mkdtemp(), "load_notification_stream.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    if not args.port:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            args.port = sock.getsockname()[1]
+    print(f"DB: {os.environ.get('DATABASE_URL', '(기본 설정)')}")
+    tokens = prepare(args.users)
+
+    env = {
+        **os.environ,
+        "NOTIFICATION_STREAM_HEARTBEAT_SECONDS": str(args.heartbeat),
+        "NOTIFICATION_POLL_SECONDS": "1",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-c", (
+            "import resource, uvicorn;"
+            "resource.setrlimit(resource.RLIMIT_NOFILE, (resource.getrlimit(resource.RLIMIT_NOFILE)[1],) * 2);"
+            f"uvicorn.run('app.main:app', host='127.0.0.1', port={args.port}, log_level='warning', backlog=4096)"
+        )],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env,
+    )
+    try:
+        for _ in range(200):
+            try:
+                socket.create_connection(("127.0.0.1", args.port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        asyncio.run(run(args, tokens, server.pid))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""결재 진행 엔진 동시성 스트레스 테스트
+
+결재 문서 하나에 단계(order)별 병렬 결재선을 만들고, 결재자마다 스레드를 여러 개 띄워
+같은 결정을 동시에 반복 전송한다 (더블 클릭/재시도 상황). 다른 트랜잭션이 문서를 잡고 있으면
+엔진이 ApprovalBusy 를 내므로 잠시 쉬었다 재시도한다.
+
+끝난 뒤 다음을 확인한다.
+  - 모든 결재선이 정확히 한 번만 변경되었다 (changed=True 횟수 == 결재선 수)
+  - 승인 시나리오: 문서 승인, 모든 결재선 승인
+  - 반려 시나리오: 문서 반려, 반려 단계 뒤의 결재선은 대기 그대로
+
+    python -m benchmarks.stress_approval_workflow --steps 4 --parallel 3 --threads 8
+    DATABASE_URL=postgresql://... python -m benchmarks.stress_approval_workflow --keep --reject-step 2
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def prepare(steps: int, parallel: int):
+    from datetime import datetime
+    from sqlalchemy import func, select
+    from app.db.database import SessionLocal, engine
+    from app.db.models import Approval, ApprovalLine, Base, Department, Position, User
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        department = db.scalar(select(Department).where(Department.code == "BENCH"))
+        if department is None:
+            department = Department(code="BENCH", name="벤치마크")
+            db.add(department)
+        position = db.scalar(select(Position).order_by(Position.level.desc()).limit(1))
+        if position is None:
+            position = Position(name="사원", level=9)
+            db.add(position)
+        db.flush()
+
+        needed = steps * parallel + 1
+        existing = db.scalar(select(func.count(User.id)).where(User.email.like("stress-%@example.com")))
+        db.add_all([
+            User(
+                employee_id=f"STRESS{i:05d}", name_kr=f"결재{i}", name_en=f"stress{i}",
+                birth_date=datetime(1990, 1, 1), gender="남", hire_date=datetime(2020, 1, 1),
+                email=f"stress-{i}@example.com", password="!", department_id=department.id,
+                position_id=position.id, phone_number="010", resume_file="", cover_letter_file="",
+            )
+            for i in range(existing, needed)
+        ])
+        db.flush()
+        user_ids = list(db.scalars(
+            select(User.id).where(User.email.like("stress-%@example.com")).order_by(User.id).limit(needed)
+        ))
+
+        approval = Approval(user_id=user_ids[0], type="스트레스", status="진행중", content="동시성 테스트")
+        db.add(approval)
+        db.flush()
+        lines = [
+            ApprovalLine(approval_id=approval.id, approver_id=user_ids[1 + step * parallel + k], order=step + 1, status="대기")
+            for step in range(steps)
+            for k in range(parallel)
+        ]
+        db.add_all(lines)
+        db.commit()
+        return approval.id, [(line.id, line.approver_id, line.order) for line in lines]
+    finally:
+        db.close()
+
+
+def worker(line, decision, deadline, stats, lock):
+    from sqlalchemy.exc import OperationalError
+    from app.db.database import SessionLocal
+    from app.services.approval_workflow import ApprovalBusy, ApprovalWorkflowError, decide
+
+    line_id, approver_id, _ = line
+    while time.monotonic() < deadline:
+        db = SessionLocal()
+        try:
+            result = decide(db, line_id, approver_id, decision)
+            db.commit()
+            with lock:
+                stats["changed" if result.changed else "repeat"] += 1
+                if result.changed:
+                    stats[f"line:{line_id}"] += 1
+                if result.approval_status != "진행중":
+                    return
+        except ApprovalBusy:
+            db.rollback()
+            with lock:
+                stats["busy"] += 1
+        except OperationalError:
+            # SQLite 쓰기 잠금 대기 초과 등 — 재시도
+            db.rollback()
+            with lock:
+                stats["db_locked"] += 1
+        except ApprovalWorkflowError as exc:
+            db.rollback()
+            with lock:
+                stats[f"{exc.status_code} {exc.detail}"] += 1
+            if exc.detail != "아직 결재 차례가 아닙니다.":
+                return
+        finally:
+            db.close()
+        time.sleep(random.uniform(0, 0.005))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=4, help="순차 단계 수")
+    parser.add_argument("--parallel", type=int, default=3, help="단계별 병렬 결재선 수")
+    parser.add_argument("--threads", type=int, default=8, help="결재선마다 동시에 보내는 스레드 수")
+    parser.add_argument("--reject-step", type=int, default=0, help="이 단계의 첫 결재자가 반려 (0 이면 모두 승인)")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--keep", action="store_true", help="DATABASE_URL 의 DB 를 그대로 사용")
+    args = parser.parse_args()
+
+    if not args.keep:
+        path = os.path.join(tempfile.mkdtemp(), "stress_approval.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    print(f"DB: {os.environ.get('DATABASE_URL', '(기본 설정)')}")
+    approval_id, lines = prepare(args.steps, args.parallel)
+
+    stats = Counter()
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.timeout
+    rejecter = next((line for line in lines if line[2] == args.reject_step), None)
+    threads = [
+        threading.Thread(target=worker, args=(line, "반려" if line is rejecter else "승인", deadline, stats, lock))
+        for line in lines
+        for _ in range(args.threads)
+    ]
+    random.shuffle(threads)
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    from app.db.database import SessionLocal
+    from app.db.models import Approval, ApprovalLine
+
+    db = SessionLocal()
+    try:
+        status = db.query(Approval.status).filter(Approval.id == approval_id).scalar()
+        line_status = dict(db.query(ApprovalLine.id, ApprovalLine.status).filter(ApprovalLine.approval_id == approval_id).all())
+    finally:
+        db.close()
+
+    print(f"threads={len(threads)} lines={len(lines)} elapsed={elapsed:.2f}s")
+    for key, value in sorted(stats.items()):
+        if not key.startswith("line:"):
+            print(f"  {key}: {value}")
+    print(f"approval: {status} / lines: {dict(Counter(line_status.values()))}")
+
+    failures = [f"line {line_id} 변경 {count}회" for line_id, count in
+                ((line[0], stats[f"line:{line[0]}"]) for line in lines) if count > 1]
+    if rejecter is None:
+        if status != "승인" or any(value != "승인" for value in line_status.values()):
+            failures.append("모든 결재선이 승인되지 않음")
+    else:
+        if status != "반려" or line_status[rejecter[0]] != "반려":
+            failures.append("반려로 종결되지 않음")
+        if any(line_status[line[0]] != "대기" for line in lines if line[2] > rejecter[2]):
+            failures.append("반려 뒤 단계가 처리됨")
+    if failures:
+        print("FAIL: " + ", ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
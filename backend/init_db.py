@@ -2,6 +2,7 @@ from app.db.database import SessionLocal, engine
 from app.db.models import Base, Department, Position, User
 from datetime import datetime
 from passlib.context import CryptContext
+from app.services.org import rebuild_closure
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
@@ -23,6 +24,8 @@ def init_db():
         ]
         for dept in departments:
             db.add(dept)
+        db.flush()
+        rebuild_closure(db)
         db.commit()
 
         # 직급 생성
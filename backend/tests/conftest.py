@@ -0,0 +1,80 @@
+import os
+import tempfile
+
+# 앱 모듈이 엔진을 만들기 전에 테스트용 SQLite 파일을 지정한다
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from app.db.database import SessionLocal, engine
+from app.db.models import Base, Department, DepartmentClosure, Position, User
+from app.dependencies import create_access_token
+from app.services.approval_routes import approval_routes
+from app.services.department_tree import department_tree
+from app.services.facility_availability import facility_availability
+from app.services.post_search import _memory_index
+from app.services.principal_cache import principal_cache
+from app.services.user_directory import user_counts
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    for cache in (approval_routes, department_tree, facility_availability, user_counts):
+        cache.invalidate()
+    principal_cache.clear()
+    _memory_index.reset()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    from app.main import app
+    # startup/shutdown 훅(풀 메트릭, 출퇴근 버퍼 등)은 띄우지 않는다
+    return TestClient(app)
+
+
+def make_department(db, id: int, parent_id=None, name=None) -> Department:
+    """부서와 closure 행 (상위 부서의 closure 가 먼저 있어야 한다)"""
+    department = Department(id=id, code=f"D{id}", name=name or f"부서{id}", parent_id=parent_id)
+    db.add(department)
+    db.flush()
+    db.add(DepartmentClosure(ancestor_id=id, descendant_id=id, depth=0))
+    if parent_id is not None:
+        for ancestor_id, depth in db.query(DepartmentClosure.ancestor_id, DepartmentClosure.depth).filter(
+            DepartmentClosure.descendant_id == parent_id
+        ).all():
+            db.add(DepartmentClosure(ancestor_id=ancestor_id, descendant_id=id, depth=depth + 1))
+    db.flush()
+    return department
+
+
+def make_position(db, id: int, level: int, name=None) -> Position:
+    position = Position(id=id, name=name or f"직급{level}", level=level)
+    db.add(position)
+    db.flush()
+    return position
+
+
+def make_user(db, id: int, department_id: int, position_id: int) -> User:
+    user = User(
+        id=id, employee_id=f"E{id:04d}", name_kr=f"직원{id}", name_en=f"user{id}",
+        birth_date=datetime(1990, 1, 1), gender="남", hire_date=datetime(2020, 1, 1),
+        email=f"user{id}@example.com", password="!", department_id=department_id,
+        position_id=position_id, phone_number="010", resume_file="", cover_letter_file="",
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+def auth_headers(user_id: int) -> dict:
+    token = create_access_token({"sub": str(user_id)}, expires_delta=timedelta(minutes=30))
+    return {"Authorization": f"Bearer {token}"}
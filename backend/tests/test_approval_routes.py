@@ -0,0 +1,129 @@
+from sqlalchemy import event
+import pytest
+from app.db.database import engine
+from app.db.models import ApprovalLine, ApprovalRouteTemplate, NotificationOutbox
+from app.services.approval_routes import approval_routes, route_for
+from conftest import auth_headers, make_department, make_position, make_user
+
+ADMIN = 1
+
+
+@pytest.fixture
+def org(db):
+    """본부(1) ─ 회계팀(2)
+
+    본부: 1 사장, 2 부장 / 회계팀: 3, 6 팀장, 4 사원
+    """
+    make_department(db, 1, name="본부")
+    make_department(db, 2, parent_id=1, name="회계팀")
+    for position_id, level, name in ((1, 1, "사장"), (2, 2, "부장"), (4, 4, "팀장"), (5, 5, "사원")):
+        make_position(db, position_id, level, name=name)
+    for user_id, department_id, position_id in ((1, 1, 1), (2, 1, 2), (3, 2, 4), (6, 2, 4), (4, 2, 5)):
+        make_user(db, user_id, department_id, position_id)
+    db.commit()
+
+
+def _template(client, steps, type="지출", min_amount=0, name=None):
+    response = client.post("/approvals/templates", headers=auth_headers(ADMIN), json={
+        "name": name or f"{type} {min_amount}", "type": type, "min_amount": min_amount, "steps": steps,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def _submit(client, user_id, **payload):
+    return client.post("/approvals/", headers=auth_headers(user_id), json={"type": "지출", "content": "비품", **payload})
+
+
+def _lines(body):
+    return [(line["approver_id"], line["order"]) for line in body["lines"]]
+
+
+def test_steps_walk_up_the_department_chain(client, db, org):
+    _template(client, [{"position_level": 4}, {"position_level": 2}, {"position_level": 1}])
+
+    response = _submit(client, 4)
+    assert response.status_code == 200, response.text
+    # 팀장은 회계팀에서, 부장/사장은 상위 부서에서 — 같은 직급이 여럿이면 첫 직원
+    assert _lines(response.json()) == [(3, 1), (2, 2), (1, 3)]
+    stored = db.query(ApprovalLine.approver_id, ApprovalLine.order, ApprovalLine.status).order_by(ApprovalLine.order).all()
+    assert [tuple(row) for row in stored] == [(3, 1, "대기"), (2, 2, "대기"), (1, 3, "대기")]
+    # 첫 단계 결재자에게만 요청 알림
+    assert [row.user_id for row in db.query(NotificationOutbox)] == [3]
+
+
+def test_parallel_step_takes_every_approver_at_that_level(client, org):
+    _template(client, [{"position_level": 4, "parallel": True}, {"position_level": 2}])
+    assert _lines(_submit(client, 4).json()) == [(3, 1), (6, 1), (2, 2)]
+
+
+def test_template_is_chosen_by_amount(client, org):
+    _template(client, [{"position_level": 4}])
+    _template(client, [{"position_level": 4}, {"position_level": 2}, {"position_level": 1}], min_amount=1000001)
+
+    assert _lines(_submit(client, 4, amount=50000).json()) == [(3, 1)]
+    assert _lines(_submit(client, 4, amount=1000001).json()) == [(3, 1), (2, 2), (1, 3)]
+    # 금액이 없으면 0 으로 본다
+    assert _lines(_submit(client, 4).json()) == [(3, 1)]
+
+
+def test_drafter_and_duplicates_are_pruned(client, org):
+    _template(client, [{"position_level": 4}, {"position_level": 4, "parallel": True}, {"position_level": 2}])
+    # 기안자 3 은 빠지고, 앞 단계에 이미 있는 결재자도 빠진다
+    assert _lines(_submit(client, 3).json()) == [(6, 1), (2, 2)]
+
+
+def test_no_matching_template_is_rejected(client, db, org):
+    _template(client, [{"position_level": 4}], min_amount=100000)
+
+    response = _submit(client, 4, type="휴가")
+    assert response.status_code == 400 and response.json()["detail"] == "적용할 결재 경로가 없습니다."
+    response = _submit(client, 4, amount=99999)
+    assert response.status_code == 400
+    assert route_for(db, 4, 2, "지출", 99999) is None
+
+    # 결재선을 직접 지정하면 템플릿 없이 상신
+    response = _submit(client, 4, type="휴가", lines=[{"approver_id": 2, "order": 1}])
+    assert response.status_code == 200 and _lines(response.json()) == [(2, 1)]
+
+
+def test_unresolvable_step_is_rejected(client, org):
+    _template(client, [{"position_level": 4}, {"position_level": 3}], name="구매")
+    response = _submit(client, 4)
+    assert response.status_code == 400
+    assert "'구매' 2단계 (직급 레벨 3)" in response.json()["detail"]
+
+
+def test_routes_are_cached_until_templates_change(client, db, org):
+    template_id = _template(client, [{"position_level": 4}])
+    assert route_for(db, 4, 2, "지출", None) == [[3]]
+
+    queries = []
+    listener = lambda *args: queries.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        assert route_for(db, 4, 2, "지출", None) == [[3]]
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert queries == []
+
+    # 라우터를 거치지 않은 변경은 캐시가 살아 있는 동안 보이지 않는다
+    db.query(ApprovalRouteTemplate).filter(ApprovalRouteTemplate.id == template_id).update({"steps": [{"position_level": 2}]})
+    db.commit()
+    assert route_for(db, 4, 2, "지출", None) == [[3]]
+    approval_routes.invalidate()
+    assert route_for(db, 4, 2, "지출", None) == [[2]]
+
+    # 템플릿 수정/추가/삭제 API 는 캐시를 비운다
+    response = client.put(f"/approvals/templates/{template_id}", headers=auth_headers(ADMIN), json={
+        "name": "지출", "type": "지출", "min_amount": 0, "steps": [{"position_level": 1}],
+    })
+    assert response.status_code == 200, response.text
+    assert route_for(db, 4, 2, "지출", None) == [[1]]
+
+    _template(client, [{"position_level": 2}], min_amount=10)
+    assert route_for(db, 4, 2, "지출", 10) == [[2]]
+
+    response = client.delete(f"/approvals/templates/{template_id}", headers=auth_headers(ADMIN))
+    assert response.status_code == 200, response.text
+    assert route_for(db, 4, 2, "지출", 0) is None
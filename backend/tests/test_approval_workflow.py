@@ -0,0 +1,122 @@
+from sqlalchemy import event
+import pytest
+from app.db.database import SessionLocal, engine
+from app.db.models import Approval, ApprovalLine
+from app.services.approval_workflow import (
+    APPROVED, IN_PROGRESS, REJECTED, ApprovalBusy, ApprovalWorkflowError, decide, workflow_notifications
+)
+from conftest import make_department, make_position, make_user
+
+AUTHOR = 1
+
+
+@pytest.fixture
+def approval(db):
+    """1단계: 2, 3 병렬 / 2단계: 4"""
+    make_department(db, 1)
+    make_position(db, 1, 5)
+    for user_id in (AUTHOR, 2, 3, 4):
+        make_user(db, user_id, 1, 1)
+    document = Approval(user_id=AUTHOR, type="지출", status=IN_PROGRESS, content="비품")
+    db.add(document)
+    db.flush()
+    db.add_all([
+        ApprovalLine(approval_id=document.id, approver_id=approver_id, order=order, status="대기")
+        for approver_id, order in ((2, 1), (3, 1), (4, 2))
+    ])
+    db.commit()
+    return document.id
+
+
+def _line_id(db, approval_id, approver_id):
+    return db.query(ApprovalLine.id).filter(
+        ApprovalLine.approval_id == approval_id, ApprovalLine.approver_id == approver_id
+    ).scalar()
+
+
+def _status(db, approval_id):
+    db.expire_all()
+    return db.query(Approval.status).filter(Approval.id == approval_id).scalar()
+
+
+def test_concurrent_decision_on_same_line_raises_busy(db, approval):
+    line_id = _line_id(db, approval, 2)
+    other = SessionLocal()
+    fired = []
+
+    # 이 세션이 결재선을 대기로 읽은 뒤 쓰기 직전에, 다른 트랜잭션이 같은 결재선을 먼저 처리하고 커밋
+    def before_update(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE approval_lines") and not fired:
+            fired.append(True)
+            decide(other, line_id, 2, REJECTED)
+            other.commit()
+
+    event.listen(engine, "before_cursor_execute", before_update)
+    try:
+        with pytest.raises(ApprovalBusy):
+            decide(db, line_id, 2, APPROVED)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_update)
+        db.rollback()
+        other.close()
+    assert _status(db, approval) == REJECTED
+
+
+def test_retrying_same_decision_is_idempotent(db, approval):
+    line_id = _line_id(db, approval, 2)
+    first = decide(db, line_id, 2, APPROVED, "확인")
+    db.commit()
+    assert first.changed
+
+    again = decide(db, line_id, 2, APPROVED, "확인")
+    db.commit()
+    assert not again.changed
+    assert again.line_status == APPROVED and again.approval_status == IN_PROGRESS
+    assert workflow_notifications(again) == []
+
+    # 다른 결정으로 바꾸는 것은 재시도가 아니다
+    with pytest.raises(ApprovalWorkflowError) as exc:
+        decide(db, line_id, 2, REJECTED)
+    assert exc.value.status_code == 409
+
+
+def test_reject_finalizes_and_skips_later_steps(db, approval):
+    result = decide(db, _line_id(db, approval, 2), 2, REJECTED, "반려")
+    db.commit()
+    assert result.finalized and result.approval_status == REJECTED
+    assert result.next_approver_ids == []
+    assert [n["user_id"] for n in workflow_notifications(result)] == [AUTHOR]
+    assert _status(db, approval) == REJECTED
+
+    # 같은 단계의 병렬 결재자도, 다음 단계 결재자도 더 이상 결정할 수 없다
+    for approver_id in (3, 4):
+        with pytest.raises(ApprovalWorkflowError) as exc:
+            decide(db, _line_id(db, approval, approver_id), approver_id, APPROVED)
+        assert exc.value.status_code == 409
+
+
+def test_parallel_step_finalizes_only_after_all_approve(db, approval):
+    first = decide(db, _line_id(db, approval, 2), 2, APPROVED)
+    db.commit()
+    assert not first.finalized and first.next_approver_ids == []
+
+    # 병렬 단계가 끝나기 전에는 다음 단계 차례가 아니다
+    with pytest.raises(ApprovalWorkflowError) as exc:
+        decide(db, _line_id(db, approval, 4), 4, APPROVED)
+    assert exc.value.status_code == 409
+
+    second = decide(db, _line_id(db, approval, 3), 3, APPROVED)
+    db.commit()
+    assert not second.finalized and second.next_approver_ids == [4]
+    assert _status(db, approval) == IN_PROGRESS
+
+    last = decide(db, _line_id(db, approval, 4), 4, APPROVED)
+    db.commit()
+    assert last.finalized and last.approval_status == APPROVED
+    assert _status(db, approval) == APPROVED
+
+
+def test_only_line_approver_can_decide(db, approval):
+    with pytest.raises(ApprovalWorkflowError) as exc:
+        decide(db, _line_id(db, approval, 2), 3, APPROVED)
+    assert exc.value.status_code == 403
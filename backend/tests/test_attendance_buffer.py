@@ -0,0 +1,58 @@
+import asyncio
+from datetime import datetime
+import pytest
+from app.db.models import Attendance
+from app.services import attendance_buffer as buffer_module
+from app.services.attendance_buffer import CHECK_IN, CHECK_OUT, AttendanceWriteBuffer
+from conftest import make_department, make_position, make_user
+
+
+@pytest.fixture
+def users(db):
+    make_department(db, 1)
+    make_position(db, 1, 5)
+    for user_id in (1, 2, 3):
+        make_user(db, user_id, 1, 1)
+    db.commit()
+
+
+def _submit_all(buffer, records):
+    async def run():
+        return await asyncio.gather(
+            *(buffer.submit(kind, user_id, at) for kind, user_id, at in records), return_exceptions=True
+        )
+    return asyncio.run(run())
+
+
+def test_batch_is_written_in_one_flush(db, users):
+    buffer = AttendanceWriteBuffer(interval_ms=10, max_rows=100)
+    results = _submit_all(buffer, [
+        (CHECK_IN, 1, datetime(2026, 3, 2, 9, 5)),
+        (CHECK_IN, 1, datetime(2026, 3, 2, 8, 55)),
+        (CHECK_OUT, 2, datetime(2026, 3, 2, 18, 0)),
+    ])
+    assert buffer.flush_count == 1
+    assert results[0]["check_in"] == results[1]["check_in"] == datetime(2026, 3, 2, 8, 55)
+    assert results[2]["status"] == "퇴근"
+    assert db.query(Attendance).count() == 2
+
+
+def test_failing_row_fails_only_its_submitter(db, users, monkeypatch):
+    refresh_rollups = buffer_module.refresh_rollups
+
+    def failing_refresh(session, keys):
+        if any(user_id == 2 for user_id, _ in keys):
+            raise RuntimeError("롤업 실패")
+        return refresh_rollups(session, keys)
+
+    monkeypatch.setattr(buffer_module, "refresh_rollups", failing_refresh)
+    buffer = AttendanceWriteBuffer(interval_ms=10, max_rows=100)
+    results = _submit_all(buffer, [
+        (CHECK_IN, 1, datetime(2026, 3, 2, 9, 0)),
+        (CHECK_IN, 2, datetime(2026, 3, 2, 9, 1)),
+        (CHECK_IN, 3, datetime(2026, 3, 2, 9, 2)),
+    ])
+    assert isinstance(results[1], RuntimeError)
+    assert results[0]["user_id"] == 1 and results[2]["user_id"] == 3
+    db.expire_all()
+    assert sorted(row.user_id for row in db.query(Attendance)) == [1, 3]
@@ -0,0 +1,31 @@
+import asyncio
+import json
+from app.db.database import AsyncSessionLocal
+from app.db.models import Department
+from app.services.department_tree import DepartmentTreeCache
+from conftest import make_department
+
+
+def _names(cache):
+    async def run():
+        async with AsyncSessionLocal() as session:
+            _, body = await cache.get(session, include_members=False)
+        return [node["name"] for node in json.loads(body)]
+    return asyncio.run(run())
+
+
+def test_tree_is_cached_until_ttl(db, monkeypatch):
+    make_department(db, 1, name="경영")
+    db.commit()
+    now = [1000.0]
+    monkeypatch.setattr("app.services.department_tree.time.monotonic", lambda: now[0])
+    cache = DepartmentTreeCache(ttl=60)
+    assert _names(cache) == ["경영"]
+
+    # 다른 프로세스가 바꾼 것처럼 캐시를 거치지 않고 변경
+    db.query(Department).filter(Department.id == 1).update({"name": "경영지원"})
+    db.commit()
+    now[0] += 59
+    assert _names(cache) == ["경영"]
+    now[0] += 1
+    assert _names(cache) == ["경영지원"]
@@ -0,0 +1,128 @@
+from datetime import date, datetime, timedelta
+from sqlalchemy import event
+import pytest
+from app.db.database import engine
+from app.db.models import Facility, Reservation
+from app.services.facility_availability import APPROVED, FREE, PENDING, encode_day, load_occupancy
+from conftest import auth_headers, make_department, make_position, make_user
+
+DAY = date(2026, 3, 2)
+
+
+def at(hour, minute=0, day=2):
+    return datetime(2026, 3, day, hour, minute)
+
+
+@pytest.fixture
+def facilities(db):
+    make_department(db, 1)
+    make_position(db, 1, 1, name="사장")
+    make_user(db, 1, 1, 1)
+    db.add_all([
+        Facility(id=1, name="대회의실", location="본관", capacity=20, status="사용가능"),
+        Facility(id=2, name="소회의실", location="본관", capacity=4, status="사용가능"),
+    ])
+    db.commit()
+
+
+@pytest.fixture
+def reservation_queries():
+    queries = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM reservations" in statement:
+            queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    yield queries
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def _grid(client, **params):
+    response = client.get("/facilities/availability", headers=auth_headers(1), params={"from": "2026-03-02", "to": "2026-03-02", "slot": 60, **params})
+    assert response.status_code == 200, response.text
+    return {
+        (facility["facility_id"], day["date"]): day["runs"]
+        for facility in response.json()["facilities"] for day in facility["days"]
+    }
+
+
+def test_encode_day_marks_partial_slots_and_keeps_stronger_state():
+    occupancy = [(at(9), at(10, 15), PENDING), (at(10), at(11), APPROVED)]
+    # 10:15 까지 걸친 예약은 10:00~10:30 슬롯까지, 겹치는 슬롯은 승인이 우선
+    assert encode_day(DAY, occupancy, timedelta(minutes=30)) == [[FREE, 18], [PENDING, 2], [APPROVED, 2], [FREE, 26]]
+    assert encode_day(DAY, [], timedelta(minutes=15)) == [[FREE, 96]]
+
+
+def test_load_occupancy_splits_reservations_across_days(db, facilities):
+    db.add_all([
+        Reservation(facility_id=1, user_id=1, start_time=at(22, day=1), end_time=at(2), status="승인"),
+        Reservation(facility_id=1, user_id=1, start_time=at(9), end_time=at(10), status="취소"),
+        Reservation(facility_id=2, user_id=1, start_time=at(23), end_time=at(1, day=3), status="예약"),
+    ])
+    db.commit()
+    occupancy = load_occupancy(db, [1, 2], [DAY, date(2026, 3, 3)])
+    assert occupancy[(1, DAY)] == [(at(0), at(2), APPROVED)]
+    assert occupancy[(1, date(2026, 3, 3))] == []
+    assert occupancy[(2, DAY)] == [(at(23), at(0, day=3), PENDING)]
+    assert occupancy[(2, date(2026, 3, 3))] == [(at(0, day=3), at(1, day=3), PENDING)]
+
+
+def test_grid_reflects_reservations(client, db, facilities):
+    db.add_all([
+        Reservation(facility_id=1, user_id=1, start_time=at(9), end_time=at(10), status="예약"),
+        Reservation(facility_id=1, user_id=1, start_time=at(10), end_time=at(11, 30), status="승인"),
+        Reservation(facility_id=1, user_id=1, start_time=at(14), end_time=at(15), status="취소"),
+    ])
+    db.commit()
+    grid = _grid(client, to="2026-03-03")
+    assert grid[(1, "2026-03-02")] == [[FREE, 9], [PENDING, 1], [APPROVED, 2], [FREE, 12]]
+    assert grid[(1, "2026-03-03")] == [[FREE, 24]]
+    assert grid[(2, "2026-03-02")] == [[FREE, 24]]
+
+    # 시설 필터
+    assert set(_grid(client, facility_id=2)) == {(2, "2026-03-02")}
+
+
+def test_grid_cache_is_invalidated_by_reservation_changes(client, db, facilities, reservation_queries):
+    assert _grid(client)[(1, "2026-03-02")] == [[FREE, 24]]
+    assert len(reservation_queries) == 1
+    # 캐시 적중 — 슬롯 크기가 달라도 다시 조회하지 않는다
+    assert _grid(client, slot=30)[(1, "2026-03-02")] == [[FREE, 48]]
+    assert len(reservation_queries) == 1
+
+    # 라우터를 거치지 않은 변경은 TTL 전까지 보이지 않는다
+    db.add(Reservation(facility_id=1, user_id=1, start_time=at(8), end_time=at(9), status="예약"))
+    db.commit()
+    assert _grid(client)[(1, "2026-03-02")] == [[FREE, 24]]
+
+    # 예약 생성은 해당 (시설, 날짜) 를 무효화
+    response = client.post("/reservations/", headers=auth_headers(1), json={
+        "facility_id": 1, "start_time": "2026-03-02T13:00:00", "end_time": "2026-03-02T14:00:00",
+    })
+    assert response.status_code == 200, response.text
+    reservation_id = response.json()[0]["id"]
+    assert _grid(client)[(1, "2026-03-02")] == [[FREE, 8], [PENDING, 1], [FREE, 4], [PENDING, 1], [FREE, 10]]
+    # 다른 시설은 캐시 그대로
+    queries = len(reservation_queries)
+    assert _grid(client, facility_id=2)[(2, "2026-03-02")] == [[FREE, 24]]
+    assert len(reservation_queries) == queries
+
+    response = client.put(f"/reservations/{reservation_id}/approve", headers=auth_headers(1))
+    assert response.status_code == 200, response.text
+    assert _grid(client)[(1, "2026-03-02")] == [[FREE, 8], [PENDING, 1], [FREE, 4], [APPROVED, 1], [FREE, 10]]
+
+    response = client.put(f"/reservations/{reservation_id}/cancel", headers=auth_headers(1))
+    assert response.status_code == 200, response.text
+    assert _grid(client)[(1, "2026-03-02")] == [[FREE, 8], [PENDING, 1], [FREE, 15]]
+
+
+@pytest.mark.parametrize("params", [
+    {"from": "2026-03-03", "to": "2026-03-02"},
+    {"to": "2026-05-31"},
+    {"slot": 7},
+    {"slot": 120},
+])
+def test_grid_rejects_bad_ranges(client, facilities, params):
+    response = client.get("/facilities/availability", headers=auth_headers(1), params={"from": "2026-03-02", "to": "2026-03-02", **params})
+    assert response.status_code == 400
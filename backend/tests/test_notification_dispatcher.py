@@ -0,0 +1,111 @@
+from datetime import datetime
+import pytest
+from app.db.models import Notification, NotificationOutbox
+from app.services import notification_dispatcher as dispatcher
+from app.services.notification_dispatcher import EmailChannel, dispatch_batch, retry_delay
+from app.services.notifications import enqueue_notifications
+from app.services.smtp_sink import SmtpSink
+from conftest import make_department, make_position, make_user
+
+
+@pytest.fixture
+def users(db):
+    make_department(db, 1)
+    make_position(db, 1, 5)
+    for user_id in (1, 2, 3):
+        make_user(db, user_id, 1, 1)
+    db.commit()
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    sink = SmtpSink(port=0, reject="user2@", defer="user3@").start()
+    monkeypatch.setitem(dispatcher.channels, EmailChannel.name, EmailChannel("127.0.0.1", sink.port))
+    yield sink
+    sink.stop()
+
+
+def _enqueue(db, user_ids, channel):
+    enqueue_notifications(db, [
+        {"user_id": user_id, "type": "결재", "title": "결재 요청", "content": "결재 요청이 도착했습니다."}
+        for user_id in user_ids
+    ], channels=[channel])
+    db.commit()
+
+
+def _outbox(db):
+    db.expire_all()
+    return {row.user_id: row for row in db.query(NotificationOutbox)}
+
+
+def test_email_is_sent_through_smtp(db, users, sink):
+    _enqueue(db, [1], "email")
+    assert dispatch_batch(db) == 1
+
+    row = _outbox(db)[1]
+    assert row.status == "sent" and row.attempts == 1 and row.sent_at is not None
+    assert [(message["To"], message["Subject"]) for message in sink.messages] == [("user1@example.com", "[결재] 결재 요청")]
+
+
+def test_rejected_recipient_is_failed_without_retry(db, users, sink):
+    _enqueue(db, [1, 2], "email")
+    dispatch_batch(db)
+
+    rows = _outbox(db)
+    assert rows[1].status == "sent"
+    assert rows[2].status == "failed" and "550" in rows[2].last_error
+    assert [message["To"] for message in sink.messages] == ["user1@example.com"]
+
+
+def test_deferred_recipient_is_rescheduled_with_backoff(db, users, sink):
+    _enqueue(db, [3], "email")
+    before = datetime.utcnow()
+    dispatch_batch(db)
+
+    row = _outbox(db)[3]
+    assert row.status == "pending" and row.attempts == 1 and "451" in row.last_error
+    assert row.next_attempt_at >= before + retry_delay(1)
+    # 다음 시도 시각 전에는 다시 가져가지 않는다
+    assert dispatch_batch(db) == 0
+
+
+def test_unreachable_server_is_rescheduled(db, users, monkeypatch):
+    sink = SmtpSink(port=0).start()
+    port = sink.port
+    sink.stop()
+    monkeypatch.setitem(dispatcher.channels, EmailChannel.name, EmailChannel("127.0.0.1", port, timeout=1))
+    _enqueue(db, [1, 2], "email")
+    dispatch_batch(db)
+
+    for row in _outbox(db).values():
+        assert row.status == "pending" and row.attempts == 1 and row.last_error
+        assert row.next_attempt_at > row.created_at
+
+
+def test_inapp_delivery_writes_notifications(db, users):
+    _enqueue(db, [1, 2], "inapp")
+    assert dispatch_batch(db) == 2
+
+    assert all(row.status == "sent" for row in _outbox(db).values())
+    notifications = db.query(Notification.user_id, Notification.title, Notification.is_read).order_by(Notification.user_id).all()
+    assert [tuple(row) for row in notifications] == [(1, "결재 요청", False), (2, "결재 요청", False)]
+    # 이미 보낸 행은 다시 보내지 않는다
+    assert dispatch_batch(db) == 0
+    assert db.query(Notification).count() == 2
+
+
+def test_connection_drop_retries_only_unsent_rows(db, users, monkeypatch):
+    sink = SmtpSink(port=0, drop_after=1).start()
+    try:
+        monkeypatch.setitem(dispatcher.channels, EmailChannel.name, EmailChannel("127.0.0.1", sink.port))
+        _enqueue(db, [1, 2, 3], "email")
+        dispatch_batch(db)
+    finally:
+        sink.stop()
+
+    rows = _outbox(db)
+    assert [message["To"] for message in sink.messages] == ["user1@example.com"]
+    assert rows[1].status == "sent" and rows[1].last_error is None
+    for user_id in (2, 3):
+        assert rows[user_id].status == "pending" and rows[user_id].attempts == 1
+        assert "SMTPServerDisconnected" in rows[user_id].last_error
@@ -0,0 +1,105 @@
+import pytest
+from app.db.models import Board, Comment, Post
+from app.services import post_search
+from app.services.post_search import highlight, make_snippet, search_posts
+from conftest import auth_headers, make_department, make_position, make_user
+
+
+@pytest.fixture
+def board(db):
+    make_department(db, 1)
+    make_position(db, 1, 1, name="사장")
+    make_user(db, 1, 1, 1)
+    db.add(Board(id=1, name="자유게시판"))
+    db.commit()
+    return 1
+
+
+def _add_post(db, title, content, comments=()):
+    post = Post(board_id=1, user_id=1, title=title, content=content)
+    db.add(post)
+    db.flush()
+    db.add_all([Comment(post_id=post.id, user_id=1, content=comment) for comment in comments])
+    db.commit()
+    return post.id
+
+
+def _search(client, q):
+    response = client.get("/posts/search", params={"q": q}, headers=auth_headers(1))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_make_snippet_windows_around_first_match():
+    content = "가" * 100 + " 분기 회의록 " + "나" * 100
+    snippet = make_snippet(content, "회의", width=40)
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "<mark>회의</mark>" in snippet
+    assert len(snippet.replace("<mark>", "").replace("</mark>", "")) == 40 + 2
+
+
+def test_make_snippet_without_match_and_escaping():
+    assert make_snippet("짧은 본문", "없음") == "짧은 본문"
+    assert make_snippet("<b>회의</b> 안내", "회의") == "&lt;b&gt;<mark>회의</mark>&lt;/b&gt; 안내"
+
+
+def test_highlight_keeps_whole_title():
+    title = "2026년 상반기 영업팀 전체 회의록"
+    assert highlight(title, "회의") == "2026년 상반기 영업팀 전체 <mark>회의</mark>록"
+    # 겹치는 bigram 은 하나로 합친다
+    assert highlight("회의실 예약", "회의실") == "<mark>회의실</mark> 예약"
+    assert highlight("Weekly Report", "report") == "Weekly <mark>Report</mark>"
+
+
+def test_ranking_title_over_content_over_comments(db, board):
+    in_comment = _add_post(db, "점심 메뉴", "오늘 점심", comments=["예산 회의 끝나고"])
+    in_content = _add_post(db, "공지", "다음 주 예산 회의 일정")
+    in_title = _add_post(db, "예산 회의 결과", "내용 참고")
+    _add_post(db, "무관한 글", "내용 없음")
+
+    total, items = search_posts(db, "예산 회의", None, 0, 10)
+    assert total == 3
+    assert [item["id"] for item in items] == [in_title, in_content, in_comment]
+    assert items[0]["title_highlight"] == "<mark>예산</mark> <mark>회의</mark> 결과"
+    assert "<mark>예산</mark>" in items[1]["snippet"]
+
+
+def test_search_endpoint_title_highlight_late_match(client, db, board):
+    _add_post(db, "2026년 상반기 영업팀 전체 회의록", "본문")
+    body = _search(client, "회의록")
+    assert body["total"] == 1
+    assert body["items"][0]["title_highlight"] == "2026년 상반기 영업팀 전체 <mark>회의록</mark>"
+
+
+def test_create_update_delete_are_reflected(client, db, board):
+    headers = auth_headers(1)
+    assert _search(client, "워크숍")["total"] == 0  # 인덱스 적재
+
+    response = client.post("/posts/", headers=headers, json={"board_id": 1, "title": "가을 워크숍 안내", "content": "장소 미정"})
+    assert response.status_code == 200, response.text
+    post_id = response.json()["id"]
+    assert [item["id"] for item in _search(client, "워크숍")["items"]] == [post_id]
+
+    response = client.put(f"/posts/{post_id}", headers=headers, json={"title": "가을 체육대회 안내"})
+    assert response.status_code == 200, response.text
+    assert _search(client, "워크숍")["total"] == 0
+    assert [item["id"] for item in _search(client, "체육대회")["items"]] == [post_id]
+
+    response = client.delete(f"/posts/{post_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    assert _search(client, "체육대회")["total"] == 0
+
+
+def test_index_changes_only_after_commit(db, board):
+    kept = _add_post(db, "보안 점검 안내", "내용")
+    assert search_posts(db, "보안", None, 0, 10)[0] == 1  # 인덱스 적재
+
+    # 커밋되지 않은 새 글과 삭제는 반영되지 않는다
+    post = Post(board_id=1, user_id=1, title="보안 교육", content="내용")
+    db.add(post)
+    db.flush()
+    post_search.index_post(db, post.id)
+    post_search.remove_post(db, kept)
+    db.rollback()
+    _, items = search_posts(db, "보안", None, 0, 10)
+    assert [item["id"] for item in items] == [kept]
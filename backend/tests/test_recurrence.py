@@ -0,0 +1,154 @@
+from datetime import date, datetime, timedelta
+import pytest
+from app.db.models import Facility, Reservation
+from app.services.recurrence import RecurrenceError, RecurrenceRule, between, expand, occurrences
+from conftest import auth_headers, make_department, make_position, make_user
+
+
+@pytest.mark.parametrize("rule, dtstart, exdates, expected", [
+    # 수요일에 시작한 주 3회 — 시작 전의 월요일은 COUNT 에 들어가지 않는다
+    (
+        "FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=4", datetime(2026, 3, 4, 10), (),
+        [datetime(2026, 3, 4, 10), datetime(2026, 3, 6, 10), datetime(2026, 3, 9, 10), datetime(2026, 3, 11, 10)],
+    ),
+    (
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH;COUNT=3", datetime(2026, 3, 5, 9), (),
+        [datetime(2026, 3, 5, 9), datetime(2026, 3, 17, 9), datetime(2026, 3, 19, 9)],
+    ),
+    # 31일이 없는 달은 건너뛴다
+    (
+        "FREQ=MONTHLY;COUNT=4", datetime(2026, 1, 31, 14), (),
+        [datetime(2026, 1, 31, 14), datetime(2026, 3, 31, 14), datetime(2026, 5, 31, 14), datetime(2026, 7, 31, 14)],
+    ),
+    (
+        "FREQ=MONTHLY;UNTIL=20240401", datetime(2024, 1, 30, 9), (),
+        [datetime(2024, 1, 30, 9), datetime(2024, 3, 30, 9)],
+    ),
+    # 날짜만 준 UNTIL 은 그 날 끝까지 포함
+    (
+        "FREQ=DAILY;UNTIL=20260305", datetime(2026, 3, 3, 18), (),
+        [datetime(2026, 3, 3, 18), datetime(2026, 3, 4, 18), datetime(2026, 3, 5, 18)],
+    ),
+    (
+        "FREQ=DAILY;UNTIL=2026-03-04", datetime(2026, 3, 3, 23, 30), (),
+        [datetime(2026, 3, 3, 23, 30), datetime(2026, 3, 4, 23, 30)],
+    ),
+    # 예외 날짜는 COUNT 를 센 뒤에 빠진다 (대신할 회차를 더 만들지 않는다)
+    (
+        "FREQ=WEEKLY;COUNT=3", datetime(2026, 3, 2, 9), (date(2026, 3, 9),),
+        [datetime(2026, 3, 2, 9), datetime(2026, 3, 16, 9)],
+    ),
+    (
+        "RRULE:FREQ=DAILY;INTERVAL=3;COUNT=3", datetime(2026, 2, 26, 8), (),
+        [datetime(2026, 2, 26, 8), datetime(2026, 3, 1, 8), datetime(2026, 3, 4, 8)],
+    ),
+])
+def test_expand(rule, dtstart, exdates, expected):
+    assert expand(RecurrenceRule.parse(rule), dtstart, set(exdates)) == expected
+
+
+@pytest.mark.parametrize("rule, dtstart, duration, start, end, expected", [
+    (
+        "FREQ=DAILY", datetime(2020, 1, 1, 9), timedelta(hours=1),
+        datetime(2026, 3, 2), datetime(2026, 3, 4),
+        [datetime(2026, 3, 2, 9), datetime(2026, 3, 3, 9)],
+    ),
+    # 구간 시작 전에 시작했지만 걸쳐 있는 발생은 포함
+    (
+        "FREQ=DAILY", datetime(2020, 1, 1, 9), timedelta(hours=1),
+        datetime(2026, 3, 2, 9, 30), datetime(2026, 3, 3, 9),
+        [datetime(2026, 3, 2, 9)],
+    ),
+    (
+        "FREQ=WEEKLY;BYDAY=MO,FR", datetime(2021, 6, 2, 10), timedelta(minutes=30),
+        datetime(2026, 3, 1), datetime(2026, 3, 10),
+        [datetime(2026, 3, 2, 10), datetime(2026, 3, 6, 10), datetime(2026, 3, 9, 10)],
+    ),
+    (
+        "FREQ=MONTHLY", datetime(2020, 1, 31, 9), timedelta(hours=1),
+        datetime(2026, 2, 1), datetime(2026, 4, 1),
+        [datetime(2026, 3, 31, 9)],
+    ),
+    # 여러 날에 걸치는 발생
+    (
+        "FREQ=WEEKLY;INTERVAL=2", datetime(2026, 1, 5, 18), timedelta(days=2),
+        datetime(2026, 3, 3), datetime(2026, 3, 4),
+        [datetime(2026, 3, 2, 18)],
+    ),
+    (
+        "FREQ=DAILY;COUNT=5", datetime(2026, 3, 1, 9), timedelta(hours=1),
+        datetime(2026, 3, 4), datetime(2026, 4, 1),
+        [datetime(2026, 3, 4, 9), datetime(2026, 3, 5, 9)],
+    ),
+])
+def test_between(rule, dtstart, duration, start, end, expected):
+    parsed = RecurrenceRule.parse(rule)
+    assert list(between(parsed, dtstart, duration, start, end)) == expected
+
+    # 처음부터 펼친 뒤 거른 결과와 같아야 한다
+    brute = []
+    for at in occurrences(parsed, dtstart):
+        if at >= end:
+            break
+        if at + duration > start:
+            brute.append(at)
+    assert brute == expected
+
+
+def test_between_skips_exdates():
+    rule = RecurrenceRule.parse("FREQ=DAILY")
+    found = between(rule, datetime(2026, 1, 1, 9), timedelta(hours=1), datetime(2026, 3, 1), datetime(2026, 3, 4), {date(2026, 3, 2)})
+    assert list(found) == [datetime(2026, 3, 1, 9), datetime(2026, 3, 3, 9)]
+
+
+@pytest.mark.parametrize("rule", [
+    "", "FREQ=YEARLY", "FREQ=DAILY;COUNT=0", "FREQ=DAILY;INTERVAL=x",
+    "FREQ=DAILY;COUNT=2;UNTIL=20261231", "FREQ=DAILY;BYDAY=MO", "FREQ=WEEKLY;BYDAY=XX",
+    "FREQ=WEEKLY;UNTIL=2026/12/31", "FREQ=WEEKLY;BYMONTH=1",
+])
+def test_invalid_rules(rule):
+    with pytest.raises(RecurrenceError):
+        RecurrenceRule.parse(rule)
+
+
+def test_expand_requires_bound_and_limit():
+    with pytest.raises(RecurrenceError):
+        expand(RecurrenceRule.parse("FREQ=DAILY"), datetime(2026, 3, 2, 9))
+    with pytest.raises(RecurrenceError):
+        expand(RecurrenceRule.parse("FREQ=DAILY;COUNT=10"), datetime(2026, 3, 2, 9), limit=5)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("weekly", "FREQ=WEEKLY;COUNT=4"),
+    ("Daily", "FREQ=DAILY;COUNT=4"),
+    # COUNT/UNTIL 을 직접 준 규칙은 그대로
+    ("FREQ=WEEKLY", "FREQ=WEEKLY"),
+    ("FREQ=MONTHLY;UNTIL=20261231", "FREQ=MONTHLY;UNTIL=20261231T235959"),
+])
+def test_shorthand_default_count(text, expected):
+    assert str(RecurrenceRule.parse(text, default_count=4)) == expected
+
+
+def test_reservation_with_shorthand_repeat_creates_four(db, client):
+    make_department(db, 1)
+    make_position(db, 1, 5)
+    make_user(db, 1, 1, 1)
+    db.add(Facility(id=1, name="회의실", location="본관", capacity=8, status="사용가능"))
+    db.commit()
+
+    response = client.post("/reservations/", headers=auth_headers(1), json={
+        "facility_id": 1, "start_time": "2026-03-02T10:00:00", "end_time": "2026-03-02T11:00:00",
+        "repeat_rule": "weekly",
+    })
+    assert response.status_code == 200, response.text
+    assert [item["start_time"] for item in response.json()] == [
+        "2026-03-02T10:00:00", "2026-03-09T10:00:00", "2026-03-16T10:00:00", "2026-03-23T10:00:00",
+    ]
+    assert {row.repeat_rule for row in db.query(Reservation)} == {"FREQ=WEEKLY;COUNT=4"}
+
+    # 끝이 없는 RRULE 은 여전히 거부
+    response = client.post("/reservations/", headers=auth_headers(1), json={
+        "facility_id": 1, "start_time": "2026-04-01T10:00:00", "end_time": "2026-04-01T11:00:00",
+        "repeat_rule": "FREQ=WEEKLY",
+    })
+    assert response.status_code == 400
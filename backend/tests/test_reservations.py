@@ -0,0 +1,102 @@
+from datetime import date, datetime, timedelta
+import random
+import pytest
+from app.db.models import Facility, Reservation
+from app.services.reservations import IntervalIndex, free_intervals, merge_intervals
+from conftest import auth_headers, make_department, make_position, make_user
+
+
+def at(hour, minute=0, day=2):
+    return datetime(2026, 3, day, hour, minute)
+
+
+class TestIntervalIndex:
+    def test_empty_tree(self):
+        index = IntervalIndex([])
+        assert len(index) == 0
+        assert index.overlapping(at(9), at(10)) == []
+
+    def test_touching_intervals_do_not_overlap(self):
+        index = IntervalIndex([(at(9), at(10), "a"), (at(11), at(12), "b")])
+        assert index.overlapping(at(10), at(11)) == []
+        assert index.overlapping(at(8), at(9)) == []
+        assert index.overlapping(at(12), at(13)) == []
+
+    def test_containment_both_ways(self):
+        index = IntervalIndex([(at(9), at(17), "day"), (at(13), at(14), "meeting")])
+        assert sorted(index.overlapping(at(10), at(11))) == ["day"]
+        assert sorted(index.overlapping(at(8), at(18))) == ["day", "meeting"]
+        assert sorted(index.overlapping(at(13, 30), at(13, 45))) == ["day", "meeting"]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        items = []
+        for i in range(300):
+            start = at(0) + timedelta(minutes=15 * rng.randrange(400))
+            items.append((start, start + timedelta(minutes=15 * rng.randrange(1, 40)), i))
+        index = IntervalIndex(items)
+        for _ in range(200):
+            start = at(0) + timedelta(minutes=15 * rng.randrange(400))
+            end = start + timedelta(minutes=15 * rng.randrange(1, 20))
+            expected = sorted(i for item_start, item_end, i in items if item_start < end and item_end > start)
+            assert sorted(index.overlapping(start, end)) == expected
+
+
+@pytest.mark.parametrize("intervals, expected", [
+    ([], []),
+    ([(at(9), at(10))], [(at(9), at(10))]),
+    # 맞닿은 구간은 합친다
+    ([(at(10), at(11)), (at(9), at(10))], [(at(9), at(11))]),
+    # 포함된 구간은 사라진다
+    ([(at(9), at(17)), (at(12), at(13))], [(at(9), at(17))]),
+    ([(at(9), at(10)), (at(9, 30), at(11)), (at(13), at(14))], [(at(9), at(11)), (at(13), at(14))]),
+])
+def test_merge_intervals(intervals, expected):
+    assert merge_intervals(intervals) == expected
+
+
+@pytest.mark.parametrize("busy, expected", [
+    ([], [(at(9), at(18))]),
+    ([(at(9), at(18))], []),
+    # 범위를 벗어난 부분은 잘라낸다
+    ([(at(8), at(10)), (at(17), at(19))], [(at(10), at(17))]),
+    ([(at(11), at(12)), (at(10), at(11)), (at(14), at(15))], [(at(9), at(10)), (at(12), at(14)), (at(15), at(18))]),
+    ([(at(6), at(7)), (at(19), at(20))], [(at(9), at(18))]),
+])
+def test_free_intervals(busy, expected):
+    assert free_intervals(busy, at(9), at(18)) == expected
+
+
+def test_availability_endpoint(db, client):
+    make_department(db, 1)
+    make_position(db, 1, 5)
+    make_user(db, 1, 1, 1)
+    db.add(Facility(id=1, name="회의실", location="본관", capacity=8, status="사용가능"))
+    db.add_all([
+        # 전날부터 이어지는 예약은 자정부터로 잘린다
+        Reservation(facility_id=1, user_id=1, start_time=at(22, day=1), end_time=at(1), status="승인"),
+        Reservation(facility_id=1, user_id=1, start_time=at(9), end_time=at(10), status="예약"),
+        Reservation(facility_id=1, user_id=1, start_time=at(10), end_time=at(11), status="승인"),
+        Reservation(facility_id=1, user_id=1, start_time=at(13), end_time=at(14), status="취소"),
+        Reservation(facility_id=1, user_id=1, start_time=at(23), end_time=at(2, day=3), status="예약"),
+    ])
+    db.commit()
+
+    response = client.get("/reservations/availability", params={"facility_id": 1, "date": "2026-03-02"}, headers=auth_headers(1))
+    assert response.status_code == 200
+    body = response.json()
+    assert body["facility_id"] == 1 and body["date"] == "2026-03-02"
+    assert [(item["start_time"], item["end_time"]) for item in body["busy"]] == [
+        ("2026-03-02T00:00:00", "2026-03-02T01:00:00"),
+        ("2026-03-02T09:00:00", "2026-03-02T11:00:00"),
+        ("2026-03-02T23:00:00", "2026-03-03T00:00:00"),
+    ]
+    assert [(item["start_time"], item["end_time"]) for item in body["free"]] == [
+        ("2026-03-02T01:00:00", "2026-03-02T09:00:00"),
+        ("2026-03-02T11:00:00", "2026-03-02T23:00:00"),
+    ]
+
+
+def test_availability_requires_login(client):
+    response = client.get("/reservations/availability", params={"facility_id": 1, "date": "2026-03-02"})
+    assert response.status_code == 401
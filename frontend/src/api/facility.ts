@@ -51,6 +51,14 @@ export const facilityApi = {
     return axios.delete(`${API_BASE_URL}/facilities/reservations/${reservationId}`);
   },
 
+  // 시설별 점유 격자: days[].runs = [[상태(0 빈 시간, 1 예약, 2 승인), 연속 슬롯 수], ...]
+  getAvailabilityGrid: async (from: string, to: string, slot: 15 | 30 | 60 = 30, facilityIds?: number[]) => {
+    return axios.get(`${API_BASE_URL}/facilities/availability`, {
+      params: { from, to, slot, facility_id: facilityIds },
+      paramsSerializer: { indexes: null }
+    });
+  },
+
   getFacilityList: async () => {
     return axios.get(`${API_BASE_URL}/facilities`);
   },
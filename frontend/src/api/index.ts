@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { ApiResponse } from '../types';
+import { ApiResponse, AttendancePage } from '../types';
 import { facilityApi } from './facility';
 
 const api = axios.create({
@@ -20,10 +20,10 @@ api.interceptors.request.use((config) => {
 
 // 근태 관련 API
 export const attendanceApi = {
-  getList: () => api.get<ApiResponse<any[]>>('/attendances'),
+  getList: (params?: any) => api.get<AttendancePage>('/attendances/', { params }),
   approve: (id: number) => api.put<ApiResponse<any>>(`/attendances/${id}/approve`),
   update: (id: number, data: any) => api.put<ApiResponse<any>>(`/attendances/${id}`, data),
-  getStats: () => api.get<ApiResponse<any>>('/attendances/stats'),
+  getStats: (params?: any) => api.get<any>('/attendances/stats', { params }),
   getStatsDetail: (filters: any) => api.get<ApiResponse<any>>('/attendances/stats/detail', { params: filters }),
 };
 
@@ -32,12 +32,19 @@ export const reservationApi = {
   create: (data: any) => api.post<ApiResponse<any>>('/reservations', data),
   getList: () => api.get<ApiResponse<any[]>>('/reservations'),
   approve: (id: number) => api.put<ApiResponse<any>>(`/reservations/${id}/approve`),
-  cancel: (id: number) => api.put<ApiResponse<any>>(`/reservations/${id}/cancel`),
+  update: (id: number, data: any, scope: 'this' | 'following' = 'this') =>
+    api.put<ApiResponse<any[]>>(`/reservations/${id}`, data, { params: { scope } }),
+  cancel: (id: number, scope: 'this' | 'following' = 'this') =>
+    api.put<ApiResponse<any>>(`/reservations/${id}/cancel`, null, { params: { scope } }),
+  getAvailability: (facilityId: number, date: string) =>
+    api.get<any>('/reservations/availability', { params: { facility_id: facilityId, date } }),
 };
 
 // 일정 관련 API
 export const scheduleApi = {
   create: (data: any) => api.post<ApiResponse<any>>('/schedules', data),
+  // 사내/부서/개인 일정을 합쳐 [from, to) 기간의 발생 목록 (반복 일정은 발생마다 한 항목)
+  getRange: (from: string, to: string) => api.get<any>('/schedules', { params: { from, to } }),
   getShared: () => api.get<ApiResponse<any[]>>('/schedules/shared'),
 };
 
@@ -64,16 +71,35 @@ export const assetApi = {
 
 // 결재 관련 API
 export const approvalApi = {
+  create: (data: { type: string; content: string; amount?: number; lines?: { approver_id: number; order: number }[] }) =>
+    api.post<any>('/approvals/', data),
   addLine: (approvalId: number, data: any) => 
     api.post<ApiResponse<any>>(`/approvals/${approvalId}/lines`, data),
-  approveLine: (lineId: number) => 
-    api.put<ApiResponse<any>>(`/approvals/lines/${lineId}/approve`),
+  approveLine: (lineId: number, comment?: string) => 
+    api.put<ApiResponse<any>>(`/approvals/lines/${lineId}/approve`, { comment }),
+  rejectLine: (lineId: number, comment?: string) =>
+    api.put<ApiResponse<any>>(`/approvals/lines/${lineId}/reject`, { comment }),
   getHistory: (userId: number) =>
     api.get<ApiResponse<any[]>>(`/approvals/history/${userId}`),
   getHistoryDetail: (approvalId: number) =>
     api.get<ApiResponse<any>>(`/approvals/history/detail/${approvalId}`),
   getLines: (approvalId: number) =>
     api.get<ApiResponse<any[]>>(`/approvals/${approvalId}/lines`),
+  getInbox: (cursor?: string) =>
+    api.get<{ items: any[]; next_cursor: string | null }>('/approvals/inbox', { params: { cursor } }),
+  getInboxCount: () =>
+    api.get<{ count: number }>('/approvals/inbox/count'),
+};
+
+// 실시간 알림 (SSE) — resync 를 받으면 알림 목록을 다시 읽는다
+export const openNotificationStream = (onNotification: (notification: any) => void, onResync?: () => void) => {
+  const token = localStorage.getItem('token') || '';
+  const source = new EventSource(`${api.defaults.baseURL}/notifications/stream?token=${encodeURIComponent(token)}`);
+  source.addEventListener('notification', (event) => onNotification(JSON.parse((event as MessageEvent).data)));
+  if (onResync) {
+    source.addEventListener('resync', onResync);
+  }
+  return source;
 };
 
 export const adminApi = {
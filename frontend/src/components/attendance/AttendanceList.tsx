@@ -69,7 +69,7 @@ export const AttendanceList: React.FC = () => {
   const fetchAttendances = async () => {
     try {
       const response = await attendanceApi.getList();
-      setAttendances(response.data.data);
+      setAttendances(response.data.items);
     } catch (error) {
       setSnackbar({ open: true, message: '근태 목록을 불러오는데 실패했습니다.' });
     }
@@ -98,12 +98,23 @@ export const AttendanceList: React.FC = () => {
   const handleUpdate = async () => {
     if (!selectedAttendance) return;
     try {
-      await attendanceApi.update(selectedAttendance.id, selectedAttendance);
+      // 조회 시 받은 version 을 함께 보내 다른 관리자의 수정과 충돌하면 409
+      await attendanceApi.update(selectedAttendance.id, {
+        version: selectedAttendance.version,
+        status: selectedAttendance.status,
+      });
       setSnackbar({ open: true, message: '근태가 수정되었습니다.' });
       handleCloseDialog();
       fetchAttendances();
-    } catch (error) {
-      setSnackbar({ open: true, message: '근태 수정에 실패했습니다.' });
+    } catch (error: any) {
+      const conflict = error?.response?.status === 409;
+      setSnackbar({
+        open: true,
+        message: conflict ? '다른 사용자가 먼저 수정했습니다. 새로고침 후 다시 시도해주세요.' : '근태 수정에 실패했습니다.',
+      });
+      if (conflict) {
+        fetchAttendances();
+      }
     }
   };
 
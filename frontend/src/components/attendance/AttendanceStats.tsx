@@ -8,19 +8,42 @@ interface StatData {
   month: string;
   출근: number;
   지각: number;
-  결근: number;
   조퇴: number;
 }
 
+interface StatTotals {
+  days_present: number;
+  late_count: number;
+  early_leave_count: number;
+  overtime_hours: number;
+  worked_hours: number;
+}
+
 export const AttendanceStats: React.FC = () => {
   const [data, setData] = useState<StatData[]>([]);
-  const [summary, setSummary] = useState({ total: 0, late: 0, absent: 0, early: 0 });
+  const [summary, setSummary] = useState({ total: 0, late: 0, early: 0, overtime: 0 });
 
   const fetchStats = async () => {
-    // 실제 API에서 월별 통계 데이터 받아오기
-    const response = await attendanceApi.getStats();
-    setData(response.data.data.monthly);
-    setSummary(response.data.data.summary);
+    // 최근 6개월 월별 롤업 통계
+    const now = new Date();
+    const from = new Date(now.getFullYear(), now.getMonth() - 5, 1);
+    const toMonth = (d: Date) => `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`;
+    const response = await attendanceApi.getStats({ month_from: toMonth(from), month_to: toMonth(now) });
+    setData(
+      response.data.monthly.map((row: StatTotals & { month: string }) => ({
+        month: row.month,
+        출근: row.days_present,
+        지각: row.late_count,
+        조퇴: row.early_leave_count,
+      }))
+    );
+    const totals: StatTotals = response.data.summary;
+    setSummary({
+      total: totals.days_present,
+      late: totals.late_count,
+      early: totals.early_leave_count,
+      overtime: totals.overtime_hours,
+    });
   };
 
   useEffect(() => {
@@ -39,7 +62,6 @@ export const AttendanceStats: React.FC = () => {
             <Legend />
             <Bar dataKey="출근" fill="#1976d2" />
             <Bar dataKey="지각" fill="#ff9800" />
-            <Bar dataKey="결근" fill="#e53935" />
             <Bar dataKey="조퇴" fill="#43a047" />
           </BarChart>
         </ResponsiveContainer>
@@ -47,8 +69,8 @@ export const AttendanceStats: React.FC = () => {
       <Paper sx={{ p: 2 }}>
         <Typography>총 출근: {summary.total}회</Typography>
         <Typography>지각: {summary.late}회</Typography>
-        <Typography>결근: {summary.absent}회</Typography>
         <Typography>조퇴: {summary.early}회</Typography>
+        <Typography>연장근무: {summary.overtime}시간</Typography>
       </Paper>
     </Box>
   );
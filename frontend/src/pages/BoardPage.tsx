@@ -20,34 +20,43 @@ import { useNavigate } from 'react-router-dom';
 interface Post {
   id: number;
   title: string;
-  content: string;
   is_notice: boolean;
   created_at: string;
   author_name: string;
+  comment_count: number;
+}
+
+interface PostPage {
+  items: Post[];
+  next_cursor: string | null;
 }
 
 const BOARD_ID = 1; // seed 기준 사내 게시판 id
 
 const BoardPage: React.FC = () => {
   const [posts, setPosts] = useState<Post[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const navigate = useNavigate();
 
+  const fetchPosts = async (cursor?: string) => {
+    try {
+      const token = localStorage.getItem('token');
+      const response = await axios.get<PostPage>('http://localhost:8000/posts/', {
+        headers: { Authorization: `Bearer ${token}` },
+        params: { board_id: BOARD_ID, cursor },
+      });
+      setPosts((prev) => (cursor ? [...prev, ...response.data.items] : response.data.items));
+      setNextCursor(response.data.next_cursor);
+    } catch (err) {
+      setError('게시글을 불러오지 못했습니다.');
+    } finally {
+      setLoading(false);
+    }
+  };
+
   useEffect(() => {
-    const fetchPosts = async () => {
-      try {
-        const token = localStorage.getItem('token');
-        const response = await axios.get(`http://localhost:8000/posts/?board_id=${BOARD_ID}`, {
-          headers: { Authorization: `Bearer ${token}` },
-        });
-        setPosts(response.data);
-      } catch (err) {
-        setError('게시글을 불러오지 못했습니다.');
-      } finally {
-        setLoading(false);
-      }
-    };
     fetchPosts();
   }, []);
 
@@ -98,7 +107,10 @@ const BoardPage: React.FC = () => {
                         <Chip label="💬 커뮤니티" color="primary" size="small" />
                       )}
                     </TableCell>
-                    <TableCell>{post.title}</TableCell>
+                    <TableCell>
+                      {post.title}
+                      {post.comment_count > 0 && ` [${post.comment_count}]`}
+                    </TableCell>
                     <TableCell>{post.author_name}</TableCell>
                     <TableCell>{new Date(post.created_at).toLocaleDateString()}</TableCell>
                   </TableRow>
@@ -106,6 +118,11 @@ const BoardPage: React.FC = () => {
               </TableBody>
             </Table>
           </TableContainer>
+          {nextCursor && (
+            <Box sx={{ display: 'flex', justifyContent: 'center', p: 2 }}>
+              <Button onClick={() => fetchPosts(nextCursor)}>더 보기</Button>
+            </Box>
+          )}
         </Paper>
       )}
     </Container>
@@ -12,6 +12,7 @@ import {
   TableHead,
   TableRow,
   CircularProgress,
+  Button,
 } from '@mui/material';
 import { useNavigate } from 'react-router-dom';
 
@@ -25,26 +26,40 @@ interface Employee {
   phone_number?: string;
 }
 
+interface EmployeePage {
+  items: Employee[];
+  next_cursor: string | null;
+  total: number | null;
+}
+
 const EmployeeListPage: React.FC = () => {
   const [employees, setEmployees] = useState<Employee[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [total, setTotal] = useState<number | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const navigate = useNavigate();
 
-  useEffect(() => {
-    const fetchEmployees = async () => {
-      try {
-        const token = localStorage.getItem('token');
-        const response = await axios.get('http://localhost:8000/users/', {
-          headers: { Authorization: `Bearer ${token}` },
-        });
-        setEmployees(response.data);
-      } catch (err) {
-        setError('직원 목록을 불러오지 못했습니다.');
-      } finally {
-        setLoading(false);
+  const fetchEmployees = async (cursor?: string) => {
+    try {
+      const token = localStorage.getItem('token');
+      const response = await axios.get<EmployeePage>('http://localhost:8000/users/', {
+        headers: { Authorization: `Bearer ${token}` },
+        params: { include: 'department,position', cursor, with_total: !cursor },
+      });
+      setEmployees((prev) => (cursor ? [...prev, ...response.data.items] : response.data.items));
+      setNextCursor(response.data.next_cursor);
+      if (!cursor) {
+        setTotal(response.data.total);
       }
-    };
+    } catch (err) {
+      setError('직원 목록을 불러오지 못했습니다.');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  useEffect(() => {
     fetchEmployees();
   }, []);
 
@@ -69,7 +84,7 @@ const EmployeeListPage: React.FC = () => {
   return (
     <Container maxWidth="lg" sx={{ mt: 4 }}>
       <Typography variant="h4" gutterBottom>
-        직원 목록
+        직원 목록{total !== null && ` (${total}명)`}
       </Typography>
       <Paper sx={{ width: '100%', overflow: 'auto' }}>
         <TableContainer>
@@ -103,6 +118,11 @@ const EmployeeListPage: React.FC = () => {
             </TableBody>
           </Table>
         </TableContainer>
+        {nextCursor && (
+          <Box sx={{ display: 'flex', justifyContent: 'center', p: 2 }}>
+            <Button onClick={() => fetchEmployees(nextCursor)}>더 보기</Button>
+          </Box>
+        )}
       </Paper>
     </Container>
   );
@@ -20,6 +20,12 @@ export interface Attendance {
   approved: boolean;
   approver_id?: number;
   approved_at?: string;
+  version: number;
+}
+
+export interface AttendancePage {
+  items: Attendance[];
+  next_cursor: string | null;
 }
 
 // 예약 관련 타입
@@ -43,7 +49,8 @@ export interface Schedule {
   end_time: string;
   type: string;
   owner_id: number;
-  shared_with: string;
+  shared_user_ids?: number[];
+  shared_department_ids?: number[];
   is_repeat: boolean;
   repeat_rule?: string;
 }